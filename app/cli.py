@@ -0,0 +1,224 @@
+# app/cli.py
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEARCH_ENDPOINTS = {
+    'yt': 'search/yt',
+    'spotify': 'search/spotify',
+    'pinterest': 'search/pinterest',
+    'wallpaper': 'search/wallpaper-moe',
+    'gimage': 'search/gimage',
+    'bilibili': 'search/bilibili',
+    'lyrics': 'search/lyrics',
+    'mahasiswa': 'search/mahasiswa',
+}
+
+TOOL_ENDPOINTS = {
+    'check-hosting': ('tool/check-hosting', ['domain']),
+    'iplocation': ('tool/iplocation', ['ip']),
+    'cek-pln': ('tool/cek-pln', ['id']),
+    'bapenda': ('tool/cek-pajak/bapenda', ['plat']),
+    'cek-resi': ('tool/cek-resi', ['resi', 'ekspedisi']),
+}
+
+AI_CHAT_ENDPOINTS = {
+    'gemini': 'gemini',
+    'chatgpt': 'chatgpt',
+    'chatgpt-v2': 'chatgpt_v2',
+    'deepseek': 'deepseek',
+    'mistral': 'mistral',
+}
+
+def _emit(payload: dict) -> int:
+    json.dump(payload, sys.stdout, ensure_ascii=False)
+    sys.stdout.write('\n')
+    return 0 if payload.get('ok') else 1
+
+def _cmd_dl(args) -> dict:
+    from core.api import get_base_url
+    from core.resolvers import RESOLVERS
+    from menu.downloader.functions.batch_downloader import read_url_list, run_batch
+
+    targets = list(args.targets)
+    platform = None
+    if targets and targets[0] in RESOLVERS:
+        platform = targets.pop(0)
+    if args.input:
+        targets += read_url_list(args.input)
+    if not targets:
+        raise ValueError("Tidak ada URL untuk diunduh.")
+
+    get_base_url()
+    output_dir = os.path.abspath(args.output or os.path.join(PROJECT_ROOT, 'downloads'))
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = run_batch(targets, output_dir, workers=args.workers, quality=args.quality, show_progress=False, platform=platform)
+    results = [
+        {'url': job['url'], 'platform': job['platform'], 'status': 'ok' if job['status'] == 'Selesai' else 'error', 'files': job['files'], 'error': job['error']}
+        for job in jobs
+    ]
+    return {'ok': all(result['status'] == 'ok' for result in results), 'results': results}
+
+def _cmd_search(args) -> dict:
+    from core.api import api_get
+    from core.cache import set_cache_mode
+
+    if args.no_cache:
+        set_cache_mode('off')
+    elif args.refresh:
+        set_cache_mode('refresh')
+
+    return {'ok': True, 'result': api_get(SEARCH_ENDPOINTS[args.provider], {'query': ' '.join(args.query)})}
+
+def _cmd_tool(args) -> dict:
+    from core.api import api_get
+
+    endpoint, param_names = TOOL_ENDPOINTS[args.tool]
+    if len(args.values) != len(param_names):
+        raise ValueError(f"Tool '{args.tool}' membutuhkan argumen: {' '.join(param_names)}")
+    return {'ok': True, 'result': api_get(endpoint, dict(zip(param_names, args.values)))}
+
+def _ai_call(chat, args) -> tuple:
+    if args.image:
+        return (chat, ' '.join(args.text), args.session, args.image)
+    return (chat, ' '.join(args.text), args.session)
+
+def _cmd_ai(args) -> dict:
+    from core.api import ai
+
+    models = [model.strip() for model in args.model.split(',') if model.strip()]
+    unknown = [model for model in models if model not in AI_CHAT_ENDPOINTS]
+    if not models or unknown:
+        raise ValueError(f"Model tidak dikenal: {', '.join(unknown) or '-'}. Pilihan: {', '.join(sorted(AI_CHAT_ENDPOINTS))}")
+    if args.image:
+        no_image = [model for model in models if model not in ('gemini', 'chatgpt-v2')]
+        if no_image:
+            raise ValueError(f"Model '{no_image[0]}' tidak mendukung lampiran gambar.")
+
+    calls = [_ai_call(getattr(ai, AI_CHAT_ENDPOINTS[model]), args) for model in models]
+    if len(calls) == 1:
+        chat, *call_args = calls[0]
+        return {'ok': True, 'result': chat(*call_args)}
+
+    # Beberapa model ditanya bersamaan lewat klien async, bukan satu per satu.
+    from core.api.aio import run_calls
+
+    results = {}
+    for model, outcome in zip(models, run_calls(calls)):
+        if isinstance(outcome, Exception):
+            results[model] = {'ok': False, 'error': str(outcome)}
+        else:
+            results[model] = {'ok': True, 'result': outcome}
+    return {'ok': all(result['ok'] for result in results.values()), 'results': results}
+
+def _parse_date(value: str) -> float:
+    from datetime import datetime
+
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tanggal '{value}' tidak valid, gunakan format YYYY-MM-DD[THH:MM].")
+
+def _cmd_history(args) -> dict:
+    from core.history import import_json_logs, query_history
+
+    if args.import_logs:
+        imported, skipped = import_json_logs(remove=args.remove_logs)
+        return {'ok': True, 'imported': imported, 'skipped': skipped}
+
+    entries = query_history(
+        platform=args.platform,
+        source_url=args.url,
+        output_path=args.path,
+        since=args.since,
+        until=args.until,
+        kind=args.kind,
+        limit=args.limit,
+    )
+    return {'ok': True, 'count': len(entries), 'entries': entries}
+
+def _cmd_store(args) -> dict:
+    from core.store import STORE_DIR, STORE_ENABLED, DownloadStore
+
+    if not os.path.isdir(STORE_DIR):
+        return {'ok': True, 'enabled': STORE_ENABLED, 'objects': 0, 'size': 0}
+    store = DownloadStore()
+    if args.clear or args.prune:
+        max_bytes = 0 if args.clear else (args.max_size * 1024 * 1024 if args.max_size is not None else None)
+        removed, freed = store.prune(max_bytes)
+        return {'ok': True, 'removed': removed, 'freed': freed, **store.stats()}
+    return {'ok': True, 'enabled': STORE_ENABLED, **store.stats()}
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='main.py', description="ZeroTools tanpa menu interaktif. Hasil dicetak sebagai JSON di stdout.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    dl = commands.add_parser('dl', help="Unduh media: dl [platform] URL... (platform dideteksi otomatis jika tidak diisi)")
+    dl.add_argument('targets', nargs='*', help="platform opsional diikuti satu atau lebih URL")
+    dl.add_argument('-i', '--input', help="file berisi daftar URL, atau '-' untuk stdin")
+    dl.add_argument('-o', '--output', help="folder tujuan (default: downloads/)")
+    dl.add_argument('--quality', default='720', help="kualitas video YouTube (default: 720)")
+    dl.add_argument('--workers', type=int, default=4, help="jumlah unduhan paralel (default: 4)")
+    dl.set_defaults(handler=_cmd_dl)
+
+    search = commands.add_parser('search', help="Cari konten: search PROVIDER QUERY")
+    search.add_argument('provider', choices=sorted(SEARCH_ENDPOINTS))
+    search.add_argument('query', nargs='+')
+    cache_mode = search.add_mutually_exclusive_group()
+    cache_mode.add_argument('--no-cache', action='store_true', help="jangan baca atau simpan cache respons")
+    cache_mode.add_argument('--refresh', action='store_true', help="abaikan cache lama dan simpan hasil terbaru")
+    search.set_defaults(handler=_cmd_search)
+
+    tool = commands.add_parser('tool', help="Jalankan utilitas: tool NAMA ARG...")
+    tool.add_argument('tool', choices=sorted(TOOL_ENDPOINTS))
+    tool.add_argument('values', nargs='+')
+    tool.set_defaults(handler=_cmd_tool)
+
+    ai = commands.add_parser('ai', help="Kirim satu pesan ke model AI: ai MODEL[,MODEL...] TEKS")
+    ai.add_argument('model', help=f"salah satu dari {', '.join(sorted(AI_CHAT_ENDPOINTS))}; pisahkan dengan koma untuk bertanya ke beberapa model sekaligus")
+    ai.add_argument('text', nargs='+')
+    ai.add_argument('--session', help="ID sesi untuk melanjutkan percakapan")
+    ai.add_argument('--image', help="URL gambar yang dilampirkan")
+    ai.set_defaults(handler=_cmd_ai)
+
+    history = commands.add_parser('history', help="Cari riwayat unduhan/unggahan (terbaru dulu)")
+    history.add_argument('--platform', help="mis. tiktok, instagram, youtube_mp4, imgbb")
+    history.add_argument('--url', help="URL sumber; gunakan %% sebagai wildcard")
+    history.add_argument('--path', help="path file/folder hasil; gunakan %% sebagai wildcard")
+    history.add_argument('--since', type=_parse_date, help="sejak tanggal (YYYY-MM-DD)")
+    history.add_argument('--until', type=_parse_date, help="sebelum tanggal (YYYY-MM-DD)")
+    history.add_argument('--kind', choices=['download', 'upload'])
+    history.add_argument('--limit', type=int, default=50, help="jumlah entri maksimal (default: 50)")
+    history.add_argument('--import-logs', action='store_true', help="impor file *_log_*.json lama dari output/ sekali saja")
+    history.add_argument('--remove-logs', action='store_true', help="hapus file log lama setelah berhasil diimpor")
+    history.set_defaults(handler=_cmd_history)
+
+    store = commands.add_parser('store', help="Lihat atau bersihkan store unduhan (.cache/store)")
+    store_action = store.add_mutually_exclusive_group()
+    store_action.add_argument('--prune', action='store_true', help="hapus objek yang paling lama tidak dipakai sampai di bawah batas ukuran")
+    store_action.add_argument('--clear', action='store_true', help="kosongkan store")
+    store.add_argument('--max-size', type=int, help="batas ukuran dalam MB untuk --prune (default: ZEROTOOLS_STORE_MAX_MB atau 1024)")
+    store.set_defaults(handler=_cmd_store)
+
+    return parser
+
+def run_cli(argv: list) -> int:
+    """Menjalankan perintah headless dan mengembalikan exit code (0 sukses, 1 gagal)."""
+    args = build_parser().parse_args(argv)
+
+    # stdout khusus untuk JSON; pesan Rich dari modul lain dialihkan ke stderr.
+    from app.console import console
+    from core.api import ApiError
+    console.file = sys.stderr
+
+    try:
+        return _emit(args.handler(args))
+    except (requests.exceptions.RequestException, ApiError, ValueError, OSError, sqlite3.Error) as e:
+        return _emit({'ok': False, 'error': str(e)})
@@ -8,6 +8,7 @@ from rich.table import Table
 from rich.align import Align
 import time
 import os
+from contextlib import contextmanager
 
 console = Console()
 
@@ -29,11 +30,151 @@ def cyber_input(prompt: str) -> str:
     """Mendapatkan input dari user dengan gaya konsisten dan menghapus spasi."""
     return console.input(f"[bold pale_turquoise1]>> {prompt}[/bold pale_turquoise1]: ").strip()
 
-def loading_animation(task_name: str, duration: int = 2):
-    """Menampilkan animasi loading untuk sebuah tugas."""
-    with Live(Spinner("dots12", text=f"[bold yellow]Processing {task_name}...[/bold yellow]"), refresh_per_second=10) as live:
-        time.sleep(duration)
-    console.print(f"[bold green]✓[/bold green] [bold white]{task_name} completed.[/bold white]")
+@contextmanager
+def loading_animation(task_name: str):
+    """
+    Menampilkan progres request yang sedang berjalan tanpa menundanya.
+
+    Dipakai sebagai `with loading_animation("...") as progress:` lalu `progress`
+    diteruskan ke endpoint (mis. ai_api.waifu2x(url, progress=progress)). Sebelum
+    respons tiba ditampilkan lama menunggu; setelahnya byte diterima, kecepatan dan ETA.
+    """
+    from core.download import format_bytes
+
+    started = time.monotonic()
+    state = {'received': None, 'total': None, 'speed': 0.0}
+    spinner = Spinner("dots12")
+
+    def progress(received: int, total: int | None, speed: float):
+        state.update(received=received, total=total, speed=speed)
+
+    def render():
+        elapsed = time.monotonic() - started
+        if state['received'] is None:
+            detail = f"menunggu respons server • {elapsed:.0f}s"
+        else:
+            detail = format_bytes(state['received'])
+            if state['total']:
+                detail += f" / {format_bytes(state['total'])} ({state['received'] * 100 // state['total']}%)"
+            detail += f" • {format_bytes(state['speed'])}/s"
+            if state['total'] and state['speed'] > 0:
+                detail += f" • ETA {max(0, state['total'] - state['received']) / state['speed']:.0f}s"
+        spinner.update(text=f"[bold yellow]Processing {task_name}...[/bold yellow] [white]{detail}[/white]")
+        return spinner
+
+    with Live(console=console, refresh_per_second=10, transient=True, get_renderable=render):
+        yield progress
+    console.print(f"[bold green]✓[/bold green] [bold white]{task_name} completed[/bold white] [dim]({time.monotonic() - started:.1f}s)[/dim]")
+
+def status_progress(status, label: str):
+    """Membuat callback progres unduhan yang memperbarui teks console.status."""
+    from core.download import format_bytes
+
+    def update(downloaded: int, total: int | None, speed: float):
+        size_text = format_bytes(downloaded)
+        if total:
+            size_text += f" / {format_bytes(total)} ({downloaded * 100 // total}%)"
+        status.update(f"[bold green]{label}[/bold green] [white]{size_text} • {format_bytes(speed)}/s[/white]")
+
+    return update
+
+def build_items_table(title: str, states: list) -> Table:
+    """Tabel progres per item untuk unduhan paralel (lihat download_items_live)."""
+    from rich.markup import escape
+    from core.download import format_bytes
+
+    table = Table(show_header=True, header_style="bold #00F0FF", title=title, border_style="#00F0FF", expand=True)
+    table.add_column("No.", style="bold white", width=4, justify="center")
+    table.add_column("File", style="white", overflow="ellipsis", no_wrap=True)
+    table.add_column("Status", width=10)
+    table.add_column("Progres", style="white", width=26, overflow="ellipsis", no_wrap=True)
+
+    status_styles = {
+        'Selesai': 'bold green', 'Gagal': 'bold red', 'Mengunduh': 'bold yellow', 'Ulang': 'yellow',
+        'Mengunggah': 'bold yellow', 'Memproses': 'bold magenta', 'Menyimpan': 'bold cyan',
+    }
+    for i, state in enumerate(states):
+        if state['status'] == 'Gagal':
+            progress_text = f"[red]{escape(state.get('error') or '')}[/red]"
+        elif state.get('downloaded'):
+            progress_text = format_bytes(state['downloaded'])
+            if state.get('total'):
+                progress_text += f" ({state['downloaded'] * 100 // state['total']}%)"
+            if state.get('attempt', 1) > 1:
+                progress_text += f" • percobaan {state['attempt']}"
+        else:
+            progress_text = "-"
+        style = status_styles.get(state['status'], 'dim')
+        table.add_row(str(i + 1), escape(state['name']), f"[{style}]{state['status']}[/{style}]", progress_text)
+    return table
+
+def download_items_live(items: list, title: str, workers: int | None = None) -> list:
+    """Menjalankan core.download.download_many sambil menampilkan tabel progres per item."""
+    from core.download import MEDIA_WORKERS, download_many
+
+    states = [{'name': os.path.basename(item['output_path']), 'status': 'Menunggu'} for item in items]
+
+    def update(index, **state):
+        states[index].update(state)
+
+    with Live(console=console, refresh_per_second=4, get_renderable=lambda: build_items_table(title, states)):
+        return download_many(items, workers=workers or MEDIA_WORKERS, progress=update)
+
+def image_batch_live(paths: list, process, output_dir: str, prefix: str, title: str, preprocess: str | None = None) -> list:
+    """Menjalankan core.image_pipeline.run_image_pipeline sambil menampilkan tabel status per gambar."""
+    from core.image_pipeline import run_image_pipeline
+
+    states = [{'name': os.path.basename(path), 'status': 'Menunggu'} for path in paths]
+
+    def update(index, **state):
+        states[index].update(state)
+
+    with Live(console=console, refresh_per_second=4, get_renderable=lambda: build_items_table(title, states)):
+        return run_image_pipeline(paths, process, output_dir, prefix, progress=update, preprocess=preprocess)
+
+def upload_images_live(paths: list, expiration: str, workers: int, preprocess: str | None = None) -> list:
+    """Menjalankan core.imgbb.upload_many sambil menampilkan tabel status per gambar."""
+    from core.imgbb import upload_many
+
+    states = [{'name': os.path.basename(path), 'status': 'Menunggu'} for path in paths]
+
+    def update(index, **state):
+        states[index].update(state)
+
+    with Live(console=console, refresh_per_second=4, get_renderable=lambda: build_items_table("Unggah ke ImgBB", states)):
+        return upload_many(paths, expiration, workers=workers, progress=update, preprocess=preprocess)
+
+def stream_chat_reply(events, title: str, reply_key: str, thinking: str) -> tuple[str, dict]:
+    """
+    Menampilkan jawaban AI di panel Rich Live selagi teks dari core.api.ai.chat_stream datang.
+
+    Mengembalikan (jawaban, data akhir dari backend). Jawaban kosong bila backend tidak
+    mengirim teks atau menandai respons gagal (`success`/`status` bernilai false).
+    """
+    from rich.text import Text
+
+    chunks, data = [], {}
+    finished = False
+
+    def render():
+        body = ''.join(chunks) or data.get(reply_key)
+        if not body:
+            return Text("") if finished else Spinner("dots", text=f"[bold green]{thinking}[/bold green]")
+        return Panel(Text(str(body)), title=f"[bold #00F0FF]{title}[/bold #00F0FF]", border_style="#00F0FF", padding=(0, 1))
+
+    with Live(console=console, refresh_per_second=12, vertical_overflow="visible", get_renderable=render):
+        try:
+            for event in events:
+                if event.text:
+                    chunks.append(event.text)
+                if event.data:
+                    data.update(event.data)
+        finally:
+            finished = True
+
+    if data.get('success') is False or data.get('status') is False:
+        return '', data
+    return data.get(reply_key) or ''.join(chunks), data
 
 def create_menu_table(title: str, options: list) -> Table:
     """Membuat Tabel Menu yang sudah di-style."""
@@ -0,0 +1,4 @@
+# core/api/__init__.py
+
+from .client import ApiError, StreamEvent, get_base_url, api_get, api_get_bytes, api_stream
+from . import ai, downloader, search, tools
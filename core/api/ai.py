@@ -0,0 +1,70 @@
+# core/api/ai.py
+
+import os
+from .client import StreamEvent, api_get, api_get_bytes, api_stream
+
+CHAT_ENDPOINTS = {
+    'gemini': 'ai/gemini',
+    'chatgpt': 'ai/chatgpt',
+    'chatgpt_v2': 'ai/v2/chatgpt',
+    'deepseek': 'ai/deepseek',
+    'mistral': 'ai/mistral',
+}
+STREAM_ENABLED = os.environ.get('ZEROTOOLS_AI_STREAM', '1') != '0'
+
+def _chat_params(text: str, session: str | None, image_url: str | None = None) -> dict:
+    params = {'text': text}
+    if session:
+        params['session'] = session
+    if image_url:
+        params['imageUrl'] = image_url
+    return params
+
+def gemini(text: str, session: str | None = None, image_url: str | None = None) -> dict:
+    return api_get('ai/gemini', _chat_params(text, session, image_url))
+
+def chatgpt(text: str, session: str | None = None) -> dict:
+    return api_get('ai/chatgpt', _chat_params(text, session))
+
+def chatgpt_v2(text: str, session: str | None = None, image_url: str | None = None) -> dict:
+    return api_get('ai/v2/chatgpt', _chat_params(text, session, image_url))
+
+def deepseek(text: str, session: str | None = None) -> dict:
+    return api_get('ai/deepseek', _chat_params(text, session))
+
+def mistral(text: str, session: str | None = None) -> dict:
+    return api_get('ai/mistral', _chat_params(text, session))
+
+def chat_stream(model: str, text: str, session: str | None = None, image_url: str | None = None):
+    """
+    Versi streaming dari endpoint chat `model` (kunci CHAT_ENDPOINTS); menghasilkan StreamEvent.
+
+    Dengan ZEROTOOLS_AI_STREAM=0 request dikirim seperti biasa dan seluruh jawaban
+    dikembalikan sebagai satu event.
+    """
+    params = _chat_params(text, session, image_url)
+    if not STREAM_ENABLED:
+        yield StreamEvent(data=api_get(CHAT_ENDPOINTS[model], params))
+        return
+    yield from api_stream(CHAT_ENDPOINTS[model], params)
+
+def to_anime(image_url: str, style: str = 'anime', progress=None) -> bytes:
+    return api_get_bytes('ai/toanime', {'url': image_url, 'style': style}, progress=progress)
+
+def penghitam_waifu(image_url: str, progress=None) -> bytes:
+    return api_get_bytes('ai/negro', {'url': image_url}, progress=progress)
+
+def colorize(image_url: str, progress=None) -> bytes:
+    return api_get_bytes('ai/colorize', {'url': image_url}, progress=progress)
+
+def waifu2x(image_url: str, progress=None) -> bytes:
+    return api_get_bytes('ai/waifu2x', {'url': image_url}, progress=progress)
+
+def text2img(prompt: str, width: int, height: int, progress=None) -> bytes:
+    return api_get_bytes('ai/text2img', {'prompt': prompt, 'width': width, 'height': height}, progress=progress)
+
+def text2img_v2(prompt: str, width: int, height: int, progress=None) -> bytes:
+    return api_get_bytes('ai/v2/text2img', {'prompt': prompt, 'width': width, 'height': height}, progress=progress)
+
+def flux_schnell(prompt: str, progress=None) -> bytes:
+    return api_get_bytes('ai/flux-schnell', {'prompt': prompt}, progress=progress)
@@ -0,0 +1,148 @@
+# core/api/aio.py
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from core import cache
+from core.http import CONNECT_TIMEOUT, READ_TIMEOUT, RETRY_BACKOFF, RETRY_STATUSES, RETRY_TOTAL
+from . import ai, downloader, search, tools
+from .client import PendingRequest, _deferred, _load_api_config
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+DEFAULT_CONCURRENCY = 32
+
+def describe(func, *args, **kwargs) -> PendingRequest:
+    """Menjalankan fungsi endpoint sinkron tanpa jaringan dan mengembalikan request yang akan dikirimnya."""
+    token = _deferred.set(True)
+    try:
+        pending = func(*args, **kwargs)
+    finally:
+        _deferred.reset(token)
+    if not isinstance(pending, PendingRequest):
+        raise TypeError(f"{func.__name__} bukan fungsi endpoint core.api.")
+    return pending
+
+def _query_params(params: dict | None) -> dict:
+    # aiohttp hanya menerima str/int/float; None dibuang seperti pada requests.
+    return {key: value if isinstance(value, (int, float)) else str(value) for key, value in (params or {}).items() if value is not None}
+
+class _AsyncEndpoints:
+    """Membungkus modul endpoint sinkron (mis. core.api.search) menjadi versi coroutine."""
+
+    def __init__(self, client, module):
+        self._client = client
+        self._module = module
+
+    def __getattr__(self, name):
+        func = getattr(self._module, name)
+
+        @functools.wraps(func)
+        async def call(*args, **kwargs):
+            return await self._client.call(func, *args, **kwargs)
+
+        return call
+
+class AsyncApiClient:
+    """
+    Klien asyncio untuk backend base_url dengan pool koneksi bersama dan batas konkurensi.
+
+    Endpoint-nya sama dengan modul sinkron: `await client.search.youtube(query)`,
+    `await client.ai.gemini(text)`, dst. Dengan aiohttp terpasang request dikirim secara
+    native; tanpa aiohttp setiap panggilan dijalankan di thread pool berukuran
+    `concurrency` di atas Session keep-alive dari core.http. Error jaringan selalu
+    dilempar sebagai requests.exceptions.RequestException seperti pada klien sinkron.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session = None
+        self._executor = None
+        self.ai = _AsyncEndpoints(self, ai)
+        self.downloader = _AsyncEndpoints(self, downloader)
+        self.search = _AsyncEndpoints(self, search)
+        self.tools = _AsyncEndpoints(self, tools)
+
+    async def __aenter__(self):
+        if aiohttp is not None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                timeout=aiohttp.ClientTimeout(sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='zerotools-api')
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def call(self, func, *args, **kwargs):
+        """Menjalankan fungsi endpoint dari core.api secara async di bawah batas konkurensi."""
+        async with self._semaphore:
+            if self._session is not None:
+                return await self._send(describe(func, *args, **kwargs))
+            if self._executor is None:
+                raise RuntimeError("AsyncApiClient harus dipakai dengan 'async with'.")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _send(self, pending: PendingRequest):
+        if pending.accept == 'application/json':
+            base_url = _load_api_config()['base_url']
+            cached = cache.lookup(base_url, pending.path, pending.params)
+            if cached is not None:
+                return cached
+            result = await self._fetch(pending)
+            cache.store(base_url, pending.path, pending.params, result)
+            return result
+        return await self._fetch(pending)
+
+    async def _fetch(self, pending: PendingRequest):
+        url = f"{_load_api_config()['base_url']}/api/{pending.path}"
+        params = _query_params(pending.params)
+
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                async with self._session.get(url, params=params, headers={'accept': pending.accept}) as response:
+                    if response.status in RETRY_STATUSES and attempt < RETRY_TOTAL:
+                        await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+                        continue
+                    response.raise_for_status()
+                    if pending.accept == 'application/json':
+                        return await response.json(content_type=None)
+                    return await response.read()
+            except asyncio.TimeoutError as e:
+                # Harus sebelum ClientError: aiohttp.ServerTimeoutError turunan keduanya.
+                raise requests.exceptions.Timeout(f"Timeout saat menghubungi {url}") from e
+            except aiohttp.ClientResponseError as e:
+                raise requests.exceptions.HTTPError(f"{e.status} Error: {e.message} for url: {e.request_info.real_url}") from e
+            except aiohttp.ClientConnectorError as e:
+                if attempt < RETRY_TOTAL:
+                    await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+                    continue
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            except aiohttp.ClientError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+
+async def gather_calls(calls: list, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """
+    Menjalankan banyak panggilan endpoint sekaligus; `calls` berisi (fungsi, args...).
+
+    Hasil dikembalikan sesuai urutan input; panggilan yang gagal menghasilkan objek exception.
+    """
+    async with AsyncApiClient(concurrency) as client:
+        return await asyncio.gather(*(client.call(func, *args) for func, *args in calls), return_exceptions=True)
+
+def run_calls(calls: list, concurrency: int = DEFAULT_CONCURRENCY) -> list:
+    """Versi sinkron dari gather_calls untuk dipakai dari kode non-async (CLI, menu)."""
+    return asyncio.run(gather_calls(calls, concurrency))
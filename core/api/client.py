@@ -0,0 +1,168 @@
+# core/api/client.py
+
+import codecs
+import contextvars
+import json
+import time
+from typing import NamedTuple
+import requests
+from core.config import ConfigError, get_config
+from core import cache
+from core.http import DEFAULT_TRANSPORT, get_session
+
+class ApiError(Exception):
+    """Dilempar bila klien tidak bisa menyusun request, mis. base_url tidak dikonfigurasi."""
+
+class PendingRequest(NamedTuple):
+    """Deskripsi request yang belum dikirim; dipakai klien async untuk meniru endpoint sinkron."""
+    path: str
+    params: dict | None
+    accept: str
+
+class StreamEvent(NamedTuple):
+    """Satu potongan dari api_stream: `text` berisi teks baru, `data` berisi objek JSON dari backend."""
+    text: str | None = None
+    data: dict | None = None
+
+# Kunci yang dianggap berisi potongan teks dalam event SSE berformat JSON.
+STREAM_TEXT_KEYS = ('delta', 'token', 'content', 'text')
+
+# Ukuran potongan saat membaca respons file dengan callback progres.
+PROGRESS_CHUNK_SIZE = 64 * 1024
+
+# Bila aktif, api_get/api_get_bytes hanya mengembalikan PendingRequest tanpa menyentuh jaringan.
+_deferred = contextvars.ContextVar('zerotools_deferred_request', default=False)
+
+def _load_api_config() -> dict:
+    try:
+        return get_config()
+    except ConfigError as e:
+        raise ApiError(str(e)) from e
+
+def get_base_url() -> str:
+    return _load_api_config()["base_url"]
+
+def _request(path: str, params: dict | None, accept: str, timeout, stream: bool = False) -> requests.Response:
+    config = _load_api_config()
+    session = get_session(config.get("http_transport", DEFAULT_TRANSPORT))
+    response = session.get(f"{config['base_url']}/api/{path}", params=params, headers={'accept': accept}, timeout=timeout, stream=stream)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
+
+def api_get(path: str, params: dict | None = None, timeout=None):
+    """GET `{base_url}/api/<path>` dan mengembalikan body JSON yang sudah di-parse."""
+    if _deferred.get():
+        return PendingRequest(path, params, 'application/json')
+
+    base_url = get_base_url()
+    cached = cache.lookup(base_url, path, params)
+    if cached is not None:
+        return cached
+    result = _request(path, params, 'application/json', timeout).json()
+    cache.store(base_url, path, params, result)
+    return result
+
+def api_get_bytes(path: str, params: dict | None = None, accept: str = 'image/png', timeout=None, progress=None) -> bytes:
+    """
+    GET `{base_url}/api/<path>` untuk endpoint yang mengembalikan file (mis. gambar PNG).
+
+    `progress`, jika diberikan, dipanggil sebagai progress(diterima, total, speed) setiap
+    potongan body tiba; `total` None bila server tidak mengirim Content-Length.
+    """
+    if _deferred.get():
+        return PendingRequest(path, params, accept)
+    if progress is None:
+        return _request(path, params, accept, timeout).content
+
+    with _request(path, params, accept, timeout, stream=True) as response:
+        length = response.headers.get('content-length')
+        # Content-Length dari body terkompresi tidak sama dengan jumlah byte yang dibaca.
+        total = int(length) if length and length.isdigit() and not response.headers.get('content-encoding') else None
+        progress(0, total, 0.0)
+        chunks = []
+        received = 0
+        started = time.monotonic()
+        for chunk in response.iter_content(chunk_size=PROGRESS_CHUNK_SIZE):
+            chunks.append(chunk)
+            received += len(chunk)
+            elapsed = time.monotonic() - started
+            progress(received, total, received / elapsed if elapsed > 0 else 0.0)
+    return b''.join(chunks)
+
+def _stream_event(payload: str) -> StreamEvent:
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return StreamEvent(text=payload)
+    if isinstance(data, dict):
+        for key in STREAM_TEXT_KEYS:
+            if isinstance(data.get(key), str):
+                rest = {k: v for k, v in data.items() if k != key}
+                return StreamEvent(text=data[key], data=rest or None)
+        return StreamEvent(data=data)
+    return StreamEvent(text=data if isinstance(data, str) else json.dumps(data))
+
+def _iter_text(response: requests.Response):
+    # chunk_size=None mengembalikan setiap chunk segera setelah tiba (tanpa menunggu buffer penuh).
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    for chunk in response.iter_content(chunk_size=None):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+def _iter_sse(response: requests.Response):
+    buffer, data_lines = '', []
+    for text in _iter_text(response):
+        buffer += text
+        *lines, buffer = buffer.split('\n')
+        for line in lines:
+            line = line.rstrip('\r')
+            if line.startswith('data:'):
+                data_lines.append(line[5:].removeprefix(' '))
+            elif not line and data_lines:
+                payload = '\n'.join(data_lines)
+                data_lines = []
+                if payload == '[DONE]':
+                    return
+                yield _stream_event(payload)
+    # Baris terakhir tanpa newline penutup masih tertinggal di buffer.
+    if buffer.startswith('data:'):
+        data_lines.append(buffer.rstrip('\r')[5:].removeprefix(' '))
+    if data_lines and '\n'.join(data_lines) != '[DONE]':
+        yield _stream_event('\n'.join(data_lines))
+
+def api_stream(path: str, params: dict | None = None, timeout=None):
+    """
+    GET `{base_url}/api/<path>` dengan `stream=true` dan menghasilkan StreamEvent saat data tiba.
+
+    Respons `text/event-stream` (SSE) diurai per event, respons teks biasa per chunk,
+    dan backend yang tetap mengirim JSON utuh menghasilkan satu event berisi `data`.
+    """
+    config = _load_api_config()
+    session = get_session(config.get("http_transport", DEFAULT_TRANSPORT))
+    response = session.get(
+        f"{config['base_url']}/api/{path}",
+        params={**(params or {}), 'stream': 'true'},
+        headers={'accept': 'text/event-stream, application/json'},
+        stream=True,
+        timeout=timeout,
+    )
+    with response:
+        response.raise_for_status()
+        content_type = response.headers.get('content-type', '')
+        if 'charset' not in content_type:
+            response.encoding = 'utf-8'
+        if 'text/event-stream' in content_type:
+            yield from _iter_sse(response)
+        elif 'json' in content_type:
+            yield StreamEvent(data=response.json())
+        else:
+            for text in _iter_text(response):
+                yield StreamEvent(text=text)
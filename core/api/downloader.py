@@ -0,0 +1,48 @@
+# core/api/downloader.py
+
+from .client import api_get
+
+def ttdl(url: str) -> dict:
+    return api_get('downloader/ttdl', {'url': url})
+
+def ttdl_v2(url: str) -> dict:
+    return api_get('downloader/v2/ttdl', {'url': url})
+
+def ytmp3(url: str) -> dict:
+    return api_get('downloader/ytmp3', {'url': url})
+
+def ytmp4(url: str, quality: str = '720') -> dict:
+    return api_get('downloader/ytmp4', {'url': url, 'quality': quality})
+
+def bilibili(url: str) -> dict:
+    return api_get('downloader/bilibili', {'url': url})
+
+def spotify(url: str) -> dict:
+    return api_get('downloader/spotify', {'url': url})
+
+def soundcloud(url: str) -> dict:
+    return api_get('downloader/soundcloud', {'url': url})
+
+def facebook(url: str) -> dict:
+    return api_get('downloader/fbdl', {'url': url})
+
+def threads(url: str) -> dict:
+    return api_get('downloader/threads', {'url': url})
+
+def instagram(url: str) -> dict:
+    return api_get('downloader/igdl', {'url': url})
+
+def twitter(url: str) -> dict:
+    return api_get('downloader/twitter', {'url': url})
+
+def mega(url: str) -> dict:
+    return api_get('downloader/mega', {'url': url})
+
+def mediafire(url: str) -> dict:
+    return api_get('downloader/mediafire', {'url': url})
+
+def krakenfiles(url: str) -> dict:
+    return api_get('downloader/kfiles', {'url': url})
+
+def gdrive(url: str) -> dict:
+    return api_get('downloader/gdrive', {'url': url})
@@ -0,0 +1,90 @@
+# core/api/paging.py
+
+def iter_pages(fetch, page_size: int):
+    """
+    Generator halaman hasil pencarian; `fetch(nomor_halaman, limit)` mengembalikan list item.
+
+    Halaman berikutnya baru diminta saat generator dilanjutkan. Jika backend mengabaikan
+    `page`/`limit` dan mengirim semua hasil sekaligus, respons itu dipotong secara lokal
+    tanpa request tambahan; halaman yang sama persis dengan sebelumnya menandakan akhir hasil.
+    """
+    previous = None
+    number = 1
+    while True:
+        items = list(fetch(number, page_size) or [])
+        if not items or items == previous:
+            return
+        if len(items) > page_size:
+            for start in range(0, len(items), page_size):
+                yield items[start:start + page_size]
+            return
+        yield items
+        if len(items) < page_size:
+            return
+        previous = items
+        number += 1
+
+class SearchPages:
+    """
+    Hasil pencarian yang dimuat per halaman sesuai navigasi pengguna.
+
+    `page(n)` hanya mengambil halaman yang belum dimuat sampai halaman ke-n; `items` berisi
+    semua item yang sudah dimuat (indeks globalnya sama dengan nomor yang ditampilkan).
+    """
+
+    def __init__(self, fetch, page_size: int = 5):
+        self.page_size = page_size
+        self.reported_total = None
+        self._pages = []
+        self._iterator = iter_pages(fetch, page_size)
+        self._exhausted = False
+
+    def _load_until(self, number: int):
+        while not self._exhausted and len(self._pages) < number:
+            page = next(self._iterator, None)
+            if page is None:
+                self._exhausted = True
+            else:
+                self._pages.append(page)
+                # Halaman yang tidak penuh pasti yang terakhir; tidak perlu request lagi untuk tahu.
+                self._exhausted = len(page) < self.page_size
+
+    def page(self, number: int) -> list:
+        self._load_until(number)
+        return self._pages[number - 1] if 0 < number <= len(self._pages) else []
+
+    def clamp(self, number: int) -> int:
+        """Nomor halaman terdekat yang benar-benar ada (mis. bila halaman terakhir ternyata kosong)."""
+        self._load_until(number)
+        return max(1, min(number, len(self._pages)))
+
+    def has_next(self, number: int) -> bool:
+        """True bila mungkin ada halaman setelah `number` (tanpa memuatnya)."""
+        if number < len(self._pages):
+            return True
+        return not self._exhausted and len(self.page(number)) == self.page_size
+
+    def load_all(self) -> list:
+        """Memuat semua halaman yang tersisa dan mengembalikan seluruh item."""
+        while not self._exhausted:
+            self._load_until(len(self._pages) + 1)
+        return self.items
+
+    @property
+    def items(self) -> list:
+        return [item for page in self._pages for item in page]
+
+    @property
+    def total(self) -> int | None:
+        """Jumlah hasil: pasti bila semua halaman sudah dimuat, selain itu angka dari backend (jika ada)."""
+        if self._exhausted:
+            return len(self.items)
+        return self.reported_total
+
+    @property
+    def total_pages(self) -> int | None:
+        if self._exhausted:
+            return len(self._pages)
+        if self.reported_total:
+            return max(len(self._pages), (self.reported_total + self.page_size - 1) // self.page_size)
+        return None
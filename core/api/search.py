@@ -0,0 +1,63 @@
+# core/api/search.py
+
+from .client import api_get
+from .paging import SearchPages
+
+def _page_params(query: str, page: int | None, limit: int | None) -> dict:
+    params = {'query': query}
+    if page is not None:
+        params['page'] = page
+    if limit is not None:
+        params['limit'] = limit
+    return params
+
+def youtube(query: str, page: int | None = None, limit: int | None = None) -> dict:
+    return api_get('search/yt', _page_params(query, page, limit))
+
+def spotify(query: str, page: int | None = None, limit: int | None = None) -> dict:
+    return api_get('search/spotify', _page_params(query, page, limit))
+
+def pinterest(query: str) -> list:
+    return api_get('search/pinterest', {'query': query})
+
+def wallpaper(query: str) -> dict:
+    return api_get('search/wallpaper-moe', {'query': query})
+
+def google_image(query: str) -> list:
+    return api_get('search/gimage', {'query': query})
+
+def bilibili(query: str) -> dict:
+    return api_get('search/bilibili', {'query': query})
+
+def lyrics(query: str) -> dict:
+    return api_get('search/lyrics', {'query': query})
+
+def mahasiswa(query: str) -> list:
+    return api_get('search/mahasiswa', {'query': query})
+
+def bmkg() -> dict:
+    return api_get('search/bmkg')
+
+def youtube_pages(query: str, page_size: int = 5) -> SearchPages:
+    """Hasil search/yt yang diminta per halaman (`page`/`limit`) saat dinavigasi."""
+    def fetch(page, limit):
+        result = youtube(query, page, limit) or {}
+        pages.reported_total = result.get('total') or pages.reported_total
+        return result.get('videos', [])
+
+    pages = SearchPages(fetch, page_size)
+    return pages
+
+def spotify_pages(query: str, category: str, page_size: int = 5, first_result: dict | None = None) -> SearchPages:
+    """
+    Seperti youtube_pages untuk satu kategori search/spotify ('tracks', 'albums', 'artists', 'playlists').
+
+    `first_result` adalah respons halaman 1 (dengan `limit=page_size`) yang sudah diambil pemanggil;
+    halaman itu dipakai ulang tanpa request kedua.
+    """
+    def fetch(page, limit):
+        if page == 1 and first_result is not None:
+            return first_result.get(category, [])
+        return (spotify(query, page, limit) or {}).get(category, [])
+
+    return SearchPages(fetch, page_size)
@@ -0,0 +1,18 @@
+# core/api/tools.py
+
+from .client import api_get
+
+def check_hosting(domain: str) -> dict:
+    return api_get('tool/check-hosting', {'domain': domain})
+
+def ip_location(ip: str) -> dict:
+    return api_get('tool/iplocation', {'ip': ip})
+
+def cek_pln(customer_id: str) -> dict:
+    return api_get('tool/cek-pln', {'id': customer_id})
+
+def bapenda(plat: str) -> dict:
+    return api_get('tool/cek-pajak/bapenda', {'plat': plat})
+
+def cek_resi(resi: str, ekspedisi: str) -> dict:
+    return api_get('tool/cek-resi', {'resi': resi, 'ekspedisi': ekspedisi})
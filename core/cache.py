@@ -0,0 +1,139 @@
+# core/cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get('ZEROTOOLS_CACHE_DIR') or os.path.join(PROJECT_ROOT, '.cache')
+CACHE_PATH = os.path.join(CACHE_DIR, 'responses.sqlite3')
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# TTL (detik) per endpoint; hanya endpoint yang terdaftar di sini yang di-cache.
+ENDPOINT_TTLS = {
+    'search/yt': 6 * 3600,
+    'search/spotify': 24 * 3600,
+    'search/pinterest': 3600,
+    'search/wallpaper-moe': 24 * 3600,
+    'search/gimage': 6 * 3600,
+    'search/bilibili': 6 * 3600,
+    'search/lyrics': 7 * 24 * 3600,
+    'search/mahasiswa': 7 * 24 * 3600,
+    'search/bmkg': 5 * 60,
+}
+
+# 'on' = baca & tulis cache, 'refresh' = abaikan isi cache tapi simpan hasil baru, 'off' = tanpa cache.
+CACHE_MODES = ('on', 'refresh', 'off')
+_mode = os.environ.get('ZEROTOOLS_CACHE', 'on')
+if _mode not in CACHE_MODES:
+    _mode = 'on'
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def set_cache_mode(mode: str):
+    global _mode
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Mode cache '{mode}' tidak dikenal. Pilihan: {', '.join(CACHE_MODES)}")
+    _mode = mode
+
+def get_cache_mode() -> str:
+    return _mode
+
+def cache_key(base_url: str, path: str, params: dict | None) -> str:
+    canonical = json.dumps([base_url, path, sorted((params or {}).items())], ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _is_cacheable(value) -> bool:
+    # Respons kosong atau yang menandakan gagal tidak disimpan agar error sementara tidak menempel.
+    if not value:
+        return False
+    if isinstance(value, dict) and (value.get('success') is False or value.get('status') is False):
+        return False
+    return True
+
+class ResponseCache:
+    """Cache respons JSON di SQLite dengan TTL per entri dan batas ukuran LRU."""
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, body TEXT NOT NULL, size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT body FROM responses WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, endpoint: str, value, ttl: float):
+        body = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now + ttl, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        # Hapus entri yang paling lama tidak diakses sampai ukuran kembali di bawah batas.
+        stale = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+def lookup(base_url: str, path: str, params: dict | None):
+    """Mengembalikan respons yang masih berlaku untuk base_url+endpoint+params, atau None."""
+    if path not in ENDPOINT_TTLS or _mode != 'on':
+        return None
+    try:
+        return get_response_cache().get(cache_key(base_url, path, params))
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+def store(base_url: str, path: str, params: dict | None, value):
+    if path not in ENDPOINT_TTLS or _mode == 'off' or not _is_cacheable(value):
+        return
+    try:
+        get_response_cache().set(cache_key(base_url, path, params), path, value, ENDPOINT_TTLS[path])
+    except (sqlite3.Error, OSError, TypeError, ValueError):
+        # Cache hanya optimasi; kegagalan menulis tidak boleh menggagalkan pencarian.
+        pass
@@ -0,0 +1,87 @@
+# core/config.py
+
+import json
+import os
+import threading
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+
+# nama kunci -> (tipe, wajib)
+CONFIG_SCHEMA = {
+    'base_url': (str, True),
+    'author': (str, False),
+    'github': (str, False),
+    'http_transport': (str, False),
+    'preprocess': (dict, False),
+}
+
+ENV_OVERRIDES = {
+    'ZEROTOOLS_BASE_URL': 'base_url',
+    'ZEROTOOLS_HTTP_TRANSPORT': 'http_transport',
+}
+
+class ConfigError(ValueError):
+    """Dilempar bila core/config.json tidak ada, bukan JSON valid, atau tidak sesuai skema."""
+
+_cached = (None, None)
+_cache_lock = threading.Lock()
+
+def validate_config(config) -> dict:
+    """Memeriksa tipe setiap kunci di CONFIG_SCHEMA dan menormalkan base_url."""
+    if not isinstance(config, dict):
+        raise ConfigError("Isi 'core/config.json' harus berupa objek JSON.")
+
+    for key, (expected, required) in CONFIG_SCHEMA.items():
+        if key not in config:
+            if required:
+                raise ConfigError(f"Kunci '{key}' wajib ada di 'core/config.json'.")
+            continue
+        if not isinstance(config[key], expected):
+            raise ConfigError(f"Kunci '{key}' di 'core/config.json' harus bertipe {expected.__name__}.")
+
+    base_url = config['base_url'].strip().rstrip('/')
+    if not base_url.startswith(('http://', 'https://')):
+        raise ConfigError(f"base_url '{config['base_url']}' harus diawali http:// atau https://.")
+    return {**config, 'base_url': base_url}
+
+def _read_config_file(path: str) -> dict:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise ConfigError("'core/config.json' not found.")
+    except json.JSONDecodeError:
+        raise ConfigError("'core/config.json' is not a valid JSON file.")
+
+def get_config(path: str = CONFIG_PATH) -> dict:
+    """
+    Mengembalikan konfigurasi yang sudah divalidasi, dibaca dari disk hanya bila berubah.
+
+    Cache dibandingkan dengan mtime/ukuran file dan variabel lingkungan di ENV_OVERRIDES,
+    jadi mengedit config.json atau mengekspor ZEROTOOLS_BASE_URL langsung berlaku tanpa
+    restart. Tanpa config.json, ZEROTOOLS_BASE_URL saja sudah cukup.
+    """
+    try:
+        stat = os.stat(path)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
+    env = tuple(os.environ.get(name) for name in ENV_OVERRIDES)
+    key = (path, file_key, env)
+
+    global _cached
+    cached_key, cached_config = _cached
+    if cached_key == key:
+        return dict(cached_config)
+
+    with _cache_lock:
+        if _cached[0] != key:
+            if file_key is None and not os.environ.get('ZEROTOOLS_BASE_URL'):
+                raise ConfigError("'core/config.json' not found.")
+            config = _read_config_file(path) if file_key is not None else {}
+            if isinstance(config, dict):
+                for name, value in zip(ENV_OVERRIDES, env):
+                    if value:
+                        config[ENV_OVERRIDES[name]] = value
+            _cached = (key, validate_config(config))
+        return dict(_cached[1])
@@ -0,0 +1,489 @@
+# core/download.py
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from core.store import get_download_store
+from core.prefetch import claim_prefetched_file
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    # Minta byte mentah agar ukuran chunk dan Content-Length sesuai dengan isi file.
+    'Accept-Encoding': 'identity',
+}
+
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+WRITE_QUEUE_SIZE = 16
+POOL_SIZE = 32
+PART_SUFFIX = '.part'
+JOURNAL_SUFFIX = '.json'
+JOURNAL_INTERVAL = 8 * 1024 * 1024
+DEFAULT_SEGMENTS = 4
+MAX_SEGMENTS = 8
+MIN_SEGMENT_SIZE = 4 * 1024 * 1024
+SEGMENT_RETRIES = 3
+MEDIA_WORKERS = 6
+MEDIA_RETRIES = 3
+MEDIA_RETRY_DELAY = 1.0
+
+_session = None
+_session_lock = threading.Lock()
+_position_lock = threading.Lock()
+
+def get_download_session() -> requests.Session:
+    """Mengembalikan Session bersama (keep-alive) untuk semua unduhan."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+class _WriteBehind:
+    """Menulis chunk ke disk di thread terpisah agar pembacaan jaringan tidak menunggu I/O."""
+
+    def __init__(self, file):
+        self._file = file
+        self._queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._error = None
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is None:
+                try:
+                    self._file.write(chunk)
+                    self.written += len(chunk)
+                except OSError as e:
+                    self._error = e
+
+    def write(self, chunk: bytes):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+def iter_adaptive_chunks(response: requests.Response):
+    """Membaca body respons dengan ukuran chunk yang menyesuaikan kecepatan jaringan."""
+    chunk_size = MIN_CHUNK_SIZE
+    while True:
+        started = time.monotonic()
+        # Samakan dengan iter_content: error urllib3 dibungkus jadi exception requests.
+        try:
+            chunk = response.raw.read(chunk_size, decode_content=True)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ConnectionError(e)
+        if not chunk:
+            break
+        yield chunk
+
+        elapsed = time.monotonic() - started
+        if elapsed < 0.05 and chunk_size < MAX_CHUNK_SIZE:
+            chunk_size *= 2
+        elif elapsed > 0.5 and chunk_size > MIN_CHUNK_SIZE:
+            chunk_size //= 2
+
+def _load_journal(journal_path: str) -> dict | None:
+    try:
+        with open(journal_path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def _save_journal(journal_path: str, journal: dict):
+    tmp_path = journal_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(journal, f)
+    os.replace(tmp_path, journal_path)
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _resume_offset(url: str, part_path: str, journal: dict | None, request_headers: dict) -> int:
+    """Menentukan posisi lanjutan dari file .part dan menambahkan header Range bila aman."""
+    if not journal or not os.path.exists(part_path):
+        return 0
+
+    offset = min(journal.get('committed', 0), os.path.getsize(part_path))
+    etag = journal.get('etag')
+    # ETag lemah tidak boleh dipakai untuk If-Range.
+    validator = etag if etag and not etag.startswith('W/') else journal.get('last_modified')
+
+    # Tanpa validator, lanjutkan hanya jika URL-nya sama persis.
+    if offset <= 0 or not (validator or journal.get('url') == url):
+        return 0
+
+    request_headers['Range'] = f'bytes={offset}-'
+    if validator:
+        request_headers['If-Range'] = validator
+    return offset
+
+def _content_range_start(response: requests.Response) -> int | None:
+    content_range = response.headers.get('Content-Range', '')
+    if not content_range.startswith('bytes '):
+        return None
+    start = content_range[6:].split('-', 1)[0]
+    return int(start) if start.isdigit() else None
+
+def _response_total(response: requests.Response) -> int | None:
+    if response.status_code == 206:
+        total = response.headers.get('Content-Range', '').rsplit('/', 1)[-1]
+    else:
+        total = response.headers.get('Content-Length')
+    return int(total) if total and total.isdigit() else None
+
+def _open_stream(session: requests.Session, url: str, request_headers: dict, offset: int, timeout: float):
+    """Membuka respons streaming; mengulang dari awal bila server menolak Range."""
+    response = session.get(url, headers=request_headers, stream=True, timeout=timeout)
+
+    if offset and (response.status_code == 416 or (response.status_code == 206 and _content_range_start(response) != offset)):
+        response.close()
+        request_headers.pop('Range', None)
+        request_headers.pop('If-Range', None)
+        response = session.get(url, headers=request_headers, stream=True, timeout=timeout)
+
+    response.raise_for_status()
+    if response.status_code != 206:
+        # Server mengirim file utuh (Range ditolak atau file berubah): mulai dari nol.
+        offset = 0
+    return response, offset
+
+def _download_stream(session: requests.Session, url: str, part_path: str, journal_path: str, headers: dict, resume: bool, progress, timeout: float) -> int:
+    """Mengunduh lewat satu koneksi ke file .part, melanjutkan dari jurnal bila bisa."""
+    request_headers = dict(headers)
+    journal = _load_journal(journal_path) if resume else None
+    offset = _resume_offset(url, part_path, journal, request_headers)
+
+    response, offset = _open_stream(session, url, request_headers, offset, timeout)
+    with response:
+        total = _response_total(response)
+        journal = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'total': total,
+            'committed': offset,
+        }
+
+        downloaded = offset
+        started = time.monotonic()
+        next_checkpoint = offset + JOURNAL_INTERVAL
+        with open(part_path, 'r+b' if offset else 'wb') as f:
+            if offset:
+                f.truncate(offset)
+                f.seek(offset)
+            writer = _WriteBehind(f)
+            try:
+                for chunk in iter_adaptive_chunks(response):
+                    writer.write(chunk)
+                    downloaded += len(chunk)
+                    if downloaded >= next_checkpoint:
+                        journal['committed'] = offset + writer.written
+                        _save_journal(journal_path, journal)
+                        next_checkpoint = downloaded + JOURNAL_INTERVAL
+                    if progress:
+                        elapsed = time.monotonic() - started
+                        progress(downloaded, total, (downloaded - offset) / elapsed if elapsed > 0 else 0.0)
+            finally:
+                try:
+                    writer.close()
+                finally:
+                    journal['committed'] = offset + writer.written
+                    _save_journal(journal_path, journal)
+
+    if total is not None and downloaded < total:
+        raise requests.exceptions.ChunkedEncodingError(f"Koneksi terputus pada {downloaded} dari {total} byte.")
+    return downloaded
+
+def _probe_ranges(session: requests.Session, url: str, headers: dict, timeout: float) -> dict | None:
+    """Mengecek dukungan Range dan ukuran file dengan meminta byte pertama saja."""
+    probe_headers = dict(headers)
+    probe_headers['Range'] = 'bytes=0-0'
+    with session.get(url, headers=probe_headers, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        total = _response_total(response)
+        if response.status_code != 206 or total is None:
+            return None
+        return {
+            'total': total,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+
+def _pwrite(fd: int, data: bytes, position: int):
+    """Menulis `data` di posisi tertentu tanpa memindahkan offset bersama file."""
+    view = memoryview(data)
+    while view:
+        if hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, view, position)
+        else:
+            # Windows tidak punya os.pwrite: seek + write harus atomik antar thread.
+            with _position_lock:
+                os.lseek(fd, position, os.SEEK_SET)
+                written = os.write(fd, view)
+        view = view[written:]
+        position += written
+
+def _fetch_segment(session: requests.Session, url: str, headers: dict, fd: int, segment: list, validator: str | None, timeout: float):
+    """Mengunduh satu segmen [start, end, done] dengan retry; `done` diperbarui selama berjalan."""
+    start, end = segment[0], segment[1]
+    last_error = None
+
+    for attempt in range(SEGMENT_RETRIES):
+        position = start + segment[2]
+        if position > end:
+            return
+
+        segment_headers = dict(headers)
+        segment_headers['Range'] = f'bytes={position}-{end}'
+        if validator:
+            segment_headers['If-Range'] = validator
+
+        try:
+            with session.get(url, headers=segment_headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                if response.status_code != 206 or _content_range_start(response) != position:
+                    raise requests.exceptions.HTTPError(f"Server tidak mengirim range {position}-{end} yang diminta.", response=response)
+
+                for chunk in iter_adaptive_chunks(response):
+                    chunk = chunk[:end + 1 - position]
+                    _pwrite(fd, chunk, position)
+                    position += len(chunk)
+                    segment[2] = position - start
+                    if position > end:
+                        return
+
+            raise requests.exceptions.ChunkedEncodingError(f"Segmen {start}-{end} terputus pada byte {position}.")
+        except requests.exceptions.RequestException as e:
+            last_error = e
+            if attempt < SEGMENT_RETRIES - 1:
+                time.sleep(2 ** attempt)
+
+    raise last_error
+
+def _plan_segments(total: int, segments: int) -> list:
+    segments = max(1, min(segments, MAX_SEGMENTS, total // MIN_SEGMENT_SIZE))
+    size = -(-total // segments)
+    return [[start, min(start + size, total) - 1, 0] for start in range(0, total, size)]
+
+def _download_segmented(session: requests.Session, url: str, part_path: str, journal_path: str, headers: dict, probe: dict, resume: bool, segments: int, progress, timeout: float) -> int:
+    """Mengunduh beberapa range sekaligus dan menulisnya langsung ke posisinya di file .part."""
+    total = probe['total']
+    journal = _load_journal(journal_path) if resume else None
+
+    resumable = (
+        journal is not None
+        and journal.get('segments')
+        and journal.get('total') == total
+        and journal.get('etag') == probe['etag']
+        and journal.get('last_modified') == probe['last_modified']
+        and (probe['etag'] or probe['last_modified'] or journal.get('url') == url)
+        and os.path.exists(part_path)
+        and os.path.getsize(part_path) == total
+    )
+    ranges = journal['segments'] if resumable else _plan_segments(total, segments)
+    journal = {
+        'url': url,
+        'etag': probe['etag'],
+        'last_modified': probe['last_modified'],
+        'total': total,
+        'segments': ranges,
+    }
+    etag = probe['etag']
+    validator = etag if etag and not etag.startswith('W/') else probe['last_modified']
+
+    fd = os.open(part_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        if not resumable:
+            # Alokasikan ukuran akhir di awal agar setiap segmen bisa ditulis di posisinya.
+            os.ftruncate(fd, total)
+        _save_journal(journal_path, journal)
+
+        pending = [segment for segment in ranges if segment[0] + segment[2] <= segment[1]]
+        base = sum(segment[2] for segment in ranges)
+        started = time.monotonic()
+        last_checkpoint = base
+
+        with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+            futures = [executor.submit(_fetch_segment, session, url, headers, fd, segment, validator, timeout) for segment in pending]
+            while futures:
+                done, not_done = wait(futures, timeout=0.25)
+                downloaded = sum(segment[2] for segment in ranges)
+                if downloaded - last_checkpoint >= JOURNAL_INTERVAL:
+                    _save_journal(journal_path, journal)
+                    last_checkpoint = downloaded
+                if progress:
+                    elapsed = time.monotonic() - started
+                    progress(downloaded, total, (downloaded - base) / elapsed if elapsed > 0 else 0.0)
+                for future in done:
+                    future.result()
+                futures = list(not_done)
+    finally:
+        _save_journal(journal_path, journal)
+        os.close(fd)
+
+    return total
+
+def _serve_from_store(store, source_key: str, output_path: str, progress) -> int | None:
+    try:
+        entries = store.lookup(source_key)
+        if not entries or len(entries) != 1:
+            return None
+        digest, _, size = entries[0]
+        store.materialize(digest, output_path)
+    except (OSError, sqlite3.Error):
+        return None
+    if progress:
+        progress(size, size, 0.0)
+    return size
+
+def _add_to_store(store, source_key: str, output_path: str):
+    # Store hanya optimasi; file hasil unduhan tetap valid walau pencatatan gagal.
+    try:
+        digest, size = store.ingest(output_path)
+        store.record(source_key, [(digest, os.path.basename(output_path), size)])
+    except (OSError, sqlite3.Error):
+        pass
+
+def download_file(url: str, output_path: str, headers: dict | None = None, progress=None, timeout: float = 30, resume: bool = True, segments: int = 1, source_key: str | None = None) -> int:
+    """
+    Mengunduh `url` ke `output_path` dan mengembalikan ukuran file dalam byte.
+
+    Data ditulis ke `<output_path>.part` bersama jurnal `<output_path>.part.json`
+    (URL, ETag/Last-Modified, byte yang sudah ditulis). Jika unduhan terputus,
+    pemanggilan berikutnya melanjutkan dengan request Range dan hanya mengulang
+    dari awal bila server menolaknya. File dipindah ke `output_path` setelah selesai.
+
+    Dengan `segments` > 1, file yang ukurannya diketahui dan servernya mendukung
+    Range dibagi menjadi beberapa segmen yang diunduh paralel (maks. MAX_SEGMENTS);
+    selain itu unduhan kembali memakai satu koneksi.
+
+    `progress`, jika diberikan, dipanggil sebagai progress(downloaded, total, speed)
+    dengan `total` None bila ukuran tidak diketahui dan `speed` dalam byte/detik.
+
+    `source_key` (mis. "tiktok:<url postingan>") mengaktifkan store berbasis isi di
+    core.store (opt-in, ZEROTOOLS_DEDUP=1): bila kunci itu pernah diunduh, file langsung
+    disalin dari store tanpa request jaringan; jika belum, hasil unduhan dimasukkan ke store.
+    File yang sudah diambil core.prefetch.prefetch_files untuk kunci itu dipindahkan langsung.
+    """
+    store = get_download_store() if source_key else None
+    if store is not None:
+        cached_size = _serve_from_store(store, source_key, output_path, progress)
+        if cached_size is not None:
+            return cached_size
+    if source_key:
+        prefetched_size = claim_prefetched_file(url, source_key, output_path)
+        if prefetched_size is not None:
+            if progress:
+                progress(prefetched_size, prefetched_size, 0.0)
+            if store is not None:
+                _add_to_store(store, source_key, output_path)
+            return prefetched_size
+
+    session = get_download_session()
+    part_path = output_path + PART_SUFFIX
+    journal_path = part_path + JOURNAL_SUFFIX
+    headers = dict(headers or {})
+
+    probe = _probe_ranges(session, url, headers, timeout) if segments > 1 else None
+    if probe and probe['total'] >= 2 * MIN_SEGMENT_SIZE:
+        downloaded = _download_segmented(session, url, part_path, journal_path, headers, probe, resume, segments, progress, timeout)
+    else:
+        downloaded = _download_stream(session, url, part_path, journal_path, headers, resume, progress, timeout)
+
+    os.replace(part_path, output_path)
+    _remove_quietly(journal_path)
+
+    if store is not None:
+        _add_to_store(store, source_key, output_path)
+    return downloaded
+
+def _is_retryable(error: Exception) -> bool:
+    # 4xx selain 408/429 tidak akan berubah bila diulang (mis. 404, link kedaluwarsa 403).
+    response = getattr(error, 'response', None)
+    return response is None or response.status_code in (408, 429) or response.status_code >= 500
+
+def download_many(items: list, workers: int = MEDIA_WORKERS, retries: int = MEDIA_RETRIES, progress=None) -> list:
+    """
+    Mengunduh banyak file sekaligus lewat pool thread terbatas, mis. semua media satu postingan.
+
+    Setiap item adalah dict berisi `url` dan `output_path`, serta opsional `headers`,
+    `segments` dan `source_key` untuk download_file. Item yang gagal diulang hingga
+    `retries` kali (melanjutkan file .part). Hasilnya [{'output_path', 'size', 'error'}]
+    dengan urutan sama seperti `items`. `progress`, jika diberikan, dipanggil sebagai
+    progress(index, status=..., downloaded=..., total=..., attempt=..., error=...)
+    dengan sebagian kunci saja di setiap pemanggilan.
+    """
+    results = [None] * len(items)
+
+    def report(index, **state):
+        if progress:
+            progress(index, **state)
+
+    def run(index: int, item: dict):
+        error = None
+        for attempt in range(1, retries + 1):
+            report(index, status='Mengunduh', attempt=attempt)
+            try:
+                size = download_file(
+                    item['url'],
+                    item['output_path'],
+                    headers=item.get('headers'),
+                    segments=item.get('segments', 1),
+                    source_key=item.get('source_key'),
+                    progress=lambda downloaded, total, speed: report(index, downloaded=downloaded, total=total),
+                )
+                report(index, status='Selesai')
+                results[index] = {'output_path': item['output_path'], 'size': size, 'error': None}
+                return
+            except (requests.exceptions.RequestException, OSError) as e:
+                error = e
+                if attempt < retries and _is_retryable(e):
+                    report(index, status='Ulang', error=str(e))
+                    time.sleep(MEDIA_RETRY_DELAY * attempt)
+                    continue
+                break
+
+        report(index, status='Gagal', error=str(error))
+        results[index] = {'output_path': item['output_path'], 'size': 0, 'error': str(error)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items) or 1))) as executor:
+        for future in [executor.submit(run, index, item) for index, item in enumerate(items)]:
+            future.result()
+    return results
+
+def format_bytes(size_in_bytes: float) -> str:
+    if size_in_bytes < 1024 * 1024:
+        return f"{size_in_bytes / 1024:.2f} KB"
+    elif size_in_bytes < 1024 * 1024 * 1024:
+        return f"{size_in_bytes / (1024 * 1024):.2f} MB"
+    else:
+        return f"{size_in_bytes / (1024 * 1024 * 1024):.2f} GB"
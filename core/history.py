@@ -0,0 +1,154 @@
+# core/history.py
+
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'output')
+HISTORY_PATH = os.environ.get('ZEROTOOLS_HISTORY_DB') or os.path.join(OUTPUT_DIR, 'history.sqlite3')
+
+# <platform>_download_log_<YYYYmmdd_HHMMSS>.json / imgbb_upload_log_<...>.json
+LEGACY_LOG_PATTERN = re.compile(r'^(?P<platform>\w+?)_(?P<kind>download|upload)_log_(?P<stamp>\d{8}_\d{6})\.json$')
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS history ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT, created_at REAL NOT NULL, kind TEXT NOT NULL, platform TEXT NOT NULL,"
+    " source_url TEXT, output_path TEXT, response TEXT, imported_from TEXT UNIQUE)",
+    "CREATE INDEX IF NOT EXISTS history_source_url ON history (source_url)",
+    "CREATE INDEX IF NOT EXISTS history_platform ON history (platform, created_at)",
+    "CREATE INDEX IF NOT EXISTS history_created_at ON history (created_at)",
+    "CREATE INDEX IF NOT EXISTS history_output_path ON history (output_path)",
+    # Riwayat hanya boleh ditambah.
+    "CREATE TRIGGER IF NOT EXISTS history_no_update BEFORE UPDATE ON history BEGIN SELECT RAISE(ABORT, 'history is append-only'); END",
+    "CREATE TRIGGER IF NOT EXISTS history_no_delete BEFORE DELETE ON history BEGIN SELECT RAISE(ABORT, 'history is append-only'); END",
+)
+
+_db = None
+_db_lock = threading.Lock()
+
+def _connect() -> sqlite3.Connection:
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+                db = sqlite3.connect(HISTORY_PATH, timeout=10, check_same_thread=False, isolation_level=None)
+                db.execute("PRAGMA journal_mode=WAL")
+                for statement in _SCHEMA:
+                    db.execute(statement)
+                _db = db
+    return _db
+
+def _insert(db, created_at: float, kind: str, platform: str, source_url, output_path, response, imported_from=None) -> int:
+    cursor = db.execute(
+        "INSERT OR IGNORE INTO history (created_at, kind, platform, source_url, output_path, response, imported_from) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (created_at, kind, platform, source_url, output_path, json.dumps(response, ensure_ascii=False, default=str), imported_from),
+    )
+    return cursor.lastrowid if cursor.rowcount else 0
+
+def record_history(platform: str, source_url: str | None, output_path: str | None, response=None, kind: str = 'download') -> int | None:
+    """
+    Menambah satu entri riwayat unduhan/unggahan dan mengembalikan id-nya.
+
+    Gagal mencatat tidak menggagalkan unduhan; None dikembalikan bila database tidak bisa ditulis.
+    """
+    try:
+        db = _connect()
+        with _db_lock:
+            return _insert(db, time.time(), kind, platform, source_url, output_path, response)
+    except (sqlite3.Error, OSError):
+        return None
+
+def query_history(platform: str | None = None, source_url: str | None = None, output_path: str | None = None,
+                  since: float | None = None, until: float | None = None, kind: str | None = None, limit: int = 50) -> list:
+    """Mencari riwayat (terbaru dulu); filter `source_url`/`output_path` mendukung wildcard '%'."""
+    clauses, params = [], []
+    for column, value in (('platform', platform), ('kind', kind)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    for column, value in (('source_url', source_url), ('output_path', output_path)):
+        if value:
+            clauses.append(f"{column} LIKE ?" if '%' in value else f"{column} = ?")
+            params.append(value)
+    if since is not None:
+        clauses.append("created_at >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("created_at < ?")
+        params.append(until)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = _connect().execute(
+        f"SELECT id, created_at, kind, platform, source_url, output_path, response FROM history {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+        (*params, limit),
+    ).fetchall()
+    return [
+        {
+            'id': row[0],
+            'created_at': datetime.fromtimestamp(row[1]).isoformat(timespec='seconds'),
+            'kind': row[2],
+            'platform': row[3],
+            'source_url': row[4],
+            'output_path': row[5],
+            'response': json.loads(row[6]) if row[6] else None,
+        }
+        for row in rows
+    ]
+
+def _legacy_entries(platform: str, data) -> list:
+    """Mengubah isi satu file log lama menjadi [(platform, source_url, output_path, response)]."""
+    if platform == 'imgbb' and isinstance(data, dict):
+        return [('imgbb', data.get('url'), data.get('image_path'), data)]
+    if platform == 'google_image' and isinstance(data, dict):
+        return [('google_image', data.get('url'), data.get('saved_at'), data)]
+    return [(platform, None, None, data)]
+
+def import_json_logs(directory: str = OUTPUT_DIR, remove: bool = False) -> tuple[int, int]:
+    """
+    Mengimpor file `*_log_*.json` lama ke database riwayat; mengembalikan (diimpor, dilewati).
+
+    Nama file disimpan di kolom `imported_from`, jadi menjalankan ulang tidak membuat duplikat;
+    file yang rusak, tidak dikenali, atau sudah pernah diimpor dihitung sebagai dilewati.
+    Dengan `remove=True` file log yang sudah tercatat dihapus dari `directory`.
+    """
+    db = _connect()
+    imported = skipped = 0
+    for path in sorted(glob.glob(os.path.join(directory, '*_log_*.json'))):
+        match = LEGACY_LOG_PATTERN.match(os.path.basename(path))
+        if not match:
+            skipped += 1
+            continue
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            skipped += 1
+            continue
+
+        created_at = datetime.strptime(match['stamp'], '%Y%m%d_%H%M%S').timestamp()
+        kind = match['kind']
+        with _db_lock:
+            db.execute("BEGIN")
+            try:
+                new_rows = 0
+                for index, (platform, source_url, output_path, response) in enumerate(_legacy_entries(match['platform'], data)):
+                    new_rows += bool(_insert(db, created_at, kind, platform, source_url, output_path, response, f"{os.path.basename(path)}#{index}"))
+                db.execute("COMMIT")
+            except sqlite3.Error:
+                db.execute("ROLLBACK")
+                raise
+        if new_rows:
+            imported += 1
+        else:
+            skipped += 1
+
+        if remove:
+            os.remove(path)
+    return imported, skipped
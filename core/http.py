@@ -0,0 +1,198 @@
+# core/http.py
+
+import os
+import ssl
+import threading
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, get_environ_proxies
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 120
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_TRANSPORT = 'default'
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def _retry_policy() -> Retry:
+    # Read timeout tidak diulang: request AI yang lambat tidak boleh dikirim ulang diam-diam.
+    return Retry(
+        total=RETRY_TOTAL,
+        connect=RETRY_TOTAL,
+        read=0,
+        status=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter yang selalu memakai DEFAULT_TIMEOUT bila pemanggil tidak memberi timeout."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+class _HttpxRaw:
+    """Pengganti `response.raw` urllib3 untuk balasan httpx yang dibaca bertahap (stream=True)."""
+
+    def __init__(self, reply, request):
+        self._reply = reply
+        self._request = request
+        self._chunks = None
+        self._buffer = b''
+
+    def stream(self, chunk_size=None, decode_content=True):
+        # Dipakai Response.iter_content; chunk_size=None berarti setiap potongan segera setelah tiba.
+        import httpx
+
+        try:
+            yield from self._reply.iter_bytes(chunk_size)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ConnectionError(e, request=self._request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ChunkedEncodingError(e, request=self._request)
+
+    def read(self, amt=None, decode_content=True):
+        if self._chunks is None:
+            self._chunks = self.stream()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = (self._buffer, b'') if amt is None else (self._buffer[:amt], self._buffer[amt:])
+        return data
+
+    def close(self):
+        self._reply.close()
+
+class _HttpxAdapter(BaseAdapter):
+    """
+    Adapter requests di atas httpx.Client sehingga Session bisa memakai HTTP/2.
+
+    `stream=True` diteruskan ke httpx, jadi iter_content (SSE, progres unduhan) menerima
+    data saat tiba. Proxy diambil httpx dari variabel lingkungan; `verify`, `cert` dan proxy
+    per request tidak didukung dan menghasilkan error, bukan diabaikan diam-diam.
+    """
+
+    def __init__(self, client, ca_bundle: str | None = None):
+        super().__init__()
+        self._client = client
+        self._ca_bundle = ca_bundle
+
+    def _check_options(self, request, verify, cert, proxies):
+        # Session mengisi verify dan proxies dari variabel lingkungan; nilai itu sudah dipakai client.
+        environ_proxies = get_environ_proxies(request.url) or {}
+        custom_proxies = [key for key, value in (proxies or {}).items() if value and value != environ_proxies.get(key)]
+        if verify not in (True, self._ca_bundle) or cert or custom_proxies:
+            raise requests.exceptions.InvalidSchema(
+                "Transport http2 tidak mendukung verify/cert/proxy per request; pakai http_transport 'default'.",
+                request=request,
+            )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        import httpx
+
+        self._check_options(request, verify, cert, proxies)
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout) if timeout else DEFAULT_TIMEOUT
+        try:
+            reply = self._client.send(
+                self._client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=httpx.Timeout(read, connect=connect),
+                ),
+                stream=stream,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        if stream:
+            response.raw = _HttpxRaw(reply, request)
+        else:
+            response._content = reply.content
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        self._client.close()
+
+def _default_adapter() -> BaseAdapter:
+    return _TimeoutAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=_retry_policy())
+
+def _http2_adapter() -> BaseAdapter:
+    # httpx[http2] opsional; tanpa paket itu kembali ke HTTP/1.1 dengan pool biasa.
+    try:
+        import httpx
+        import h2  # noqa: F401
+    except ImportError:
+        return _default_adapter()
+
+    # CA bundle yang sama dengan yang dipakai requests (REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE).
+    ca_bundle = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE')
+    verify = ssl.create_default_context(cafile=ca_bundle) if ca_bundle else True
+    limits = httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_MAXSIZE)
+    transport = httpx.HTTPTransport(http2=True, retries=RETRY_TOTAL, limits=limits, verify=verify)
+    return _HttpxAdapter(httpx.Client(transport=transport, http2=True), ca_bundle)
+
+TRANSPORTS = {
+    'default': _default_adapter,
+    'http2': _http2_adapter,
+}
+
+def register_transport(name: str, factory):
+    """Mendaftarkan factory adapter baru yang bisa dipilih lewat `http_transport` di config."""
+    TRANSPORTS[name] = factory
+    with _sessions_lock:
+        session = _sessions.pop(name, None)
+    if session is not None:
+        session.close()
+
+def get_session(transport: str = DEFAULT_TRANSPORT) -> requests.Session:
+    """
+    Mengembalikan Session bersama (keep-alive) untuk transport yang dipilih.
+
+    Session dibuat sekali per proses dan dipakai ulang oleh semua thread, sehingga
+    DNS, TCP dan TLS ke host yang sama tidak diulang di setiap request.
+    """
+    session = _sessions.get(transport)
+    if session is not None:
+        return session
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Transport HTTP '{transport}' tidak dikenal. Pilihan: {', '.join(sorted(TRANSPORTS))}")
+
+    with _sessions_lock:
+        if transport not in _sessions:
+            _sessions[transport] = create_session(transport)
+        return _sessions[transport]
+
+def create_session(transport: str = DEFAULT_TRANSPORT) -> requests.Session:
+    """Session baru (cookie jar sendiri) dengan adapter, timeout dan retry yang sama seperti get_session."""
+    session = requests.Session()
+    adapter = TRANSPORTS[transport]()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
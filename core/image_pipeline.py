@@ -0,0 +1,180 @@
+# core/image_pipeline.py
+
+import glob
+import os
+import queue
+import shlex
+import threading
+from collections import Counter
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif')
+UPLOAD_WORKERS = 3
+PROCESS_WORKERS = 2
+# Link ImgBB hanya berlaku 5 menit; antrean antar tahap dibatasi agar unggahan
+# tidak jauh mendahului pemrosesan dan link-nya kedaluwarsa sebelum dipakai.
+STAGE_BUFFER = 4
+AI_UPLOAD_EXPIRATION = 'PT5M'
+
+_DONE = object()
+
+def is_batch_input(value: str) -> bool:
+    """True bila input berupa folder atau pola glob (mis. /sdcard/foto/*.jpg)."""
+    if value.startswith(('http://', 'https://')):
+        return False
+    return os.path.isdir(value) or glob.has_magic(value)
+
+def collect_images(source: str) -> list:
+    """Daftar file gambar dari folder (tidak rekursif) atau pola glob, urut nama."""
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(os.path.expanduser(source))
+    return sorted(path for path in paths if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS))
+
+def _expand_image_input(item: str) -> list:
+    item = os.path.expanduser(item)
+    if os.path.isdir(item) or glob.has_magic(item):
+        return collect_images(item)
+    return [item] if os.path.isfile(item) else []
+
+def expand_image_inputs(value: str) -> list:
+    """
+    Daftar gambar untuk unggah massal tanpa duplikat, dari folder, pola glob, file .txt berisi
+    satu path per baris ('#' diabaikan), atau beberapa path dipisah spasi (pakai tanda kutip
+    untuk path yang mengandung spasi).
+    """
+    value = value.strip()
+    if os.path.isfile(os.path.expanduser(value)) and value.lower().endswith('.txt'):
+        with open(os.path.expanduser(value), 'r', encoding='utf-8') as f:
+            items = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    elif os.path.exists(os.path.expanduser(value)):
+        items = [value]
+    else:
+        items = shlex.split(value)
+
+    paths, seen = [], set()
+    for item in items:
+        for path in _expand_image_input(item):
+            if os.path.abspath(path) not in seen:
+                seen.add(os.path.abspath(path))
+                paths.append(path)
+    return paths
+
+def batch_output_paths(output_dir: str, prefix: str, image_paths: list) -> list:
+    """
+    Path hasil `<prefix>_<nama>.png` untuk setiap gambar. Nama yang sama (mis. a.jpg dan a.png)
+    diberi ekstensi aslinya (`a_jpg`, `a_png`), lalu nomor bila masih bentrok (file senama dari
+    folder berbeda) atau file itu sudah ada dari proses sebelumnya, agar tidak ada hasil yang tertimpa.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in image_paths]
+    counts = Counter(stem.lower() for stem in stems)
+    used = set()
+    output_paths = []
+    for path, stem in zip(image_paths, stems):
+        extension = os.path.splitext(path)[1].lstrip('.').lower()
+        name = f"{stem}_{extension}" if counts[stem.lower()] > 1 and extension else stem
+        candidate, number = name, 2
+        # Dibandingkan tanpa huruf besar/kecil untuk filesystem yang case-insensitive.
+        while candidate.lower() in used or os.path.exists(os.path.join(output_dir, f"{prefix}_{candidate}.png")):
+            candidate = f"{name}_{number}"
+            number += 1
+        used.add(candidate.lower())
+        output_paths.append(os.path.join(output_dir, f"{prefix}_{candidate}.png"))
+    return output_paths
+
+def run_image_pipeline(paths: list, process, output_dir: str, prefix: str, upload=None,
+                       upload_workers: int = UPLOAD_WORKERS, process_workers: int = PROCESS_WORKERS,
+                       buffer: int = STAGE_BUFFER, progress=None, preprocess: str | None = None) -> list:
+    """
+    Memproses banyak gambar lewat tiga tahap yang berjalan bersamaan: unggah -> API -> simpan.
+
+    Setiap tahap punya pool thread sendiri dan dihubungkan antrean terbatas (`buffer`),
+    jadi unggahan gambar berikutnya berjalan selagi gambar sebelumnya diproses API.
+    `upload(path)` mengembalikan URL publik (default core.imgbb.upload_image dengan pengaturan
+    kompres `preprocess`) dan
+    `process(url, progress=...)` mengembalikan bytes hasil (endpoint gambar di core.api.ai). Hasilnya [{'source', 'output_path', 'error'}]
+    dengan urutan sama seperti `paths`; `progress(index, status=..., downloaded=..., total=...,
+    error=...)` dipanggil dengan sebagian kunci saja setiap kali keadaan sebuah item berubah.
+    """
+    if upload is None:
+        from core.imgbb import upload_image
+
+        def upload(path):
+            return upload_image(path, AI_UPLOAD_EXPIRATION, preprocess)
+
+    os.makedirs(output_dir, exist_ok=True)
+    results = [{'source': path, 'output_path': None, 'error': None} for path in paths]
+    output_paths = batch_output_paths(output_dir, prefix, paths)
+    pending = iter(enumerate(paths))
+    pending_lock = threading.Lock()
+    uploaded = queue.Queue(maxsize=buffer)
+    processed = queue.Queue(maxsize=buffer)
+
+    def report(index, **state):
+        if progress:
+            progress(index, **state)
+
+    def fail(index, error):
+        results[index]['error'] = str(error)
+        report(index, status='Gagal', error=str(error))
+
+    def upload_stage():
+        while True:
+            with pending_lock:
+                job = next(pending, None)
+            if job is None:
+                return
+            index, path = job
+            report(index, status='Mengunggah')
+            try:
+                url = path if path.startswith(('http://', 'https://')) else upload(path)
+            except Exception as e:
+                fail(index, e)
+                continue
+            report(index, status='Antre')
+            uploaded.put((index, url))
+
+    def process_stage():
+        while (job := uploaded.get()) is not _DONE:
+            index, url = job
+            report(index, status='Memproses')
+            try:
+                data = process(url, progress=lambda received, total, speed: report(index, downloaded=received, total=total))
+            except Exception as e:
+                fail(index, e)
+                continue
+            processed.put((index, data))
+
+    def save_stage():
+        while (job := processed.get()) is not _DONE:
+            index, data = job
+            report(index, status='Menyimpan')
+            output_path = output_paths[index]
+            try:
+                with open(output_path, 'wb') as f:
+                    f.write(data)
+            except OSError as e:
+                fail(index, e)
+                continue
+            results[index]['output_path'] = output_path
+            report(index, status='Selesai')
+
+    def start(target, count: int) -> list:
+        threads = [threading.Thread(target=target, daemon=True) for _ in range(max(1, min(count, len(paths) or 1)))]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    uploaders = start(upload_stage, upload_workers)
+    processors = start(process_stage, process_workers)
+    saver = start(save_stage, 1)
+
+    for thread in uploaders:
+        thread.join()
+    for _ in processors:
+        uploaded.put(_DONE)
+    for thread in processors:
+        thread.join()
+    processed.put(_DONE)
+    saver[0].join()
+    return results
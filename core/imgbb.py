@@ -0,0 +1,215 @@
+# core/imgbb.py
+
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import requests
+
+IMGBB_URL = 'https://imgbb.com'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+# auth_token terikat ke cookie sesi ImgBB; token yang lebih tua dari ini diambil ulang
+# walau belum ditolak, supaya unggahan pertama setelah lama diam tidak perlu diulang.
+TOKEN_TTL = 60 * 60
+# Status yang berarti token/cookie tidak diterima lagi; diulang sekali dengan token baru.
+REJECTED_STATUSES = (401, 403)
+# ImgBB (Chevereto) menolak auth_token basi dengan status 400 "Request denied"; status 400
+# lain (gambar rusak/terlalu besar) tidak diulang.
+TOKEN_ERROR_PATTERN = re.compile(r'auth|token|request denied', re.IGNORECASE)
+UPLOAD_WORKERS = 4
+MAX_UPLOAD_WORKERS = 16
+# Durasi ISO 8601 yang dipakai opsi kedaluwarsa ImgBB (PT5M, PT1H, P1D, P1W, P1M, ...).
+EXPIRATION_PATTERN = re.compile(r'^P(?:(?P<M>\d+)M|(?P<W>\d+)W|(?P<D>\d+)D)?(?:T(?:(?P<h>\d+)H)?(?:(?P<m>\d+)M)?)?$')
+
+_uploader = None
+_uploader_lock = threading.Lock()
+
+class ImgBBError(Exception):
+    """Dilempar bila ImgBB menolak unggahan atau halaman unggah tidak berisi auth_token."""
+
+class ImgBBUploader:
+    """
+    Pengunggah ImgBB tanpa API key yang memakai ulang satu Session dan auth_token.
+
+    Token diambil dari halaman imgbb.com/upload hanya saat pertama kali, saat sudah
+    lebih tua dari `token_ttl` atau cookie sesinya kedaluwarsa, dan saat sebuah unggahan
+    ditolak (lalu unggahan itu diulang sekali). Aman dipakai beberapa thread sekaligus.
+    """
+
+    def __init__(self, token_ttl: float = TOKEN_TTL):
+        self.token_ttl = token_ttl
+        self._lock = threading.Lock()
+        self._session = None
+        self._token = None
+        self._fetched_at = 0.0
+
+    def _token_expired(self) -> bool:
+        if self._token is None or time.monotonic() - self._fetched_at >= self.token_ttl:
+            return True
+        now = time.time()
+        return any(cookie.is_expired(now) for cookie in self._session.cookies)
+
+    def _refresh(self):
+        from bs4 import BeautifulSoup
+        from core.http import create_session
+
+        session = create_session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        response = session.get(f'{IMGBB_URL}/upload')
+        response.raise_for_status()
+
+        auth_token_input = BeautifulSoup(response.text, 'html.parser').find('input', {'name': 'auth_token'})
+        if not auth_token_input or not auth_token_input.get('value'):
+            raise ImgBBError("Gagal mendapatkan auth_token dari ImgBB.")
+
+        # Session lama tidak ditutup: thread lain mungkin masih mengunggah dengannya.
+        self._session = session
+        self._token = auth_token_input['value']
+        self._fetched_at = time.monotonic()
+
+    def credentials(self) -> tuple[requests.Session, str]:
+        """(Session, auth_token) yang masih berlaku; diambil ulang bila perlu."""
+        with self._lock:
+            if self._token_expired():
+                self._refresh()
+            return self._session, self._token
+
+    def invalidate(self, token: str):
+        """Menandai `token` tidak berlaku; thread lain yang sudah mengambil token baru tidak terganggu."""
+        with self._lock:
+            if self._token == token:
+                self._token = None
+
+    def upload(self, image_path: str, expiration: str = '', preprocess: str | None = None) -> str:
+        """
+        Mengunggah `image_path` dan mengembalikan URL gambarnya; `expiration` mis. 'PT5M' atau '' (permanen).
+
+        `preprocess` adalah nama alat di core.preprocess.TOOL_DEFAULTS; gambar dikecilkan dulu sesuai pengaturannya.
+        """
+        from core.preprocess import prepared_image
+
+        with prepared_image(image_path, preprocess) as upload_path:
+            return self._upload(upload_path, expiration)
+
+    def _upload(self, image_path: str, expiration: str) -> str:
+        for attempt in (1, 2):
+            session, token = self.credentials()
+            with open(image_path, 'rb') as image_file:
+                payload = {
+                    'type': 'file', 'action': 'upload', 'timestamp': str(int(time.time() * 1000)),
+                    'auth_token': token,
+                }
+                if expiration:
+                    payload['expiration'] = expiration
+                response = session.post(
+                    f'{IMGBB_URL}/json', files={'source': (os.path.basename(image_path), image_file)}, data=payload
+                )
+
+            try:
+                result = response.json()
+            except ValueError:
+                result = {}
+            if response.ok and result.get("status_code") == 200 and result.get("success", {}).get("message") == "image uploaded":
+                return result["image"]["url"]
+
+            status = result.get("status_code") or response.status_code
+            error = result.get("error")
+            message = (error.get("message") if isinstance(error, dict) else error) or result.get("status_txt") or 'Unknown error'
+            token_rejected = status in REJECTED_STATUSES or (status == 400 and TOKEN_ERROR_PATTERN.search(str(message)))
+            if attempt == 1 and token_rejected:
+                self.invalidate(token)
+                continue
+            if not response.ok and not result:
+                response.raise_for_status()
+            raise ImgBBError(f"Gagal mengunggah ke ImgBB: {message}")
+
+def get_uploader() -> ImgBBUploader:
+    global _uploader
+    if _uploader is None:
+        with _uploader_lock:
+            if _uploader is None:
+                _uploader = ImgBBUploader()
+    return _uploader
+
+def upload_image(image_path: str, expiration: str = '', preprocess: str | None = None) -> str:
+    """Mengunggah lewat pengunggah bersama proses ini; error dilempar (ImgBBError/requests/OSError)."""
+    return get_uploader().upload(image_path, expiration, preprocess)
+
+def expiration_delta(expiration: str) -> timedelta | None:
+    """Lama penyimpanan untuk kode kedaluwarsa ImgBB (bulan dihitung 30 hari); None bila permanen/tidak dikenal."""
+    match = EXPIRATION_PATTERN.match(expiration or '')
+    if not expiration or not match:
+        return None
+    parts = {key: int(value) for key, value in match.groupdict().items() if value}
+    return timedelta(days=parts.get('M', 0) * 30 + parts.get('W', 0) * 7 + parts.get('D', 0),
+                     hours=parts.get('h', 0), minutes=parts.get('m', 0)) or None
+
+def upload_many(paths: list, expiration: str = '', workers: int = UPLOAD_WORKERS, progress=None, preprocess: str | None = None) -> list:
+    """
+    Mengunggah banyak gambar lewat pool thread terbatas yang berbagi satu Session dan auth_token.
+
+    Hasilnya [{'path', 'url', 'uploaded_at', 'error'}] dengan urutan sama seperti `paths`;
+    `progress(index, status=..., error=...)` dipanggil setiap kali status sebuah item berubah.
+    Error apa pun hanya menggagalkan gambar itu. Ctrl+C menghentikan sisa antrean, dan hasil
+    yang sudah ada tetap dikembalikan (gambar lainnya bertanda 'Dibatalkan').
+    """
+    uploader = get_uploader()
+    results = [None] * len(paths)
+
+    def run(index: int, path: str):
+        if progress:
+            progress(index, status='Mengunggah')
+        try:
+            url = uploader.upload(path, expiration, preprocess)
+        except Exception as e:
+            # Termasuk error tak terduga (mis. DecompressionBombError Pillow, balasan JSON aneh):
+            # satu gambar tidak boleh menghentikan seluruh unggahan.
+            error = str(e) or type(e).__name__
+            results[index] = {'path': path, 'url': None, 'uploaded_at': None, 'error': error}
+            if progress:
+                progress(index, status='Gagal', error=error)
+            return
+        results[index] = {'path': path, 'url': url, 'uploaded_at': datetime.now(), 'error': None}
+        if progress:
+            progress(index, status='Selesai')
+
+    workers = max(1, min(workers, MAX_UPLOAD_WORKERS, len(paths) or 1))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='zerotools-imgbb')
+    try:
+        for future in [executor.submit(run, index, path) for index, path in enumerate(paths)]:
+            future.result()
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown()
+    return [
+        result or {'path': path, 'url': None, 'uploaded_at': None, 'error': 'Dibatalkan'}
+        for path, result in zip(paths, list(results))
+    ]
+
+def write_manifest(results: list, expiration: str, manifest_path: str) -> dict:
+    """Menulis satu manifest JSON (path -> URL, kedaluwarsa) untuk hasil upload_many dan mengembalikan isinya."""
+    delta = expiration_delta(expiration)
+    manifest = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'expiration': expiration or None,
+        'uploaded': sum(1 for result in results if result['url']),
+        'failed': sum(1 for result in results if result['error']),
+        'files': [
+            {
+                'path': os.path.abspath(result['path']),
+                'url': result['url'],
+                'expires_at': (result['uploaded_at'] + delta).isoformat(timespec='seconds') if result['url'] and delta else None,
+                'error': result['error'],
+            }
+            for result in results
+        ],
+    }
+    temp_path = f"{manifest_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+    return manifest
@@ -0,0 +1,215 @@
+# core/prefetch.py
+
+import hashlib
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from core.cache import CACHE_DIR
+
+PREFETCH_WORKERS = 3
+# Link unduhan dari backend biasanya kedaluwarsa; hasil prefetch yang lebih tua dibuang.
+PREFETCH_TTL = 10 * 60
+PREFETCH_ENABLED = os.environ.get('ZEROTOOLS_PREFETCH', '1') != '0'
+# Area sementara untuk file hasil prefetch_files (bukan core.store).
+PREFETCH_DIR = os.path.join(CACHE_DIR, 'prefetch')
+PREFETCH_MAX_BYTES = 32 * 1024 * 1024
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+def _call_key(func, args: tuple):
+    try:
+        hash(args)
+        return (func, args)
+    except TypeError:
+        # Argumen berupa dict (mis. data album dari hasil pencarian) dibandingkan lewat isinya.
+        return (func, json.dumps(args, sort_keys=True, default=str))
+
+class _DaemonPool:
+    """
+    Pool thread daemon berukuran tetap dengan antarmuka submit() seperti ThreadPoolExecutor.
+
+    Worker ThreadPoolExecutor ditunggu saat interpreter keluar, jadi menutup aplikasi
+    tertahan oleh prefetch yang masih berjalan (mis. konversi ytmp3); worker daemon tidak.
+    """
+
+    def __init__(self, workers: int, name: str):
+        self._queue = queue.SimpleQueue()
+        for index in range(workers):
+            threading.Thread(target=self._work, name=f'{name}-{index}', daemon=True).start()
+
+    def submit(self, func, *args) -> Future:
+        future = Future()
+        self._queue.put((future, func, args))
+        return future
+
+    def _work(self):
+        while True:
+            future, func, args = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+class Prefetcher:
+    """
+    Menjalankan panggilan endpoint di latar belakang selagi pengguna membaca daftar hasil.
+
+    `prefetch(func, *args)` menjadwalkan panggilan; `result(func, *args)` memakai hasil
+    yang sudah (atau sedang) diambil, atau memanggil `func` langsung bila belum pernah
+    dijadwalkan, sudah kedaluwarsa, atau prefetch-nya gagal. Jadi error tetap muncul
+    di tempat yang sama seperti tanpa prefetch.
+    """
+
+    def __init__(self, workers: int = PREFETCH_WORKERS, ttl: float = PREFETCH_TTL):
+        self.ttl = ttl
+        self._executor = _DaemonPool(workers, 'zerotools-prefetch')
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def prefetch(self, func, *args):
+        key = _call_key(func, args)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl and not entry[1].cancelled():
+                return
+            self._entries[key] = (now, self._executor.submit(func, *args))
+
+    def prefetch_many(self, calls: list):
+        """Menjadwalkan `calls` ([(func, args...)]) dan membatalkan antrean lama yang belum berjalan."""
+        wanted = {_call_key(func, tuple(args)) for func, *args in calls}
+        now = time.monotonic()
+        with self._lock:
+            for key, (created, future) in list(self._entries.items()):
+                if key not in wanted and (future.cancel() or now - created >= self.ttl):
+                    del self._entries[key]
+        for func, *args in calls:
+            self.prefetch(func, *args)
+
+    def wait(self, func, *args):
+        """Menunggu prefetch `func(*args)` yang sedang berjalan selesai; yang belum berjalan dibatalkan."""
+        with self._lock:
+            entry = self._entries.pop(_call_key(func, args), None)
+        if entry is None or entry[1].cancel():
+            return
+        try:
+            entry[1].result()
+        except Exception:
+            pass
+
+    def result(self, func, *args):
+        with self._lock:
+            entry = self._entries.pop(_call_key(func, args), None)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl and not entry[1].cancelled():
+            try:
+                return entry[1].result()
+            except Exception:
+                pass
+        return func(*args)
+
+def get_prefetcher() -> Prefetcher:
+    global _prefetcher
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                _prefetcher = Prefetcher()
+    return _prefetcher
+
+def prefetch_calls(calls: list):
+    """Prefetch metadata untuk item di halaman yang sedang tampil; no-op bila ZEROTOOLS_PREFETCH=0."""
+    if PREFETCH_ENABLED:
+        get_prefetcher().prefetch_many(calls)
+
+def prefetched(func, *args):
+    """Hasil `func(*args)`, diambil dari prefetch bila tersedia."""
+    if not PREFETCH_ENABLED:
+        return func(*args)
+    return get_prefetcher().result(func, *args)
+
+def _prefetch_path(source_key: str) -> str:
+    return os.path.join(PREFETCH_DIR, hashlib.sha256(source_key.encode('utf-8')).hexdigest())
+
+def _is_fresh(path: str) -> bool:
+    try:
+        return time.time() - os.path.getmtime(path) < PREFETCH_TTL
+    except OSError:
+        return False
+
+def _trim_prefetch_dir():
+    """Membuang file prefetch yang kedaluwarsa, lalu yang tertua sampai total <= PREFETCH_MAX_BYTES."""
+    files = []
+    now = time.time()
+    for name in os.listdir(PREFETCH_DIR):
+        path = os.path.join(PREFETCH_DIR, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if '.' in name:
+            # .part/.part.json: dibiarkan selama unduhannya mungkin masih berjalan, lalu dibuang
+            # (sisa prefetch yang terputus saat aplikasi ditutup).
+            if now - stat.st_mtime >= PREFETCH_TTL:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in files)
+    for mtime, size, path in sorted(files):
+        if now - mtime < PREFETCH_TTL and total <= PREFETCH_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
+
+def _fetch_file(url: str, source_key: str):
+    from core.download import download_file
+
+    path = _prefetch_path(source_key)
+    if _is_fresh(path):
+        return
+    os.makedirs(PREFETCH_DIR, exist_ok=True)
+    download_file(url, path)
+    _trim_prefetch_dir()
+
+def prefetch_files(items: list):
+    """
+    Mengunduh file kecil (mis. gambar) ke area sementara `.cache/prefetch` di latar belakang.
+
+    `items` berisi (url, source_key). File di sana kedaluwarsa setelah PREFETCH_TTL dan
+    totalnya dibatasi PREFETCH_MAX_BYTES; baru saat pengguna memilih unduh, download_file
+    dengan `source_key` yang sama memindahkannya ke folder output (dan ke core.store bila aktif).
+    """
+    if PREFETCH_ENABLED:
+        get_prefetcher().prefetch_many([(_fetch_file, url, source_key) for url, source_key in items])
+
+def claim_prefetched_file(url: str, source_key: str, output_path: str) -> int | None:
+    """
+    Memindahkan file hasil prefetch untuk `source_key` ke `output_path` dan mengembalikan ukurannya.
+
+    Prefetch yang sedang berjalan ditunggu; yang masih antre dibatalkan. None bila tidak ada
+    file prefetch yang masih berlaku.
+    """
+    if not PREFETCH_ENABLED:
+        return None
+    get_prefetcher().wait(_fetch_file, url, source_key)
+    path = _prefetch_path(source_key)
+    if not _is_fresh(path):
+        return None
+    try:
+        size = os.path.getsize(path)
+        shutil.move(path, output_path)
+    except OSError:
+        return None
+    return size
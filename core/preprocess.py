@@ -0,0 +1,126 @@
+# core/preprocess.py
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import NamedTuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+PREPROCESS_ENABLED = os.environ.get('ZEROTOOLS_PREPROCESS', '1') != '0'
+FORMAT_EXTENSIONS = {'JPEG': '.jpg', 'WEBP': '.webp', 'PNG': '.png'}
+
+class PreprocessOptions(NamedTuple):
+    """Pengaturan kompres gambar lokal sebelum diunggah."""
+    max_side: int | None = None
+    format: str = 'JPEG'
+    quality: int = 90
+    strip_exif: bool = True
+
+# Bawaan per alat; bisa ditimpa lewat kunci "preprocess" di core/config.json.
+TOOL_DEFAULTS = {
+    # waifu2x memperbesar detail gambar, jadi gambarnya tidak diperkecil; hanya disimpan ulang
+    # dengan kualitas tinggi karena artefak JPEG ikut membesar.
+    'waifu2x': PreprocessOptions(max_side=None, quality=95),
+    'colorize': PreprocessOptions(max_side=1600, quality=90),
+    'to_anime': PreprocessOptions(max_side=1280, quality=90),
+    'penghitam_waifu': PreprocessOptions(max_side=1280, quality=90),
+    # Gambar yang dilampirkan ke chat AI (Gemini, ChatGPT V2).
+    'vision': PreprocessOptions(max_side=2048, quality=85),
+    # Uploader menyimpan gambar apa adanya kecuali diatur di config.
+    'uploader': None,
+}
+
+def options_for(tool: str | None) -> PreprocessOptions | None:
+    """
+    Pengaturan untuk `tool`: TOOL_DEFAULTS ditimpa config, mis.
+    `"preprocess": {"waifu2x": {"max_side": 2048}, "uploader": {"quality": 85}, "colorize": false}`.
+    """
+    from core.config import ConfigError, get_config
+
+    if tool is None:
+        return None
+    options = TOOL_DEFAULTS.get(tool)
+    try:
+        override = (get_config().get('preprocess') or {}).get(tool)
+    except ConfigError:
+        override = None
+    if override is False:
+        return None
+    if isinstance(override, dict):
+        fields = {key: value for key, value in override.items() if key in PreprocessOptions._fields}
+        options = (options or PreprocessOptions())._replace(**fields)
+    if options is not None and options.format.upper() not in FORMAT_EXTENSIONS:
+        return None
+    return options
+
+def _has_alpha(image) -> bool:
+    return image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+
+def preprocess_image(path: str, options: PreprocessOptions, output_dir: str) -> str | None:
+    """
+    Menulis versi kecil `path` ke `output_dir`: diperkecil ke `max_side`, disimpan ulang
+    sebagai JPEG/WebP dengan `quality` (PNG untuk gambar transparan), dan tanpa EXIF
+    (orientasi diterapkan dulu).
+
+    Mengembalikan path baru, atau None bila file asli sebaiknya dipakai (bukan gambar,
+    animasi, atau hasilnya tidak lebih kecil dan tidak ada yang perlu dibuang).
+    """
+    image_format = options.format.upper()
+    with Image.open(path) as original:
+        if getattr(original, 'is_animated', False):
+            return None
+        has_exif = bool(original.getexif())
+        image = ImageOps.exif_transpose(original)
+        resized = bool(options.max_side) and max(image.size) > options.max_side
+        if resized:
+            image.thumbnail((options.max_side, options.max_side), Image.LANCZOS)
+        if image_format == 'JPEG':
+            # JPEG tidak punya kanal alfa; gambar transparan disimpan sebagai PNG agar tidak berubah.
+            if _has_alpha(image):
+                image_format = 'PNG'
+            elif image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+
+        save_options = {
+            'JPEG': {'quality': options.quality, 'optimize': True},
+            'WEBP': {'quality': options.quality, 'method': 4},
+            'PNG': {'optimize': True},
+        }[image_format]
+        if not options.strip_exif and has_exif:
+            save_options['exif'] = image.getexif().tobytes()
+        stem = os.path.splitext(os.path.basename(path))[0]
+        output_path = os.path.join(output_dir, stem + FORMAT_EXTENSIONS[image_format])
+        image.save(output_path, format=image_format, **save_options)
+
+    if not resized and not (has_exif and options.strip_exif) and os.path.getsize(output_path) >= os.path.getsize(path):
+        os.remove(output_path)
+        return None
+    return output_path
+
+@contextmanager
+def prepared_image(path: str, tool: str | None):
+    """
+    Menghasilkan path gambar yang siap diunggah untuk `tool` dan menghapus file sementaranya setelahnya.
+
+    File asli dipakai apa adanya bila Pillow tidak terpasang, ZEROTOOLS_PREPROCESS=0,
+    alat itu tidak memakai preprocessing, atau gambar gagal dibaca Pillow.
+    """
+    options = options_for(tool) if PREPROCESS_ENABLED and Image is not None else None
+    if options is None:
+        yield path
+        return
+
+    temp_dir = tempfile.mkdtemp(prefix='zerotools-preprocess-')
+    try:
+        try:
+            processed = preprocess_image(path, options, temp_dir)
+        except (OSError, ValueError, TypeError, Image.DecompressionBombError):
+            processed = None
+        yield processed or path
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,181 @@
+# core/resolvers.py
+
+from datetime import datetime
+from urllib.parse import urlparse
+from core.api import downloader as downloader_api
+from core.download import DEFAULT_SEGMENTS
+
+PLATFORM_HOSTS = {
+    'tiktok': ('tiktok.com',),
+    'instagram': ('instagram.com',),
+    'youtube': ('youtube.com', 'youtu.be'),
+    'facebook': ('facebook.com', 'fb.watch', 'fb.com'),
+    'threads': ('threads.net', 'threads.com'),
+    'twitter': ('twitter.com', 'x.com'),
+    'mega': ('mega.nz', 'mega.io'),
+    'mediafire': ('mediafire.com',),
+    'krakenfiles': ('krakenfiles.com',),
+    'gdrive': ('drive.google.com', 'drive.usercontent.google.com'),
+    'spotify': ('spotify.com',),
+    'soundcloud': ('soundcloud.com',),
+    'bilibili': ('bilibili.tv', 'bilibili.com', 'b23.tv'),
+}
+
+def safe_filename(text: str) -> str:
+    return "".join(c for c in text if c.isalnum() or c in (' ', '-', '_')).rstrip()
+
+def detect_platform(url: str) -> str | None:
+    """Menebak platform dari hostname URL (termasuk subdomain seperti vt.tiktok.com)."""
+    host = (urlparse(url.strip()).hostname or '').lower()
+    for platform, domains in PLATFORM_HOSTS.items():
+        if any(host == domain or host.endswith('.' + domain) for domain in domains):
+            return platform
+    return None
+
+def media_source_key(platform: str, url: str, variant: str | None = None) -> str:
+    """Kunci indeks core.store untuk media dari `url`; `variant` membedakan kualitas/pilihan format."""
+    key = f"{platform}:{url.strip()}"
+    return f"{key}|{variant}" if variant else key
+
+def _media_item(url: str, filename: str, headers: dict | None = None, segments: int = 1) -> dict:
+    return {'url': url, 'filename': filename, 'headers': headers or {}, 'segments': segments}
+
+def _post_items(platform: str, media: list) -> list:
+    """Media dari satu postingan disimpan dalam satu folder seperti pada menu interaktif."""
+    folder = f"{platform}_post_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+    return [_media_item(media_url, f"{folder}/media_{i+1}{ext}") for i, (media_url, ext) in enumerate(media)]
+
+def _resolve_tiktok(url, quality):
+    result = downloader_api.ttdl(url)
+    video_data = result.get('data', {}).get('data') if result.get('success') else None
+    if not video_data or not (video_data.get('play') or video_data.get('wmplay')):
+        raise ValueError("Informasi video TikTok tidak ditemukan.")
+    author_name = video_data.get('author', {}).get('nickname', 'tiktok_video')
+    filename = f"{author_name}_{safe_filename(video_data.get('title', 'video'))}.mp4"
+    return result, [_media_item(video_data.get('play') or video_data.get('wmplay'), filename)]
+
+def _resolve_instagram(url, quality):
+    result = downloader_api.instagram(url)
+    media_list = result.get('data', []) if result.get('status') else []
+    media = [(item['url'], '.jpg' if item.get('type', 'image') == 'image' else '.mp4') for item in media_list if item.get('url')]
+    if not media:
+        raise ValueError("Tidak ada media Instagram yang ditemukan.")
+    return result, _post_items('instagram', media)
+
+def _resolve_youtube(url, quality):
+    result = downloader_api.ytmp4(url, quality)
+    if not result.get('url'):
+        raise ValueError("URL unduhan YouTube tidak tersedia untuk kualitas ini.")
+    filename = f"{safe_filename(result.get('title', 'video'))}_{result.get('quality', 'Unknown')}.mp4"
+    return result, [_media_item(result['url'], filename)]
+
+def _resolve_facebook(url, quality):
+    result = downloader_api.facebook(url)
+    videos = [video for video in result.get('data', []) if video.get('url')] if result.get('status') else []
+    if not videos:
+        raise ValueError("Tidak ada video Facebook yang tersedia.")
+    video = videos[0]
+    ext = '.mp4' if video.get('type', 'video') == 'video' else '.jpg'
+    filename = f"facebook_video_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{ext}"
+    return result, [_media_item(video['url'], filename)]
+
+def _resolve_threads(url, quality):
+    result = downloader_api.threads(url)
+    media_urls = result.get('image_urls', []) + result.get('video_urls', [])
+    if not media_urls:
+        raise ValueError("Tidak ada media Threads yang ditemukan.")
+    media = [(media_url, '.jpg' if '.jpg' in media_url else '.mp4' if '.mp4' in media_url else '') for media_url in media_urls]
+    return result, _post_items('threads', media)
+
+def _resolve_twitter(url, quality):
+    result = downloader_api.twitter(url)
+    media_list = result.get('media', []) if result.get('status') else []
+    if not media_list:
+        raise ValueError("Tidak ada media Twitter yang ditemukan.")
+    media_type = result.get('type', 'unknown')
+    ext = '.jpg' if media_type == 'image' else '.mp4' if media_type == 'video' else ''
+    return result, _post_items('twitter', [(media_url, ext) for media_url in media_list])
+
+def _resolve_mega(url, quality):
+    result = downloader_api.mega(url)
+    file_list = result.get('result', [])
+    if not file_list or not file_list[0].get('link'):
+        raise ValueError("Tidak ada file Mega yang ditemukan.")
+    file_info = file_list[0]
+    return result, [_media_item(file_info['link'], file_info.get('name', 'file'), segments=DEFAULT_SEGMENTS)]
+
+def _resolve_mediafire(url, quality):
+    result = downloader_api.mediafire(url)
+    file_data = result.get('data', {}) if result.get('status') else {}
+    if not file_data or not file_data.get('downloadUrl'):
+        raise ValueError("Link unduhan MediaFire tidak tersedia.")
+    return result, [_media_item(file_data['downloadUrl'], file_data.get('filename', 'file'), segments=DEFAULT_SEGMENTS)]
+
+def _resolve_krakenfiles(url, quality):
+    result = downloader_api.krakenfiles(url)
+    metadata = result.get('metadata', {})
+    if not metadata.get('download'):
+        raise ValueError("Link unduhan KrakenFiles tidak tersedia.")
+    return result, [_media_item(metadata['download'], metadata.get('filename', 'file'), result.get('headers', {}), DEFAULT_SEGMENTS)]
+
+def _resolve_gdrive(url, quality):
+    result = downloader_api.gdrive(url)
+    if not result.get('fileName') or not result.get('downloadUrl'):
+        raise ValueError("Link unduhan Google Drive tidak tersedia.")
+    return result, [_media_item(result['downloadUrl'], result['fileName'], segments=DEFAULT_SEGMENTS)]
+
+def _resolve_spotify(url, quality):
+    result = downloader_api.spotify(url)
+    if not result.get('success') or not result.get('link'):
+        raise ValueError("URL unduhan Spotify tidak tersedia.")
+    metadata = result.get('metadata', {})
+    title = metadata.get('title', 'spotify_audio')
+    artists = metadata.get('artists', 'artist')
+    return result, [_media_item(result['link'], f"{safe_filename(f'{title} - {artists}')}.mp3")]
+
+def _resolve_soundcloud(url, quality):
+    result = downloader_api.soundcloud(url)
+    if not result.get('download_url'):
+        raise ValueError("URL unduhan SoundCloud tidak tersedia.")
+    return result, [_media_item(result['download_url'], f"{safe_filename(result.get('title', 'soundcloud_audio'))}.mp3")]
+
+def _resolve_bilibili(url, quality):
+    result = downloader_api.bilibili(url)
+    data = result.get('data', {}) if result.get('status') else {}
+    video_list = [video for video in data.get('mediaList', {}).get('videoList', []) if video.get('url')]
+    if not video_list:
+        raise ValueError("Tidak ada video Bilibili yang tersedia.")
+    video = video_list[0]
+    filename = video.get('filename', f"bilibili_video_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.mp4")
+    return result, [_media_item(video['url'], filename)]
+
+RESOLVERS = {
+    'tiktok': _resolve_tiktok,
+    'instagram': _resolve_instagram,
+    'youtube': _resolve_youtube,
+    'facebook': _resolve_facebook,
+    'threads': _resolve_threads,
+    'twitter': _resolve_twitter,
+    'mega': _resolve_mega,
+    'mediafire': _resolve_mediafire,
+    'krakenfiles': _resolve_krakenfiles,
+    'gdrive': _resolve_gdrive,
+    'spotify': _resolve_spotify,
+    'soundcloud': _resolve_soundcloud,
+    'bilibili': _resolve_bilibili,
+}
+
+def resolve_media(url: str, platform: str | None = None, quality: str = '720') -> tuple[str, dict, list]:
+    """
+    Mengambil daftar media yang bisa diunduh dari `url` tanpa interaksi pengguna.
+
+    Mengembalikan (platform, respons API mentah, daftar item) dengan setiap item berisi
+    `url`, `filename` (boleh berisi subfolder), `headers` dan `segments` untuk download_file.
+    Pilihan kualitas memakai opsi pertama/terbaik yang tersedia. ValueError dilempar
+    bila platform tidak dikenal atau API tidak mengembalikan media.
+    """
+    platform = platform or detect_platform(url)
+    if platform not in RESOLVERS:
+        raise ValueError(f"Platform untuk URL '{url}' tidak dikenali.")
+    result, items = RESOLVERS[platform](url, quality)
+    return platform, result, items
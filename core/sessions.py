@@ -0,0 +1,196 @@
+# core/sessions.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CORE_DIR = os.path.dirname(os.path.abspath(__file__))
+SESSIONS_DB = os.environ.get('ZEROTOOLS_SESSIONS_DB') or os.path.join(CORE_DIR, 'sessions.sqlite3')
+# Format lama: {"<model>": [{"id": ..., "title": ...}, ...]}; diimpor sekali lalu diganti nama.
+LEGACY_SESSIONS_FILE = os.path.join(CORE_DIR, 'sessions.json')
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sessions ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT, chat_model TEXT NOT NULL, session_id TEXT NOT NULL,"
+    " title TEXT NOT NULL, created_at REAL NOT NULL, UNIQUE (chat_model, session_id))",
+    # Transkrip lokal setiap sesi (pesan pengguna dan jawaban AI).
+    "CREATE TABLE IF NOT EXISTS messages ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT, chat_model TEXT NOT NULL, session_id TEXT NOT NULL,"
+    " role TEXT NOT NULL, content TEXT NOT NULL, image_url TEXT, created_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS messages_session ON messages (chat_model, session_id, id)",
+)
+
+# Indeks full-text (FTS5) untuk search_messages; bila SQLite tidak mendukungnya dipakai LIKE.
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(content, content='messages', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN"
+    " INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN"
+    " INSERT INTO messages_fts (messages_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+)
+
+# Kata yang cocok di cuplikan diapit karakter kontrol ini (tidak muncul di teks chat biasa).
+MATCH_START, MATCH_END = '\x02', '\x03'
+FTS_SNIPPET = "snippet(messages_fts, 0, char(2), char(3), '…', 12)"
+
+_db = None
+_fts_enabled = False
+_db_lock = threading.Lock()
+
+def _import_legacy(db: sqlite3.Connection, path: str):
+    """Memindahkan sessions.json ke database dalam satu transaksi; aman dijalankan beberapa proses sekaligus."""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            # Proses lain sudah mengimpornya lebih dulu.
+            db.execute("ROLLBACK")
+            return
+        except json.JSONDecodeError:
+            data = {}
+
+        now = time.time()
+        for chat_model, sessions in (data.items() if isinstance(data, dict) else []):
+            for session in sessions if isinstance(sessions, list) else []:
+                if isinstance(session, dict) and session.get('id'):
+                    db.execute(
+                        "INSERT OR IGNORE INTO sessions (chat_model, session_id, title, created_at) VALUES (?, ?, ?, ?)",
+                        (chat_model, str(session['id']), str(session.get('title', '')), now),
+                    )
+        db.execute("COMMIT")
+    except sqlite3.Error:
+        db.execute("ROLLBACK")
+        raise
+    os.replace(path, path + '.migrated')
+
+def _connect() -> sqlite3.Connection:
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                db = sqlite3.connect(SESSIONS_DB, timeout=10, check_same_thread=False, isolation_level=None)
+                db.execute("PRAGMA journal_mode=WAL")
+                for statement in _SCHEMA:
+                    db.execute(statement)
+                global _fts_enabled
+                try:
+                    for statement in _FTS_SCHEMA:
+                        db.execute(statement)
+                    _fts_enabled = True
+                except sqlite3.OperationalError:
+                    _fts_enabled = False
+                if os.path.exists(LEGACY_SESSIONS_FILE):
+                    _import_legacy(db, LEGACY_SESSIONS_FILE)
+                _db = db
+    return _db
+
+def list_sessions(chat_model: str) -> list:
+    """Sesi milik `chat_model` sesuai urutan dibuat, sebagai [{'id', 'title'}]."""
+    db = _connect()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT session_id, title FROM sessions WHERE chat_model = ? ORDER BY id", (chat_model,)
+        ).fetchall()
+    return [{'id': session_id, 'title': title} for session_id, title in rows]
+
+def add_session(chat_model: str, session_id: str, title: str) -> bool:
+    """Menyimpan sesi baru; False bila sesi itu sudah tersimpan."""
+    db = _connect()
+    with _db_lock:
+        cursor = db.execute(
+            "INSERT OR IGNORE INTO sessions (chat_model, session_id, title, created_at) VALUES (?, ?, ?, ?)",
+            (chat_model, session_id, title, time.time()),
+        )
+    return cursor.rowcount > 0
+
+def delete_session(chat_model: str, session_id: str) -> bool:
+    """Menghapus sesi beserta transkripnya."""
+    db = _connect()
+    with _db_lock:
+        db.execute("BEGIN")
+        try:
+            cursor = db.execute("DELETE FROM sessions WHERE chat_model = ? AND session_id = ?", (chat_model, session_id))
+            db.execute("DELETE FROM messages WHERE chat_model = ? AND session_id = ?", (chat_model, session_id))
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+    return cursor.rowcount > 0
+
+def add_messages(chat_model: str, session_id: str, messages: list):
+    """Menambah satu giliran chat ke transkrip; `messages` berisi (role, isi, image_url atau None)."""
+    db = _connect()
+    now = time.time()
+    with _db_lock:
+        db.execute("BEGIN")
+        try:
+            db.executemany(
+                "INSERT INTO messages (chat_model, session_id, role, content, image_url, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(chat_model, session_id, role, content, image_url, now) for role, content, image_url in messages],
+            )
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+
+def _message(row) -> dict:
+    return {'id': row[0], 'role': row[1], 'content': row[2], 'image_url': row[3], 'created_at': row[4]}
+
+def get_messages(chat_model: str, session_id: str, before_id: int | None = None, limit: int = 10) -> list:
+    """
+    Satu halaman transkrip: `limit` pesan terbaru sebelum `before_id` (urut lama -> baru).
+
+    Untuk memuat halaman sebelumnya, panggil lagi dengan `before_id` = id pesan pertama hasil ini.
+    """
+    db = _connect()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT id, role, content, image_url, created_at FROM messages"
+            " WHERE chat_model = ? AND session_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+            (chat_model, session_id, before_id if before_id is not None else 2 ** 63 - 1, limit),
+        ).fetchall()
+    return [_message(row) for row in reversed(rows)]
+
+def _fts_query(query: str) -> str:
+    # Setiap kata dijadikan frasa agar karakter khusus FTS5 (", *, -, :) tidak dianggap operator.
+    return ' '.join('"{}"'.format(word.replace('"', '""')) for word in query.split())
+
+def search_messages(query: str, chat_model: str | None = None, limit: int = 20) -> list:
+    """
+    Mencari teks di transkrip semua sesi (atau satu model saja), paling relevan dulu.
+
+    Setiap hasil berisi chat_model, session_id, judul sesi, role, cuplikan isi dan waktu.
+    """
+    if not query.strip():
+        return []
+    db = _connect()
+    columns = "m.id, m.chat_model, m.session_id, COALESCE(s.title, ''), m.role, {}, m.created_at"
+    join = "LEFT JOIN sessions s ON s.chat_model = m.chat_model AND s.session_id = m.session_id"
+    model_filter = " AND m.chat_model = ?" if chat_model else ""
+    if _fts_enabled:
+        sql = (
+            f"SELECT {columns.format(FTS_SNIPPET)}"
+            f" FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid {join}"
+            f" WHERE messages_fts MATCH ?{model_filter} ORDER BY rank LIMIT ?"
+        )
+        params = [_fts_query(query)]
+    else:
+        sql = (
+            f"SELECT {columns.format('m.content')} FROM messages m {join}"
+            f" WHERE m.content LIKE ?{model_filter} ORDER BY m.id DESC LIMIT ?"
+        )
+        params = [f"%{query}%"]
+    if chat_model:
+        params.append(chat_model)
+    params.append(limit)
+
+    with _db_lock:
+        rows = db.execute(sql, params).fetchall()
+    return [
+        {'id': row[0], 'chat_model': row[1], 'session_id': row[2], 'title': row[3], 'role': row[4], 'snippet': row[5], 'created_at': row[6]}
+        for row in rows
+    ]
@@ -0,0 +1,58 @@
+# core/startup.py
+
+import builtins
+import importlib
+import sys
+import time
+
+def lazy_action(module_name: str, attr: str, package: str | None = None):
+    """Membuat aksi menu yang baru mengimpor modul fungsinya saat pertama kali dipilih."""
+    def action(*args, **kwargs):
+        module = importlib.import_module(module_name, package)
+        return getattr(module, attr)(*args, **kwargs)
+
+    action.__name__ = attr
+    return action
+
+class ImportProfiler:
+    """Mencatat waktu impor setiap modul (kumulatif dan self) selama startup."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = {}
+        self._stack = []
+        self._original_import = None
+
+    def install(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Hanya impor pertama yang dihitung; modul yang sudah dimuat hampir tanpa biaya.
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            cumulative, own = self.records.get(name, (0.0, 0.0))
+            self.records[name] = (cumulative + elapsed, own + elapsed - children)
+
+    def top(self, limit: int = 20) -> list:
+        """Mengembalikan [(modul, kumulatif, self)] terurut dari yang paling lambat."""
+        rows = [(name, cumulative, own) for name, (cumulative, own) in self.records.items()]
+        return sorted(rows, key=lambda row: row[1], reverse=True)[:limit]
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
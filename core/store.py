@@ -0,0 +1,235 @@
+# core/store.py
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from core.cache import CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+STORE_DIR = os.environ.get('ZEROTOOLS_STORE_DIR') or os.path.join(CACHE_DIR, 'store')
+# Store bersifat opt-in: aktif hanya dengan ZEROTOOLS_DEDUP=1.
+STORE_ENABLED = os.environ.get('ZEROTOOLS_DEDUP', '0') == '1'
+# Batas ukuran store; objek yang paling lama tidak dipakai dihapus lebih dulu (0 = tanpa batas).
+STORE_MAX_BYTES = int(os.environ.get('ZEROTOOLS_STORE_MAX_MB', '1024')) * 1024 * 1024
+# File objek tanpa entri yang lebih muda dari ini mungkin sedang di-ingest; tidak dihapus prune().
+ORPHAN_GRACE = 10 * 60
+HASH_CHUNK_SIZE = 1024 * 1024
+# ioctl FICLONE (Linux): salinan copy-on-write di btrfs/XFS tanpa menyalin isi file.
+FICLONE = 0x40049409
+
+_store = None
+_store_lock = threading.Lock()
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _reflink(source: str, target: str):
+    if fcntl is None:
+        raise OSError("reflink tidak didukung")
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+def _clone_or_copy(source: str, target: str):
+    """
+    Membuat `target` sebagai salinan `source` (atomik): reflink bila filesystem mendukung,
+    selain itu salinan biasa. Tidak pernah hardlink, jadi mengedit file output tidak
+    mengubah objek di store.
+    """
+    temp_path = f"{target}.copy-{os.getpid()}-{threading.get_ident()}"
+    try:
+        try:
+            _reflink(source, temp_path)
+        except OSError:
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+class DownloadStore:
+    """
+    Penyimpanan unduhan berbasis isi (SHA-256) dengan indeks sumber -> hash.
+
+    Setiap file disimpan sekali di `objects/<2 huruf>/<hash>` dan disalin (reflink bila
+    bisa) ke folder output, sehingga permintaan berulang untuk kunci sumber yang sama
+    (mis. "tiktok:<url>") dilayani tanpa jaringan. Ukuran store dibatasi `max_bytes`:
+    objek yang paling lama tidak dipakai dihapus (LRU), lihat prune().
+
+    Tanpa reflink (mis. ext4 atau penyimpanan Android) salinannya penuh, jadi file yang
+    ada di store dan di folder output memakan ruang dua kali: store menghemat kuota, bukan disk.
+    """
+
+    def __init__(self, root: str = STORE_DIR, max_bytes: int = STORE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(root, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(root, 'index.sqlite3'), timeout=5, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sources ("
+            " source_key TEXT NOT NULL, position INTEGER NOT NULL, digest TEXT NOT NULL, filename TEXT NOT NULL,"
+            " size INTEGER NOT NULL, stored_at REAL NOT NULL, PRIMARY KEY (source_key, position))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS sources_digest ON sources (digest)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _touch(self, digest: str, size: int):
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO objects (digest, size, last_used) VALUES (?, ?, ?)"
+                " ON CONFLICT (digest) DO UPDATE SET last_used = excluded.last_used",
+                (digest, size, time.time()),
+            )
+
+    def ingest(self, path: str) -> tuple[str, int]:
+        """Menyalin file yang sudah diunduh ke store dan mengembalikan (hash, ukuran)."""
+        digest = hash_file(path)
+        size = os.path.getsize(path)
+        object_path = self.object_path(digest)
+
+        if not self._object_valid(digest, size):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            _clone_or_copy(path, object_path)
+        self._touch(digest, size)
+        return digest, size
+
+    def materialize(self, digest: str, output_path: str):
+        _clone_or_copy(self.object_path(digest), output_path)
+
+    def record(self, source_key: str, entries: list):
+        """Menyimpan hasil unduhan untuk `source_key`; `entries` berisi (hash, nama file, ukuran)."""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM sources WHERE source_key = ?", (source_key,))
+                self._db.executemany(
+                    "INSERT INTO sources (source_key, position, digest, filename, size, stored_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(source_key, position, digest, filename, size, now) for position, (digest, filename, size) in enumerate(entries)],
+                )
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                raise
+        if self.max_bytes and self.total_size() > self.max_bytes:
+            self.prune()
+
+    def _object_valid(self, digest: str, size: int) -> bool:
+        object_path = self.object_path(digest)
+        try:
+            stat = os.stat(object_path)
+        except FileNotFoundError:
+            return False
+        return stat.st_size == size
+
+    def lookup(self, source_key: str) -> list | None:
+        """Mengembalikan [(hash, nama file, ukuran)] untuk `source_key`, atau None bila ada objek yang hilang/rusak."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT digest, filename, size FROM sources WHERE source_key = ? ORDER BY position", (source_key,)
+            ).fetchall()
+        if not rows:
+            return None
+        for digest, _, size in rows:
+            if not self._object_valid(digest, size):
+                return None
+        for digest, _, size in rows:
+            self._touch(digest, size)
+        return rows
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            objects, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects").fetchone()
+            sources = self._db.execute("SELECT COUNT(DISTINCT source_key) FROM sources").fetchone()[0]
+        return {'root': self.root, 'objects': objects, 'sources': sources, 'size': size, 'max_size': self.max_bytes or None}
+
+    def prune(self, max_bytes: int | None = None) -> tuple[int, int]:
+        """
+        Menghapus objek yang paling lama tidak dipakai sampai total ukuran <= `max_bytes`
+        (default self.max_bytes; 0 mengosongkan store), beserta entri sumber yang memakainya
+        dan file objek yatim. Mengembalikan (jumlah objek dihapus, byte dibebaskan).
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        unlimited = max_bytes is None and not self.max_bytes
+        with self._lock:
+            rows = self._db.execute("SELECT digest, size FROM objects ORDER BY last_used DESC").fetchall()
+            kept, victims = 0, []
+            for digest, size in rows:
+                if not unlimited and kept + size > limit:
+                    victims.append((digest, size))
+                else:
+                    kept += size
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("DELETE FROM sources WHERE digest = ?", [(digest,) for digest, _ in victims])
+                self._db.executemany("DELETE FROM objects WHERE digest = ?", [(digest,) for digest, _ in victims])
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                raise
+            known = {digest for digest, _ in rows} - {digest for digest, _ in victims}
+
+        removed = freed = 0
+        for digest, size in victims:
+            try:
+                os.remove(self.object_path(digest))
+                freed += size
+            except FileNotFoundError:
+                pass
+            removed += 1
+        # File objek tanpa entri (mis. proses terhenti di tengah ingest); file sementara ('.') dilewati.
+        cutoff = time.time() - ORPHAN_GRACE
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(prefix_dir) if os.path.isdir(prefix_dir) else []:
+                path = os.path.join(prefix_dir, name)
+                if '.' in name or name in known:
+                    continue
+                try:
+                    stat = os.stat(path)
+                    if stat.st_mtime < cutoff:
+                        os.remove(path)
+                        freed += stat.st_size
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed, freed
+
+def get_download_store() -> DownloadStore | None:
+    """Store bersama untuk proses ini, atau None bila dedup tidak diaktifkan (ZEROTOOLS_DEDUP=1) atau gagal dibuka."""
+    global _store
+    if not STORE_ENABLED:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = DownloadStore()
+                except (OSError, sqlite3.Error):
+                    return None
+    return _store
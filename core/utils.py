@@ -1,110 +1,187 @@
 # core/utils.py
 
-import requests
 import os
-import json
-import time
 import re
+import sqlite3
 from app.console import console, print_cyber_panel, cyber_input, clear
-from bs4 import BeautifulSoup
 from app.console import console, cyber_input
 
 def load_config():
+    """Konfigurasi dari cache core.config; mencetak error dan mengembalikan None bila tidak valid."""
+    from core.config import ConfigError, get_config
+
     try:
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        config_path = os.path.join(base_path, 'core', 'config.json')
-        
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        console.print("[bold red]Error: 'core/config.json' not found.[/bold red]")
-        return None
-    except json.JSONDecodeError:
-        console.print("[bold red]Error: 'core/config.json' is not a valid JSON file.[/bold red]")
+        return get_config()
+    except ConfigError as e:
+        console.print(f"[bold red]Error: {e}[/bold red]")
         return None
 
-def upload_to_imgbb_no_api(image_path: str) -> str | None:
+def upload_to_imgbb_no_api(image_path: str, tool: str | None = None) -> str | None:
+    """
+    Mengunggah gambar sementara (5 menit) ke ImgBB untuk endpoint AI; error dicetak dan None dikembalikan.
+
+    `tool` memilih pengaturan kompres di core.preprocess (mis. 'waifu2x', 'vision').
+    """
+    import requests
+    from core.imgbb import upload_image
 
     if not os.path.exists(image_path):
         console.print(f"[bold red]Error:[/bold red] File tidak ditemukan di path '{image_path}'")
         return None
 
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    })
-
     try:
-        console.print("[bold cyan]Menghubungi ImgBB untuk mendapatkan token...[/bold cyan]")
-        upload_page_response = session.get('https://imgbb.com/upload')
-        upload_page_response.raise_for_status()
-
-        soup = BeautifulSoup(upload_page_response.text, 'html.parser')
-        auth_token_input = soup.find('input', {'name': 'auth_token'})
-        
-        if not auth_token_input or not auth_token_input.get('value'):
-            console.print("[bold red]Gagal mendapatkan auth_token dari ImgBB.[/bold red]")
-            return None
-        
-        auth_token = auth_token_input['value']
-
-        console.print("[bold cyan]Token didapatkan. Mengunggah gambar...[/bold cyan]")
-        
-        with open(image_path, 'rb') as image_file:
-            files = {'source': (os.path.basename(image_path), image_file)}
-            payload = {
-                'type': 'file', 'action': 'upload', 'timestamp': str(int(time.time() * 1000)),
-                'auth_token': auth_token, 'expiration': 'PT5M'
-            }
-            upload_response = session.post('https://imgbb.com/json', files=files, data=payload)
-            upload_response.raise_for_status()
-
-        result = upload_response.json()
-        
-        if result.get("status_code") == 200 and result.get("success", {}).get("message") == "image uploaded":
-            image_url = result["image"]["url"]
-            console.print(f"[bold green]✓[/bold green] Link sementara (ImgBB): [link]{image_url}[/link]")
-            return image_url
-        else:
-            console.print(f"[bold red]Gagal mengunggah ke ImgBB.[/bold red]")
-            console.print(f"Detail error: {result.get('status_txt', 'Unknown error')}")
-            return None
-
+        console.print("[bold cyan]Mengunggah gambar ke ImgBB...[/bold cyan]")
+        image_url = upload_image(image_path, 'PT5M', preprocess=tool)
+        console.print(f"[bold green]✓[/bold green] Link sementara (ImgBB): [link]{image_url}[/link]")
+        return image_url
     except requests.exceptions.RequestException as e:
         console.print(f"[bold red]Terjadi kesalahan saat request ke ImgBB:[/bold red] {e}")
         return None
     except Exception as e:
-        console.print(f"[bold red]Terjadi kesalahan tak terduga:[/bold red] {e}")
+        console.print(f"[bold red]{e}[/bold red]")
         return None
 
-SESSIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sessions.json')
+def run_image_batch(source: str, process, prefix: str, title: str, tool: str | None = None):
+    """Mode batch alat gambar AI: semua gambar di folder/pola glob `source` diproses lewat pipeline."""
+    from core.image_pipeline import collect_images
+    from app.console import image_batch_live
+
+    paths = collect_images(source)
+    if not paths:
+        console.print(f"[bold red]Error:[/bold red] Tidak ada file gambar di '{source}'")
+        return
+
+    console.print(f"[bold cyan]{len(paths)} gambar ditemukan.[/bold cyan]")
+    output_dir = os.path.dirname(get_output_path("output", ""))
+    results = image_batch_live(paths, process, output_dir, prefix, title, preprocess=tool)
+
+    failed = sum(1 for result in results if result['error'])
+    console.print(f"\n[bold green]✓ {len(results) - failed} gambar selesai[/bold green], [bold red]{failed} gagal[/bold red].")
+    console.print(f"Disimpan di: [bold cyan]{output_dir}[/bold cyan]")
 
 def load_sessions(chat_model: str) -> list:
+    from core.sessions import list_sessions
+
     try:
-        with open(SESSIONS_FILE, 'r') as f:
-            all_sessions = json.load(f)
-            return all_sessions.get(chat_model, [])
-    except (FileNotFoundError, json.JSONDecodeError):
+        return list_sessions(chat_model)
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Gagal membaca sesi: {e}[/bold red]")
         return []
 
-def save_all_sessions(all_sessions: dict):
-    with open(SESSIONS_FILE, 'w') as f:
-        json.dump(all_sessions, f, indent=4)
-
 def save_new_session(chat_model: str, session_id: str, title: str):
-    all_sessions = {}
+    from core.sessions import add_session
+
+    if not session_id:
+        return
     try:
-        with open(SESSIONS_FILE, 'r') as f:
-            all_sessions = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass 
+        add_session(chat_model, session_id, title)
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Gagal menyimpan sesi: {e}[/bold red]")
 
-    if chat_model not in all_sessions:
-        all_sessions[chat_model] = []
-    
-    if not any(s['id'] == session_id for s in all_sessions[chat_model]):
-        all_sessions[chat_model].append({'id': session_id, 'title': title})
-        save_all_sessions(all_sessions)
+HISTORY_PAGE_SIZE = 10
+
+def record_chat_turn(chat_model: str, session_id: str | None, user_message: str, ai_reply: str, image_url: str | None = None):
+    """Menyimpan pesan pengguna dan jawaban AI ke transkrip lokal sesi."""
+    from core.sessions import add_messages
+
+    if not session_id:
+        return
+    try:
+        add_messages(chat_model, session_id, [('user', user_message, image_url), ('assistant', ai_reply, None)])
+    except sqlite3.Error as e:
+        console.print(f"[dim]Transkrip tidak tersimpan: {e}[/dim]")
+
+def show_session_history(chat_model: str, session_id: str, ai_title: str, before_id: int | None = None) -> int | None:
+    """
+    Menampilkan satu halaman transkrip lokal (HISTORY_PAGE_SIZE pesan sebelum `before_id`).
+
+    Mengembalikan id pesan tertua yang ditampilkan untuk memuat halaman sebelumnya
+    dengan '/lama', atau None bila tidak ada pesan lagi.
+    """
+    from datetime import datetime
+    from rich.align import Align
+    from rich.panel import Panel
+    from rich.text import Text
+    from core.sessions import get_messages
+
+    try:
+        messages = get_messages(chat_model, session_id, before_id, HISTORY_PAGE_SIZE)
+    except sqlite3.Error as e:
+        console.print(f"[dim]Transkrip tidak bisa dibaca: {e}[/dim]")
+        return None
+    if not messages:
+        if before_id is not None:
+            console.print("[dim]Tidak ada pesan yang lebih lama.[/dim]")
+        return None
+
+    console.print(f"[dim]── Riwayat lokal ({len(messages)} pesan) ──[/dim]")
+    for message in messages:
+        stamp = datetime.fromtimestamp(message['created_at']).strftime('%d/%m %H:%M')
+        # Isi pesan ditambahkan sebagai teks biasa: tanda kurung siku di chat bukan markup Rich.
+        body = Text(stamp, style="dim")
+        body.append("\n")
+        body.append(message['content'])
+        if message['role'] == 'user':
+            if message['image_url']:
+                body.append(f"\nGambar: {message['image_url']}", style="dim")
+            console.print(Align.right(Panel(body, title="[bold blue]Anda[/bold blue]", border_style="blue", padding=(0, 1))))
+        else:
+            console.print(Align.left(Panel(body, title=f"[bold #00F0FF]{ai_title}[/bold #00F0FF]", border_style="#00F0FF", padding=(0, 1))))
+
+    if len(messages) == HISTORY_PAGE_SIZE:
+        console.print("[dim]Ketik '/lama' untuk memuat pesan sebelumnya.[/dim]")
+    return messages[0]['id']
+
+def _snippet_text(snippet: str):
+    """Cuplikan search_messages sebagai Text dengan kata yang cocok ditebalkan (tanpa markup Rich)."""
+    from rich.text import Text
+    from core.sessions import MATCH_START, MATCH_END
+
+    text = Text()
+    start = None
+    for part in re.split(f'([{MATCH_START}{MATCH_END}])', snippet):
+        if part == MATCH_START:
+            start = len(text)
+        elif part == MATCH_END:
+            if start is not None:
+                text.stylize("bold yellow", start, len(text))
+            start = None
+        else:
+            text.append(part)
+    return text
+
+def search_sessions_ui(chat_model: str) -> str | None:
+    """Mencari teks di transkrip semua sesi; mengembalikan id sesi `chat_model` yang dipilih untuk dilanjutkan."""
+    from rich.markup import escape
+    from rich.table import Table
+    from core.sessions import search_messages
+
+    query = cyber_input("Kata kunci yang dicari di riwayat chat")
+    try:
+        results = search_messages(query)
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Gagal mencari: {e}[/bold red]")
+        return None
+    if not results:
+        console.print("[yellow]Tidak ada pesan yang cocok.[/yellow]")
+        return None
+
+    table = Table(show_header=True, header_style="bold #00F0FF", border_style="#00F0FF", expand=True)
+    table.add_column("No.", style="bold white", width=4, justify="center")
+    table.add_column("Model", style="bold cyan", width=10)
+    table.add_column("Sesi", style="white", overflow="ellipsis", no_wrap=True, max_width=24)
+    table.add_column("Cuplikan", style="white")
+    for i, result in enumerate(results, start=1):
+        table.add_row(str(i), result['chat_model'], escape(result['title'] or result['session_id']), _snippet_text(result['snippet']))
+    console.print(table)
+
+    choice = cyber_input(f"Nomor hasil untuk melanjutkan sesinya (hanya sesi {chat_model.upper()}), Enter untuk batal")
+    if choice.isdigit() and 1 <= int(choice) <= len(results):
+        selected = results[int(choice) - 1]
+        if selected['chat_model'] == chat_model:
+            return selected['session_id']
+        console.print(f"[red]Sesi itu milik {selected['chat_model'].upper()}, buka dari menunya.[/red]")
+    return None
 
 def delete_session_ui(chat_model: str):
 
@@ -133,14 +210,9 @@ def delete_session_ui(chat_model: str):
             if confirm == 'y':
 
                 try:
-                    with open(SESSIONS_FILE, 'r') as f:
-                        all_sessions = json.load(f)
-                    
-                    del all_sessions[chat_model][int(choice) - 1]
-                    
-                    with open(SESSIONS_FILE, 'w') as f:
-                        json.dump(all_sessions, f, indent=4)
-                    
+                    from core.sessions import delete_session
+
+                    delete_session(chat_model, session_to_delete['id'])
                     console.print("[bold green]Sesi berhasil dihapus.[/bold green]")
                 except Exception as e:
                     console.print(f"[bold red]Gagal menghapus sesi: {e}[/bold red]")
@@ -165,13 +237,20 @@ def display_and_select_session(chat_model: str) -> str | None:
     console.print("  [bold red]00.[/bold red] Kembali ke menu")
 
     console.print("  [bold red]h.[/bold red] Hapus sesi")
+    console.print("  [bold cyan]c.[/bold cyan] Cari di riwayat chat")
 
     while True:
-        choice = cyber_input("Masukkan nomor sesi (atau '00' untuk kembali, 'h' untuk hapus)")
+        choice = cyber_input("Masukkan nomor sesi (atau '00' untuk kembali, 'h' untuk hapus, 'c' untuk cari)")
         
         if choice == '00':
             return 'exit'
 
+        if choice.lower() == 'c':
+            found = search_sessions_ui(chat_model)
+            if found:
+                return found
+            continue
+
         if choice.lower() == 'h':
             delete_session_ui(chat_model)
             continue 
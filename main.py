@@ -2,21 +2,29 @@
 
 import sys
 import os
+import importlib
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from rich.console import Console
+# Opsi yang tetap membuka menu interaktif; argumen lain berarti mode headless.
+INTERACTIVE_FLAGS = ('--profile-startup', '--no-cache', '--refresh')
+
+# Mode headless: ada argumen CLI -> jalankan perintah tanpa banner/menu lalu keluar.
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] not in INTERACTIVE_FLAGS:
+    from app.cli import run_cli
+    sys.exit(run_cli(sys.argv[1:]))
+
+PROFILE_STARTUP = __name__ == "__main__" and '--profile-startup' in sys.argv
+if PROFILE_STARTUP:
+    from core.startup import ImportProfiler
+    startup_profiler = ImportProfiler()
+    startup_profiler.install()
+
 from rich.table import Table
 from rich.panel import Panel
 from rich.align import Align
 from rich.text import Text
-from pyfiglet import figlet_format
 from app.console import console, cyber_input, clear
-from menu.ai import main as ai_menu
-from menu.uploader import main as uploader_menu
-from menu.downloader import main as downloader_menu
-from menu.tools import main as tools_menu
-from menu.search import main as search_menu
 from core.utils import load_config
 
 HEADER_ART_TEMPLATE = """
@@ -32,12 +40,13 @@ MENU_DATA = [
 ]
 
 
+# Submenu baru diimpor saat pertama kali dipilih.
 MENU_ACTIONS = {
-    '1': ai_menu,
-    '2': uploader_menu,
-    '3': downloader_menu,
-    '4': tools_menu,
-    '5': search_menu,
+    '1': 'menu.ai',
+    '2': 'menu.uploader',
+    '3': 'menu.downloader',
+    '4': 'menu.tools',
+    '5': 'menu.search',
 }
 
 
@@ -45,6 +54,7 @@ def create_header(author_name: str) -> Panel:
     display_name = author_name if author_name else "ZeroTools"
     
     try:
+        from pyfiglet import figlet_format
         author_ascii_art = figlet_format(display_name, font='slant')
     except Exception:
         author_ascii_art = display_name
@@ -81,16 +91,43 @@ def create_credits_footer(author: str, github_url: str) -> Panel:
 
     return Panel(Align.center(credits_text), border_style="#00F0FF", padding=(0, 1))
 
+def print_startup_profile(profiler) -> None:
+    table = Table(title="[bold #00F0FF]⏱ Startup Import Profile ⏱[/bold #00F0FF]", header_style="bold #00F0FF", expand=True)
+    table.add_column("Modul", style="bold white")
+    table.add_column("Kumulatif (ms)", style="white", justify="right")
+    table.add_column("Self (ms)", style="white", justify="right")
+
+    for name, cumulative, own in profiler.top():
+        table.add_row(name, f"{cumulative * 1000:.1f}", f"{own * 1000:.1f}")
+
+    console.print(table)
+    console.print(f"[bold cyan]Total waktu sampai menu siap:[/bold cyan] {profiler.elapsed() * 1000:.1f} ms")
+
 def main():
 
+    if '--no-cache' in sys.argv:
+        from core.cache import set_cache_mode
+        set_cache_mode('off')
+    elif '--refresh' in sys.argv:
+        from core.cache import set_cache_mode
+        set_cache_mode('refresh')
+
     config = load_config()
     
     author_name = config.get("author", "ZeroTools") if config else "ZeroTools"
 
+    # Banner cukup dibuat sekali; pyfiglet baru dimuat di sini.
+    header = create_header(author_name)
+
+    if PROFILE_STARTUP:
+        startup_profiler.uninstall()
+        print_startup_profile(startup_profiler)
+        cyber_input("Tekan Enter untuk melanjutkan...")
+
     while True:
         clear()
 
-        console.print(create_header(author_name))
+        console.print(header)
 
         menu_table = create_menu_table()
         menu_panel = Panel(
@@ -111,7 +148,7 @@ def main():
         choice = cyber_input("Pilih menu")
 
         if choice in MENU_ACTIONS:
-            MENU_ACTIONS[choice]()
+            importlib.import_module(MENU_ACTIONS[choice]).main()
         elif choice in ['0', 'q', 'exit']:
             console.print("\n[bold red]Terima kasih telah menggunakan tools ini![/bold red]")
             console.print("[bold #00F0FF]Sampai jumpa lagi! 👋[/bold #00F0FF]\n")
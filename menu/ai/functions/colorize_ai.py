@@ -3,15 +3,23 @@
 import os
 import requests
 from datetime import datetime
-from core.utils import upload_to_imgbb_no_api, load_config, get_output_path
+from core.utils import upload_to_imgbb_no_api, load_config, get_output_path, run_image_batch
+from core.api import ai as ai_api
+from core.image_pipeline import is_batch_input
 from app.console import console, print_cyber_panel, cyber_input, clear, loading_animation
 
 def colorize_ai():
     clear()
-    print_cyber_panel("Colorize AI", "Masukkan path gambar atau link URL")
+    print_cyber_panel("Colorize AI", "Masukkan path gambar, link URL, atau folder/pola glob untuk mode batch")
     image_input = cyber_input("Path/URL gambar (contoh: /sdcard/foto.jpg) atau ketik '00' untuk kembali")
     if image_input == '00':
         return
+
+    if is_batch_input(image_input):
+        if load_config():
+            run_image_batch(image_input, ai_api.colorize, "colorized", "Colorize AI", tool="colorize")
+        cyber_input("\nTekan Enter untuk kembali ke menu...")
+        return
     public_url = None
 
     if image_input.startswith(('http://', 'https://')):
@@ -24,7 +32,7 @@ def colorize_ai():
             cyber_input("Tekan Enter untuk kembali...")
             return
 
-        public_url = upload_to_imgbb_no_api(image_path=image_input)
+        public_url = upload_to_imgbb_no_api(image_path=image_input, tool="colorize")
         
         if not public_url:
             cyber_input("Tekan Enter untuk kembali...")
@@ -36,18 +44,9 @@ def colorize_ai():
             cyber_input("Tekan Enter untuk kembali...")
             return
             
-        base_url = config.get("base_url")
-        api_endpoint = f"{base_url}/api/ai/colorize"
-        
-        params = {
-            'url': public_url
-        }
-        
         try:
-            loading_animation("Memproses gambar dengan AI", duration=5)
-            
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'image/png'})
-            response.raise_for_status()
+            with loading_animation("Memproses gambar dengan AI") as progress:
+                image_bytes = ai_api.colorize(public_url, progress=progress)
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"colorized_image_{timestamp}.png"
@@ -55,7 +54,7 @@ def colorize_ai():
             output_path = get_output_path("output", output_filename)
             
             with open(output_path, 'wb') as f:
-                f.write(response.content)
+                f.write(image_bytes)
                 
             console.print(f"\n[bold green]✓ Gambar berhasil diwarnai![/bold green]")
             console.print(f"Disimpan di: [bold cyan]{output_path}[/bold cyan]")
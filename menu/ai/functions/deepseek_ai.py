@@ -1,8 +1,9 @@
 # menu/ai/functions/deepseek_ai.py
 
 import requests
-from core.utils import load_config, display_and_select_session, save_new_session
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.utils import load_config, display_and_select_session, save_new_session, record_chat_turn, show_session_history
+from core.api import ai as ai_api
+from app.console import console, print_cyber_panel, cyber_input, clear, stream_chat_reply
 from rich.panel import Panel
 from rich.align import Align
 
@@ -15,9 +16,6 @@ def deepseek_ai():
         cyber_input("Tekan Enter untuk kembali...")
         return
         
-    base_url = config.get("base_url")
-    api_endpoint = f"{base_url}/api/ai/deepseek"
-
     session_id = display_and_select_session('deepseek')
     
     if session_id == 'exit':
@@ -30,6 +28,8 @@ def deepseek_ai():
     else:
         console.print(f"[bold green]Melanjutkan sesi lama...[/bold green]")
 
+    history_cursor = None if is_new_session else show_session_history('deepseek', session_id, "Deepseek AI")
+
     while True:
 
         user_message = cyber_input("Anda (ketik 'keluar' untuk keluar dari chat)")
@@ -38,6 +38,13 @@ def deepseek_ai():
             console.print("[bold yellow]Mengakhiri sesi chat...[/bold yellow]")
             break
         
+        if user_message.lower() == '/lama':
+            if history_cursor is not None:
+                history_cursor = show_session_history('deepseek', session_id, "Deepseek AI", history_cursor)
+            else:
+                console.print("[dim]Tidak ada pesan yang lebih lama.[/dim]")
+            continue
+
         if not user_message:
             console.print("[dim]Pesan tidak boleh kosong.[/dim]")
             continue
@@ -51,30 +58,21 @@ def deepseek_ai():
         console.print(Align.right(user_panel))
 
         try:
-            with console.status("[bold green]Deepseek sedang berpikir...[/bold green]", spinner="dots"):
-                params = {'text': user_message}
-                if session_id:
-                    params['session'] = session_id
-                
-                response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                data = response.json()
+            ai_reply, data = stream_chat_reply(
+                ai_api.chat_stream('deepseek', user_message, session_id),
+                "Deepseek AI",
+                reply_key="answer",
+                thinking="Deepseek sedang berpikir...",
+            )
 
-            if data.get("status"):
-                ai_reply = data.get("answer")
-                session_id = data.get("session")
+            if ai_reply:
+                session_id = data.get("session") or session_id
                 
                 if is_new_session:
                     save_new_session('deepseek', session_id, user_message)
                     is_new_session = False
 
-                ai_panel = Panel(
-                    ai_reply,
-                    title="[bold #00F0FF]Deepseek AI[/bold #00F0FF]",
-                    border_style="#00F0FF",
-                    padding=(0, 1)
-                )
-                console.print(Align.left(ai_panel))
+                record_chat_turn('deepseek', session_id, user_message, ai_reply)
             else:
                 console.print(f"[bold red]Gagal mendapatkan respons dari AI.[/bold red]")
                 console.print(f"Detail: {data}")
@@ -4,6 +4,7 @@ import os
 import requests
 from datetime import datetime
 from core.utils import load_config, get_output_path
+from core.api import ai as ai_api
 from app.console import console, print_cyber_panel, cyber_input, clear, loading_animation
 
 def flux_schnell():
@@ -26,18 +27,9 @@ def flux_schnell():
         cyber_input("Tekan Enter untuk kembali...")
         return
         
-    base_url = config.get("base_url")
-    api_endpoint = f"{base_url}/api/ai/flux-schnell"
-    
-    params = {
-        'prompt': prompt
-    }
-    
     try:
-        loading_animation("Membuat gambar dengan AI", duration=10)
-        
-        response = requests.get(api_endpoint, params=params, headers={'accept': 'image/png'})
-        response.raise_for_status()
+        with loading_animation("Membuat gambar dengan AI") as progress:
+            image_bytes = ai_api.flux_schnell(prompt, progress=progress)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"flux_schnell_image_{timestamp}.png"
@@ -45,7 +37,7 @@ def flux_schnell():
         output_path = get_output_path("output", output_filename)
         
         with open(output_path, 'wb') as f:
-            f.write(response.content)
+            f.write(image_bytes)
 
         console.print(f"\n[bold green]✓ Gambar berhasil dibuat![/bold green]")
         console.print(f"Disimpan di: [bold cyan]{output_path}[/bold cyan]")
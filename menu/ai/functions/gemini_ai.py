@@ -2,8 +2,9 @@
 
 import requests
 import os
-from core.utils import load_config, display_and_select_session, save_new_session, upload_to_imgbb_no_api
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.utils import load_config, display_and_select_session, save_new_session, record_chat_turn, show_session_history, upload_to_imgbb_no_api
+from core.api import ai as ai_api
+from app.console import console, print_cyber_panel, cyber_input, clear, stream_chat_reply
 from rich.panel import Panel
 from rich.align import Align
 
@@ -16,8 +17,6 @@ def gemini_ai():
         cyber_input("Tekan Enter untuk kembali...")
         return
         
-    base_url = config.get("base_url")
-    api_endpoint = f"{base_url}/api/ai/gemini"
     session_id = display_and_select_session('gemini')
     
     if session_id == 'exit':
@@ -30,6 +29,8 @@ def gemini_ai():
     else:
         console.print(f"[bold green]Melanjutkan sesi lama...[/bold green]")
 
+    history_cursor = None if is_new_session else show_session_history('gemini', session_id, "Gemini AI")
+
     while True:
 
         user_message = cyber_input("Anda (ketik 'keluar' untuk keluar dari chat)")
@@ -38,6 +39,13 @@ def gemini_ai():
             console.print("[bold yellow]Mengakhiri sesi chat...[/bold yellow]")
             break
         
+        if user_message.lower() == '/lama':
+            if history_cursor is not None:
+                history_cursor = show_session_history('gemini', session_id, "Gemini AI", history_cursor)
+            else:
+                console.print("[dim]Tidak ada pesan yang lebih lama.[/dim]")
+            continue
+
         if not user_message:
             console.print("[dim]Pesan tidak boleh kosong.[/dim]")
             continue
@@ -67,7 +75,7 @@ def gemini_ai():
                     cyber_input("Tekan Enter untuk melanjutkan...")
                     continue
                 
-                image_url = upload_to_imgbb_no_api(image_path=image_input)
+                image_url = upload_to_imgbb_no_api(image_path=image_input, tool="vision")
                 if not image_url:
                     console.print("[bold red]Gagal mengunggah gambar. Pesan akan dikirim tanpa gambar.[/bold red]")
         
@@ -75,32 +83,21 @@ def gemini_ai():
             console.print(f"[dim]Gambar terlampir: {image_input}[/dim]")
 
         try:
-            with console.status("[bold green]Gemini sedang berpikir...[/bold green]", spinner="dots"):
-                params = {'text': user_message}
-                if session_id:
-                    params['session'] = session_id
-                if image_url:
-                    params['imageUrl'] = image_url
-                
-                response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                data = response.json()
+            ai_reply, data = stream_chat_reply(
+                ai_api.chat_stream('gemini', user_message, session_id, image_url),
+                "Gemini AI",
+                reply_key="result",
+                thinking="Gemini sedang berpikir...",
+            )
 
-            if data.get("success"):
-                ai_reply = data.get("result")
-                session_id = data.get("session")
+            if ai_reply:
+                session_id = data.get("session") or session_id
                 
                 if is_new_session:
                     save_new_session('gemini', session_id, user_message)
                     is_new_session = False
 
-                ai_panel = Panel(
-                    ai_reply,
-                    title="[bold #00F0FF]Gemini AI[/bold #00F0FF]",
-                    border_style="#00F0FF",
-                    padding=(0, 1)
-                )
-                console.print(Align.left(ai_panel))
+                record_chat_turn('gemini', session_id, user_message, ai_reply, image_url)
             else:
                 console.print(f"[bold red]Gagal mendapatkan respons dari AI.[/bold red]")
                 console.print(f"Detail: {data}")
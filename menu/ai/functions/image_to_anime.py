@@ -4,15 +4,23 @@ import os
 import requests
 from datetime import datetime
 from core.utils import *
+from core.api import ai as ai_api
+from core.image_pipeline import is_batch_input
 from app.console import *
 
 def image_to_anime():
     clear()
-    print_cyber_panel("Image to Anime", "Masukkan path gambar atau link URL")
+    print_cyber_panel("Image to Anime", "Masukkan path gambar, link URL, atau folder/pola glob untuk mode batch")
     image_input = cyber_input("Path/URL gambar (contoh: /sdcard/foto.jpg) atau ketik '00' untuk kembali")
     if image_input == '00':
         return 
 
+    if is_batch_input(image_input):
+        if load_config():
+            run_image_batch(image_input, ai_api.to_anime, "anime", "Image to Anime", tool="to_anime")
+        cyber_input("\nTekan Enter untuk kembali ke menu...")
+        return
+
     public_url = None
 
     if image_input.startswith(('http://', 'https://')):
@@ -24,7 +32,7 @@ def image_to_anime():
             console.print(f"[bold red]Error:[/bold red] File tidak ditemukan di path '{image_input}'")
             cyber_input("Tekan Enter untuk kembali...")
             return
-        public_url = upload_to_imgbb_no_api(image_path=image_input)
+        public_url = upload_to_imgbb_no_api(image_path=image_input, tool="to_anime")
         
         if not public_url:
             cyber_input("Tekan Enter untuk kembali...")
@@ -36,25 +44,15 @@ def image_to_anime():
             cyber_input("Tekan Enter untuk kembali...")
             return
             
-        base_url = config.get("base_url")
-        api_endpoint = f"{base_url}/api/ai/toanime"
-        
-        params = {
-            'url': public_url,
-            'style': 'anime'
-        }
-        
         try:
-            loading_animation("Memproses gambar dengan AI", duration=5)
-            
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'image/png'})
-            response.raise_for_status()
+            with loading_animation("Memproses gambar dengan AI") as progress:
+                image_bytes = ai_api.to_anime(public_url, progress=progress)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"anime_image_{timestamp}.png"
             output_path = get_output_path("output", output_filename)
 
             with open(output_path, 'wb') as f:
-                f.write(response.content)
+                f.write(image_bytes)
                 
             console.print(f"\n[bold green]✓ Gambar berhasil diubah![/bold green]")
             console.print(f"Disimpan di: [bold cyan]{output_path}[/bold cyan]")
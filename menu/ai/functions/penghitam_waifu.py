@@ -5,15 +5,23 @@ import requests
 from datetime import datetime
 
 from core.utils import *
+from core.api import ai as ai_api
+from core.image_pipeline import is_batch_input
 from app.console import *
 
 def penghitam_waifu():
     clear()
-    print_cyber_panel("Penghitam Waifu", "Masukkan path gambar atau link URL")
+    print_cyber_panel("Penghitam Waifu", "Masukkan path gambar, link URL, atau folder/pola glob untuk mode batch")
     image_input = cyber_input("Path/URL gambar (contoh: /sdcard/foto.jpg) atau ketik '00' untuk kembali")
     if image_input == '00':
         return
 
+    if is_batch_input(image_input):
+        if load_config():
+            run_image_batch(image_input, ai_api.penghitam_waifu, "penghitam", "Penghitam Waifu", tool="penghitam_waifu")
+        cyber_input("\nTekan Enter untuk kembali ke menu...")
+        return
+
     public_url = None
 
     if image_input.startswith(('http://', 'https://')):
@@ -26,7 +34,7 @@ def penghitam_waifu():
             cyber_input("Tekan Enter untuk kembali...")
             return
 
-        public_url = upload_to_imgbb_no_api(image_path=image_input)
+        public_url = upload_to_imgbb_no_api(image_path=image_input, tool="penghitam_waifu")
         
         if not public_url:
             cyber_input("Tekan Enter untuk kembali...")
@@ -38,25 +46,16 @@ def penghitam_waifu():
             cyber_input("Tekan Enter untuk kembali...")
             return
             
-        base_url = config.get("base_url")
-        api_endpoint = f"{base_url}/api/ai/negro"
-        
-        params = {
-            'url': public_url
-        }
-        
         try:
-            loading_animation("Memproses gambar dengan AI", duration=5)
-            
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'image/png'})
-            response.raise_for_status()
+            with loading_animation("Memproses gambar dengan AI") as progress:
+                image_bytes = ai_api.penghitam_waifu(public_url, progress=progress)
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_filename = f"anime_image_{timestamp}.png"
             output_path = get_output_path("output", output_filename)
 
             with open(output_path, 'wb') as f:
-                f.write(response.content)
+                f.write(image_bytes)
                 
             console.print(f"\n[bold green]✓ Gambar berhasil diubah![/bold green]")
             console.print(f"Disimpan di: [bold cyan]{output_path}[/bold cyan]")
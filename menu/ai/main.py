@@ -1,18 +1,7 @@
 # menu/ai/main.py
 
-from .functions.image_to_anime import image_to_anime
-from .functions.penghitam_waifu import penghitam_waifu
-from .functions.mistral_ai import mistral_ai
-from .functions.chatgpt_ai import chatgpt_ai
-from .functions.chatgpt_v2 import chatgpt_v2
-from .functions.deepseek_ai import deepseek_ai
-from .functions.gemini_ai import gemini_ai
-from .functions.colorize_ai import colorize_ai
-from .functions.waifu2x import waifu2x
-from .functions.txt_to_image import txt_to_image
-from .functions.txt_to_image_v2 import txt_to_image_v2
-from .functions.flux_schnell import flux_schnell
 from app.console import console, cyber_input, clear
+from core.startup import lazy_action
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -21,18 +10,18 @@ from rich.box import SQUARE
 def main():
     """Fungsi utama untuk menu AI. Ini yang dipanggil oleh main.py."""
     menu_actions = {
-        '1': image_to_anime,
-        '2': penghitam_waifu,
-        '3': mistral_ai,
-        '4': chatgpt_ai,
-        '5': chatgpt_v2,
-        '6': deepseek_ai,
-        '7': gemini_ai,
-        '8': colorize_ai,
-        '9': waifu2x,
-        '10': txt_to_image,
-        '11': txt_to_image_v2,
-        '12': flux_schnell,
+        '1': lazy_action('.functions.image_to_anime', 'image_to_anime', __package__),
+        '2': lazy_action('.functions.penghitam_waifu', 'penghitam_waifu', __package__),
+        '3': lazy_action('.functions.mistral_ai', 'mistral_ai', __package__),
+        '4': lazy_action('.functions.chatgpt_ai', 'chatgpt_ai', __package__),
+        '5': lazy_action('.functions.chatgpt_v2', 'chatgpt_v2', __package__),
+        '6': lazy_action('.functions.deepseek_ai', 'deepseek_ai', __package__),
+        '7': lazy_action('.functions.gemini_ai', 'gemini_ai', __package__),
+        '8': lazy_action('.functions.colorize_ai', 'colorize_ai', __package__),
+        '9': lazy_action('.functions.waifu2x', 'waifu2x', __package__),
+        '10': lazy_action('.functions.txt_to_image', 'txt_to_image', __package__),
+        '11': lazy_action('.functions.txt_to_image_v2', 'txt_to_image_v2', __package__),
+        '12': lazy_action('.functions.flux_schnell', 'flux_schnell', __package__),
     }
 
     while True:
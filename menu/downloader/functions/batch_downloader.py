@@ -0,0 +1,287 @@
+# menu/downloader/functions/batch_downloader.py
+
+import os
+import sys
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from rich.live import Live
+from rich.table import Table
+from rich.box import SQUARE
+from rich.markup import escape
+from core.utils import load_config, get_output_path
+from core.download import download_file, format_bytes
+from core.resolvers import resolve_media, detect_platform, media_source_key
+from core.store import get_download_store
+from core.history import record_history
+from app.console import console, print_cyber_panel, cyber_input, clear
+
+DEFAULT_WORKERS = 4
+MAX_WORKERS = 16
+MAX_VISIBLE_ROWS = 15
+
+def read_url_list(source: str) -> list:
+    """Membaca daftar URL dari file teks atau stdin ('-'); baris kosong dan '#' diabaikan."""
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#') and line not in urls:
+            urls.append(line)
+    return urls
+
+def _new_job(index: int, url: str) -> dict:
+    return {
+        'no': index + 1,
+        'url': url,
+        'platform': detect_platform(url) or '?',
+        'status': 'Menunggu',
+        'item': '',
+        'downloaded': 0,
+        'total': None,
+        'speed': 0.0,
+        'files': [],
+        'error': None,
+    }
+
+class PathReservations:
+    """
+    Nama file tujuan yang sudah dipakai pekerjaan lain dalam satu batch.
+
+    Dua URL berbeda bisa menghasilkan nama file yang sama; tanpa reservasi keduanya
+    menulis ke file .part dan jurnal yang sama. Nama berikutnya diberi akhiran " (2)", " (3)", ...
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._paths = set()
+
+    def reserve(self, path: str) -> str:
+        root, ext = os.path.splitext(path)
+        with self._lock:
+            candidate, number = path, 1
+            while os.path.normcase(os.path.abspath(candidate)) in self._paths:
+                number += 1
+                candidate = f"{root} ({number}){ext}"
+            self._paths.add(os.path.normcase(os.path.abspath(candidate)))
+        return candidate
+
+def _restore_job(job: dict, store, source_key: str, output_dir: str, reservations: PathReservations) -> bool:
+    """Mengisi job dari store bila URL ini pernah diunduh utuh; True jika berhasil."""
+    try:
+        entries = store.lookup(source_key)
+        if not entries:
+            return False
+        for digest, filename, size in entries:
+            output_path = reservations.reserve(os.path.join(output_dir, filename))
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            store.materialize(digest, output_path)
+            job['files'].append(output_path)
+            job['downloaded'] += size
+    except (OSError, sqlite3.Error):
+        job['files'], job['downloaded'] = [], 0
+        return False
+    job['total'] = job['downloaded']
+    job['item'] = 'cache'
+    return True
+
+def _remember_job(store, source_key: str, paths: list, filenames: list):
+    try:
+        entries = []
+        for path, filename in zip(paths, filenames):
+            digest, size = store.ingest(path)
+            # Nama asli dari resolver, bukan nama berakhiran " (2)" hasil reservasi batch ini.
+            entries.append((digest, filename, size))
+        store.record(source_key, entries)
+    except (OSError, sqlite3.Error):
+        pass
+
+def _existing_size(path: str) -> int:
+    """Ukuran file hasil unduhan sebelumnya di `path`, atau 0 bila belum ada/kosong."""
+    try:
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+    except OSError:
+        return 0
+
+def _run_job(job: dict, output_dir: str, quality: str, platform: str | None, reservations: PathReservations, skip_existing: bool = False):
+    job['status'] = 'Resolusi'
+    try:
+        store = get_download_store()
+        job_platform = platform or detect_platform(job['url'])
+        source_key = media_source_key(job_platform, job['url'], quality if job_platform == 'youtube' else None) if job_platform else None
+        if store is not None and source_key and _restore_job(job, store, source_key, output_dir, reservations):
+            job['status'] = 'Selesai'
+            return
+
+        platform, result, items = resolve_media(job['url'], platform=platform, quality=quality)
+        job['platform'] = platform
+        job['status'] = 'Mengunduh'
+
+        existing = 0
+        for index, item in enumerate(items):
+            output_path = reservations.reserve(os.path.join(output_dir, item['filename']))
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            job['item'] = f"{index + 1}/{len(items)}"
+
+            # download_file baru mengganti nama .part setelah selesai, jadi file yang ada pasti utuh.
+            size = _existing_size(output_path) if skip_existing else 0
+            if size:
+                job['files'].append(output_path)
+                job['downloaded'] += size
+                existing += 1
+                continue
+
+            def progress(downloaded, total, speed):
+                job['downloaded'], job['total'], job['speed'] = downloaded, total, speed
+
+            download_file(item['url'], output_path, headers=item['headers'], segments=item['segments'], progress=progress)
+            job['files'].append(output_path)
+
+        if store is not None and source_key:
+            _remember_job(store, source_key, job['files'], [item['filename'] for item in items])
+        if existing == len(items):
+            job['total'] = job['downloaded']
+            job['item'] = 'cache'
+            job['status'] = 'Selesai'
+            return
+        job['status'] = 'Selesai'
+        record_history(platform, job['url'], job['files'][0] if len(job['files']) == 1 else os.path.commonpath(job['files']), result)
+    except Exception as e:
+        job['status'] = 'Gagal'
+        job['error'] = str(e)
+
+def build_batch_table(jobs: list) -> Table:
+    finished = sum(1 for job in jobs if job['status'] == 'Selesai')
+    failed = sum(1 for job in jobs if job['status'] == 'Gagal')
+
+    table = Table(
+        show_header=True,
+        header_style="bold #00F0FF",
+        title="[bold magenta]📥 Batch Download 📥[/bold magenta]",
+        caption=f"[dim]Selesai {finished}/{len(jobs)} • Gagal {failed}[/dim]",
+        box=SQUARE,
+        border_style="#00F0FF",
+        expand=True,
+    )
+    table.add_column("No.", style="bold white", width=4, justify="center")
+    table.add_column("Platform", style="bold cyan", width=11)
+    table.add_column("URL", style="white", overflow="ellipsis", no_wrap=True)
+    table.add_column("Status", width=10)
+    table.add_column("Progres", style="white", width=28, overflow="ellipsis", no_wrap=True)
+
+    # Tampilkan pekerjaan yang sedang berjalan lebih dulu, lalu yang terakhir diproses.
+    active = [job for job in jobs if job['status'] in ('Resolusi', 'Mengunduh')]
+    others = [job for job in jobs if job['status'] not in ('Resolusi', 'Mengunduh', 'Menunggu')]
+    waiting = [job for job in jobs if job['status'] == 'Menunggu']
+    visible = (active + others[::-1] + waiting)[:MAX_VISIBLE_ROWS]
+
+    status_styles = {'Selesai': 'bold green', 'Gagal': 'bold red', 'Mengunduh': 'bold yellow', 'Resolusi': 'yellow'}
+    for job in sorted(visible, key=lambda job: job['no']):
+        if job['status'] == 'Gagal':
+            progress_text = f"[red]{escape(job['error'][:28])}[/red]"
+        elif job['downloaded']:
+            progress_text = format_bytes(job['downloaded'])
+            if job['total']:
+                progress_text += f" ({job['downloaded'] * 100 // job['total']}%)"
+            if job['status'] == 'Mengunduh':
+                progress_text += f" {format_bytes(job['speed'])}/s"
+            if job['item'] == 'cache':
+                progress_text += " • sudah ada"
+            elif job['item'] and job['item'] != '1/1':
+                progress_text = f"{job['item']} • {progress_text}"
+        else:
+            progress_text = "-"
+
+        style = status_styles.get(job['status'], 'dim')
+        table.add_row(str(job['no']), job['platform'], escape(job['url']), f"[{style}]{job['status']}[/{style}]", progress_text)
+
+    return table
+
+def run_batch(urls: list, output_dir: str, workers: int = DEFAULT_WORKERS, quality: str = '720', show_progress: bool = True,
+              platform: str | None = None, skip_existing: bool = False) -> list:
+    """
+    Mengunduh semua URL lewat pool worker terbatas dan mengembalikan status setiap pekerjaan.
+
+    Tanpa `platform`, setiap URL diarahkan ke downloader berdasarkan hostname-nya. Dengan
+    `skip_existing`, file hasil resolusi yang sudah ada (tidak kosong) di `output_dir` tidak
+    diunduh ulang; pekerjaan yang semua filenya sudah ada ditandai item 'cache', sama seperti
+    pekerjaan yang dilayani dari core.store.
+    """
+    jobs = [_new_job(i, url) for i, url in enumerate(urls)]
+    workers = max(1, min(workers, MAX_WORKERS))
+    reservations = PathReservations()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_job, job, output_dir, quality, platform, reservations, skip_existing) for job in jobs]
+        if show_progress:
+            with Live(build_batch_table(jobs), console=console, refresh_per_second=4) as live:
+                while not all(future.done() for future in futures):
+                    time.sleep(0.25)
+                    live.update(build_batch_table(jobs))
+                live.update(build_batch_table(jobs))
+
+    return jobs
+
+def _prompt_urls() -> list:
+    console.print("[dim]Masukkan URL satu per baris. Baris kosong untuk selesai.[/dim]")
+    urls = []
+    while True:
+        line = cyber_input(f"URL #{len(urls) + 1}")
+        if not line:
+            return urls
+        if line not in urls:
+            urls.append(line)
+
+def batch_downloader():
+
+    clear()
+    print_cyber_panel("Batch Downloader", "Unduh banyak URL (TikTok, Instagram, YouTube, Mega, ...) sekaligus")
+
+    source = cyber_input("Path file daftar URL, kosongkan untuk input manual, atau ketik '00' untuk kembali")
+
+    if source == '00':
+        return
+
+    try:
+        urls = read_url_list(source) if source else _prompt_urls()
+    except OSError as e:
+        console.print(f"[bold red]Gagal membaca daftar URL:[/bold red] {e}")
+        cyber_input("Tekan Enter untuk kembali...")
+        return
+
+    if not urls:
+        console.print("[bold red]Tidak ada URL untuk diunduh.[/bold red]")
+        cyber_input("Tekan Enter untuk kembali...")
+        return
+
+    config = load_config()
+    if not config or not config.get("base_url"):
+        console.print("[bold red]Error: Konfigurasi atau base_url tidak ditemukan.[/bold red]")
+        cyber_input("Tekan Enter untuk kembali...")
+        return
+
+    workers_input = cyber_input(f"Jumlah unduhan paralel (default: {DEFAULT_WORKERS}, maks: {MAX_WORKERS})")
+    workers = int(workers_input) if workers_input.isdigit() and int(workers_input) > 0 else DEFAULT_WORKERS
+
+    dummy_path = get_output_path("downloads", "dummy.txt")
+    downloads_dir = os.path.dirname(dummy_path)
+
+    unknown = [url for url in urls if not detect_platform(url)]
+    if unknown:
+        console.print(f"[yellow]{len(unknown)} URL tidak dikenali platformnya dan akan ditandai gagal.[/yellow]")
+
+    jobs = run_batch(urls, downloads_dir, workers=workers)
+
+    finished = [job for job in jobs if job['status'] == 'Selesai']
+    console.print(f"\n[bold green]✓ {len(finished)} dari {len(jobs)} URL berhasil diunduh.[/bold green]")
+    console.print(f"[bold cyan]Lokasi:[/bold cyan] {downloads_dir}")
+
+    console.print("[dim]Setiap URL yang berhasil tercatat di riwayat unduhan (python main.py history).[/dim]")
+
+    cyber_input("\nTekan Enter untuk kembali ke menu...")
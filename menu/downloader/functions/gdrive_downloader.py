@@ -2,11 +2,12 @@
 
 import os
 import requests
-import json
-from urllib.parse import quote
-from datetime import datetime
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import downloader as downloader_api
+from core.download import download_file, DEFAULT_SEGMENTS
+from core.history import record_history
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Group
@@ -50,13 +51,7 @@ def gdrive_downloader():
                 cyber_input("Tekan Enter untuk kembali...")
                 return
 
-            api_endpoint = f"{config.get('base_url')}/api/downloader/gdrive"
-            
-            encoded_url = quote(url_input)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}")
-            response.raise_for_status()
-            result = response.json()
+            result = downloader_api.gdrive(url_input)
 
         if result.get("fileName"):
 
@@ -71,30 +66,15 @@ def gdrive_downloader():
                 return
 
             output_path = get_output_path("downloads", filename)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
 
-            with console.status("[bold green]Mengunduh file...[/bold green]", spinner="dots"):
-                file_response = requests.get(download_url, stream=True, headers=headers)
-                file_response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in file_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with console.status("[bold green]Mengunduh file...[/bold green]", spinner="dots") as status:
+                download_file(download_url, output_path, source_key=media_source_key('gdrive', url_input), segments=DEFAULT_SEGMENTS, progress=status_progress(status, "Mengunduh file..."))
             
             console.print(f"\n[bold green]✓ File berhasil diunduh![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"gdrive_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('gdrive', url_input, output_path, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
         else:
             console.print(f"[bold red]Gagal mengambil informasi file.[/bold red]")
             console.print(f"Detail dari server: {result}")
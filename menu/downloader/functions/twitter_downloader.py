@@ -2,11 +2,12 @@
 
 import os
 import requests
-import json
-from urllib.parse import quote
 from datetime import datetime
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import downloader as downloader_api
+from core.history import record_history
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, download_items_live
 
 def twitter_downloader():
     clear()
@@ -31,13 +32,7 @@ def twitter_downloader():
                 cyber_input("Tekan Enter untuk kembali...")
                 return
 
-            api_endpoint = f"{base_url}/api/downloader/twitter"
-
-            encoded_url = quote(url_input)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}")
-            response.raise_for_status()
-            result = response.json()
+            result = downloader_api.twitter(url_input)
 
         if result.get("status") and result.get("media"):
             media_list = result.get("media", [])
@@ -58,46 +53,30 @@ def twitter_downloader():
             post_dir = os.path.join(downloads_dir, post_folder_name)
             os.makedirs(post_dir, exist_ok=True)
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            downloaded_count = 0
-            with console.status("[bold green]Mengunduh media...[/bold green]", spinner="dots"):
-                for i, media_url in enumerate(media_list):
-                    try:
-
-                        if media_type == "image":
-                            ext = ".jpg"
-                        elif media_type == "video":
-                            ext = ".mp4"
-                        else:
-                            ext = "" 
-                        
-                        filename = f"media_{i+1}{ext}"
-                        output_path = os.path.join(post_dir, filename)
-
-                        media_response = requests.get(media_url, stream=True, headers=headers)
-                        media_response.raise_for_status()
-                        
-                        with open(output_path, 'wb') as f:
-                            for chunk in media_response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        downloaded_count += 1
-                    except requests.exceptions.RequestException:
-                        console.print(f"[yellow]Gagal mengunduh media ke-{i+1}. Melewati.[/yellow]")
+            if media_type == "image":
+                ext = ".jpg"
+            elif media_type == "video":
+                ext = ".mp4"
+            else:
+                ext = ""
+
+            items = [
+                {
+                    "url": media_url,
+                    "output_path": os.path.join(post_dir, f"media_{i+1}{ext}"),
+                    "source_key": media_source_key('twitter', url_input, str(i + 1)),
+                }
+                for i, media_url in enumerate(media_list)
+            ]
+
+            results = download_items_live(items, "[bold magenta]📥 Media Twitter 📥[/bold magenta]")
+            downloaded_count = sum(1 for item in results if not item['error'])
             
             console.print(f"\n[bold green]✓ Berhasil mengunduh {downloaded_count} media![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {post_dir}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"twitter_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('twitter', url_input, post_dir, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
         else:
             console.print(f"[bold red]Gagal mengambil informasi media.[/bold red]")
             console.print(f"Detail dari server: {result}")
@@ -2,11 +2,12 @@
 
 import os
 import requests
-import json
-from urllib.parse import quote
-from datetime import datetime
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import downloader as downloader_api
+from core.download import download_file
+from core.history import record_history
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -121,14 +122,7 @@ def youtube_mp4_downloader():
                 cyber_input("Tekan Enter untuk kembali...")
                 return
 
-            base_url = config.get("base_url")
-            api_endpoint = f"{base_url}/api/downloader/ytmp4"
-
-            encoded_url = quote(url_input)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}&quality={quality}")
-            response.raise_for_status()
-            result = response.json()
+            result = downloader_api.ytmp4(url_input, quality)
 
         if result.get("title"):
 
@@ -147,29 +141,14 @@ def youtube_mp4_downloader():
 
             output_path = get_output_path("downloads", filename)
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            with console.status("[bold green]Mengunduh video...[/bold green]", spinner="dots"):
-                video_response = requests.get(download_url, stream=True, headers=headers)
-                video_response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in video_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with console.status("[bold green]Mengunduh video...[/bold green]", spinner="dots") as status:
+                download_file(download_url, output_path, source_key=media_source_key('youtube', url_input, quality), progress=status_progress(status, "Mengunduh video..."))
             
             console.print(f"\n[bold green]✓ Video berhasil diunduh![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"youtube_mp4_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('youtube_mp4', url_input, output_path, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
         else:
             console.print(f"[bold red]Gagal mengambil informasi video.[/bold red]")
             console.print(f"Detail dari server: {result}")
@@ -1,21 +1,7 @@
 # menu/downloader/main.py
 
-from .functions.bilibili_downloader import bilibili_downloader
-from .functions.youtube_mp3_downloader import youtube_mp3_downloader
-from .functions.youtube_mp4_downloader import youtube_mp4_downloader
-from .functions.spotify_downloader import spotify_downloader
-from .functions.soundcloud_downloader import soundcloud_downloader
-from .functions.facebook_downloader import facebook_downloader
-from .functions.threads_downloader import threads_downloader
-from .functions.instagram_downloader import instagram_downloader
-from .functions.mega_downloader import mega_downloader
-from .functions.tiktok_downloader import tiktok_downloader
-from .functions.tiktok_downloader_v2 import tiktok_downloader_v2
-from .functions.mediafire_downloader import mediafire_downloader
-from .functions.krakenfiles_downloader import krakenfiles_downloader
-from .functions.gdrive_downloader import gdrive_downloader
-from .functions.twitter_downloader import twitter_downloader
 from app.console import console, cyber_input, clear
+from core.startup import lazy_action
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -23,21 +9,22 @@ from rich.box import SQUARE
 def main():
     """Fungsi utama untuk menu Downloader. Ini yang dipanggil oleh main.py."""
     menu_actions = {
-        '1': bilibili_downloader,
-        '2': youtube_mp3_downloader,
-        '3': youtube_mp4_downloader,
-        '4': spotify_downloader,
-        '5': soundcloud_downloader,
-        '6': facebook_downloader,
-        '7': threads_downloader,
-        '8': instagram_downloader,
-        '9': mega_downloader,
-        '10': tiktok_downloader,
-        '11': tiktok_downloader_v2,
-        '12': mediafire_downloader,
-        '13': krakenfiles_downloader,
-        '14': gdrive_downloader,
-        '15': twitter_downloader,
+        '1': lazy_action('.functions.bilibili_downloader', 'bilibili_downloader', __package__),
+        '2': lazy_action('.functions.youtube_mp3_downloader', 'youtube_mp3_downloader', __package__),
+        '3': lazy_action('.functions.youtube_mp4_downloader', 'youtube_mp4_downloader', __package__),
+        '4': lazy_action('.functions.spotify_downloader', 'spotify_downloader', __package__),
+        '5': lazy_action('.functions.soundcloud_downloader', 'soundcloud_downloader', __package__),
+        '6': lazy_action('.functions.facebook_downloader', 'facebook_downloader', __package__),
+        '7': lazy_action('.functions.threads_downloader', 'threads_downloader', __package__),
+        '8': lazy_action('.functions.instagram_downloader', 'instagram_downloader', __package__),
+        '9': lazy_action('.functions.mega_downloader', 'mega_downloader', __package__),
+        '10': lazy_action('.functions.tiktok_downloader', 'tiktok_downloader', __package__),
+        '11': lazy_action('.functions.tiktok_downloader_v2', 'tiktok_downloader_v2', __package__),
+        '12': lazy_action('.functions.mediafire_downloader', 'mediafire_downloader', __package__),
+        '13': lazy_action('.functions.krakenfiles_downloader', 'krakenfiles_downloader', __package__),
+        '14': lazy_action('.functions.gdrive_downloader', 'gdrive_downloader', __package__),
+        '15': lazy_action('.functions.twitter_downloader', 'twitter_downloader', __package__),
+        '16': lazy_action('.functions.batch_downloader', 'batch_downloader', __package__),
     }
 
     while True:
@@ -75,6 +62,7 @@ def main():
             {"name": "KrakenFiles DL", "desc": "Unduh file dari KrakenFiles."},
             {"name": "Google Drive DL", "desc": "Unduh file dari Google Drive."},
             {"name": "Twitter DL", "desc": "Unduh media (gambar/video) dari Twitter."},
+            {"name": "Batch DL", "desc": "Unduh banyak URL sekaligus dari file atau daftar."},
         ]
         
         for i, item in enumerate(downloader_options):
@@ -1,6 +1,7 @@
 import requests
 import webbrowser
 from core.utils import load_config
+from core.api import search as search_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.panel import Panel
 from rich.text import Text
@@ -134,8 +135,6 @@ def bilibili_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    api_endpoint = f"{config.get('base_url')}/api/search/bilibili"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -144,10 +143,7 @@ def bilibili_search():
 
         try:
             with console.status("[bold green]Mencari video...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                result = response.json()
+                result = search_api.bilibili(query)
 
             if result and isinstance(result, list) and len(result) > 0:
 
@@ -3,6 +3,7 @@ from datetime import datetime
 
 # Import fungsi konfigurasi dan console
 from core.utils import load_config
+from core.api import search as search_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 
 # Import komponen Rich
@@ -15,11 +16,8 @@ from rich.box import SQUARE
 def get_bmkg_data(config):
     """Mengambil data dari API BMKG."""
     try:
-        api_endpoint = f"{config.get('base_url')}/api/search/bmkg"
         with console.status("[bold green]Mengambil data dari BMKG...[/bold green]", spinner="dots"):
-            response = requests.get(api_endpoint, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            return response.json()
+            return search_api.bmkg()
     except requests.exceptions.RequestException as e:
         console.print(f"\n[bold red]Error saat menghubungi API:[/bold red] {e}")
         return None
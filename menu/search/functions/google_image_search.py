@@ -1,10 +1,11 @@
 import requests
 import os
-import json
-from datetime import datetime
-from urllib.parse import quote
 
 from core.utils import load_config, get_output_path
+from core.api import search as search_api
+from core.download import download_file
+from core.history import record_history
+from core.resolvers import media_source_key
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.table import Table
 from rich.panel import Panel
@@ -50,28 +51,13 @@ def download_image(image_url, title):
             
             output_path = get_output_path("downloads", filename)
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(image_url, stream=True, headers=headers)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            download_file(image_url, output_path, source_key=media_source_key('gimage', image_url))
         
         console.print(f"\n[bold green]✓ Gambar berhasil diunduh![/bold green]")
         console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"google_image_download_log_{timestamp}.json"
-        log_path = get_output_path("output", log_filename, no_prompt=True)
-        
-        with open(log_path, 'w') as f:
-            json.dump({"title": title, "url": image_url, "saved_at": output_path}, f, indent=4)
-        
-        console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+        if record_history('google_image', image_url, output_path, {"title": title, "url": image_url, "saved_at": output_path}):
+            console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
         return True
     except requests.exceptions.RequestException as e:
         console.print(f"\n[bold red]Error saat mengunduh gambar:[/bold red] {e}")
@@ -197,8 +183,6 @@ def google_image_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    search_api_endpoint = f"{config.get('base_url')}/api/search/gimage"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -207,10 +191,7 @@ def google_image_search():
 
         try:
             with console.status("[bold green]Mencari gambar di Google...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(search_api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                search_result = response.json()
+                search_result = search_api.google_image(query)
 
             if search_result and isinstance(search_result, list):
                 images = search_result
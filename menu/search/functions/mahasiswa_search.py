@@ -1,7 +1,7 @@
 import requests
 import re
-from urllib.parse import quote
 from core.utils import load_config
+from core.api import search as search_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.panel import Panel
 from rich.text import Text
@@ -12,12 +12,8 @@ from rich.box import SQUARE
 def get_mahasiswa_data(config, query):
     """Mengambil data mahasiswa dari API."""
     try:
-        api_endpoint = f"{config.get('base_url')}/api/search/mahasiswa"
         with console.status("[bold green]Mencari data mahasiswa...[/bold green]", spinner="dots"):
-            params = {'query': query}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            return response.json()
+            return search_api.mahasiswa(query)
     except requests.exceptions.RequestException as e:
         console.print(f"\n[bold red]Error saat menghubungi API:[/bold red] {e}")
         return None
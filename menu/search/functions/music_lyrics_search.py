@@ -1,9 +1,9 @@
 import requests
 import json
-from urllib.parse import quote
 
 # Import fungsi konfigurasi dan console
 from core.utils import load_config
+from core.api import search as search_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 
 # Import komponen Rich
@@ -16,12 +16,8 @@ from rich.box import SQUARE
 def get_lyrics_data(config, query):
     """Mengambil data lirik dari API."""
     try:
-        api_endpoint = f"{config.get('base_url')}/api/search/lyrics"
         with console.status("[bold green]Mencari lirik...[/bold green]", spinner="dots"):
-            params = {'query': query}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            return response.json()
+            return search_api.lyrics(query)
     except requests.exceptions.RequestException as e:
         console.print(f"\n[bold red]Error saat menghubungi API:[/bold red] {e}")
         return None
@@ -3,7 +3,11 @@ import os
 import webbrowser
 from datetime import datetime
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import search as search_api
+from core.download import download_file
+from core.prefetch import prefetch_files
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Group
@@ -24,6 +28,11 @@ def display_pinterest_list(images, query, page=1, per_page=5):
     start_index = (page - 1) * per_page
     end_index = min(start_index + per_page, len(images))
     current_page_data = images[start_index:end_index]
+    # Gambar di halaman ini diunduh ke area sementara di latar belakang; "Unduh" lalu tinggal memindahkannya.
+    prefetch_files([
+        (image['directLink'], media_source_key('pinterest', image['directLink']))
+        for image in current_page_data if image.get('directLink')
+    ])
     
     image_panels = []
     
@@ -141,19 +150,10 @@ def display_image_detail(image_data, page):
             filename = f"pinterest_{safe_query}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
             
             output_path = get_output_path("downloads", filename)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
 
             try:
-                with console.status("[bold green]Mengunduh gambar...[/bold green]", spinner="dots"):
-                    image_response = requests.get(image_url_to_download, stream=True, headers=headers)
-                    image_response.raise_for_status()
-                    
-                    with open(output_path, 'wb') as f:
-                        for chunk in image_response.iter_content(chunk_size=8192):
-                            f.write(chunk)
+                with console.status("[bold green]Mengunduh gambar...[/bold green]", spinner="dots") as status:
+                    download_file(image_url_to_download, output_path, source_key=media_source_key('pinterest', image_url_to_download), progress=status_progress(status, "Mengunduh gambar..."))
                 
                 console.print(f"\n[bold green]✓ Gambar berhasil diunduh![/bold green]")
                 console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
@@ -194,8 +194,6 @@ def pinterest_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    search_api_endpoint = f"{config.get('base_url')}/api/search/pinterest"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -204,10 +202,7 @@ def pinterest_search():
 
         try:
             with console.status("[bold green]Mencari gambar...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(search_api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                search_result = response.json()
+                search_result = search_api.pinterest(query)
 
             if not (search_result and isinstance(search_result, list) and len(search_result) > 0):
                 console.print("[bold red]Tidak ada hasil yang ditemukan.[/bold red]")
@@ -1,10 +1,13 @@
 import requests
 import os
-import json
-from datetime import datetime
-from urllib.parse import quote
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import downloader as downloader_api
+from core.api import search as search_api
+from core.download import download_file
+from core.history import record_history
+from core.prefetch import prefetch_calls, prefetched
+from core.resolvers import media_source_key, safe_filename
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Group
@@ -12,6 +15,8 @@ from rich.align import Align
 from rich.table import Table
 from rich.box import SQUARE
 
+SEARCH_PAGE_SIZE = 5
+
 def display_spotify_info(data):
     clear()
     info_items = []
@@ -171,14 +176,7 @@ def download_spotify_track(track_url, track_name, artists):
                 console.print("[bold red]Error: Konfigurasi atau base_url tidak ditemukan.[/bold red]")
                 return False
 
-            base_url = config.get("base_url")
-            api_endpoint = f"{base_url}/api/downloader/spotify"
-            
-            encoded_url = quote(track_url)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}")
-            response.raise_for_status()
-            result = response.json()
+            result = prefetched(downloader_api.spotify, track_url)
 
         if result.get("success"):
             display_downloaded_track_info(result)
@@ -194,29 +192,14 @@ def download_spotify_track(track_url, track_name, artists):
 
             output_path = get_output_path("downloads", filename)
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            with console.status("[bold green]Mengunduh audio...[/bold green]", spinner="dots"):
-                audio_response = requests.get(download_url, stream=True, headers=headers)
-                audio_response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in audio_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with console.status("[bold green]Mengunduh audio...[/bold green]", spinner="dots") as status:
+                download_file(download_url, output_path, source_key=media_source_key('spotify', track_url), progress=status_progress(status, "Mengunduh audio..."))
             
             console.print(f"\n[bold green]✓ Audio berhasil diunduh![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"spotify_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('spotify', track_url, output_path, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
             return True
         else:
             console.print(f"[bold red]Gagal mengambil informasi lagu.[/bold red]")
@@ -230,6 +213,123 @@ def download_spotify_track(track_url, track_name, artists):
         console.print(f"\n[bold red]Terjadi kesalahan tak terduga:[/bold red] {e}")
         return False
 
+def _track_entry(track: dict) -> dict | None:
+    url = track.get("url") or track.get("external_urls", {}).get("spotify", "")
+    if not url:
+        return None
+    artists = track.get("artists") or []
+    if isinstance(artists, str):
+        artists = [artists]
+    artists = [artist.get("name", "") if isinstance(artist, dict) else artist for artist in artists]
+    return {"url": url, "name": track.get("name") or track.get("title") or url, "artists": [a for a in artists if a]}
+
+def _track_list(tracks) -> list:
+    entries, seen = [], set()
+    for track in tracks or []:
+        entry = _track_entry(track) if isinstance(track, dict) else None
+        if entry and entry["url"] not in seen:
+            seen.add(entry["url"])
+            entries.append(entry)
+    return entries
+
+def fetch_collection_tracks(collection: dict, kind: str) -> list:
+    """
+    Mengambil daftar lagu album/playlist sebagai [{'url', 'name', 'artists'}].
+
+    Urutan sumber: daftar `tracks` di hasil pencarian, respons /api/downloader/spotify
+    untuk URL album/playlist, lalu (khusus album) pencarian `album:"..." artist:"..."`
+    yang disaring berdasarkan nama album.
+    """
+    tracks = collection.get("tracks")
+    if isinstance(tracks, dict):
+        tracks = tracks.get("items")
+    entries = _track_list(tracks)
+    if entries:
+        return entries
+
+    url = collection.get("url", "")
+    if url:
+        try:
+            result = downloader_api.spotify(url)
+            data = result.get("data", result) if isinstance(result, dict) else {}
+            entries = _track_list(data.get("tracks") if isinstance(data, dict) else None)
+            if entries:
+                return entries
+        except requests.exceptions.RequestException:
+            pass
+
+    if kind == "album" and collection.get("name"):
+        name = collection["name"]
+        query = f'album:"{name}"'
+        if collection.get("artists"):
+            query += f' artist:"{collection["artists"][0]}"'
+        result = search_api.spotify(query) or {}
+        return _track_list(
+            track for track in result.get("tracks", [])
+            if track.get("album", {}).get("name", "").lower() == name.lower()
+        )
+    return []
+
+def build_collection_summary(title: str, entries: list, jobs: list) -> Table:
+    """Tabel ringkasan setelah unduhan album/playlist: diunduh, dilewati, atau gagal per lagu."""
+    from rich.markup import escape
+    from core.download import format_bytes
+
+    table = Table(show_header=True, header_style="bold #00F0FF", title=title, box=SQUARE, border_style="#00F0FF", expand=True)
+    table.add_column("No.", style="bold white", width=4, justify="center")
+    table.add_column("Lagu", style="white", overflow="ellipsis", no_wrap=True)
+    table.add_column("Status", width=16)
+    table.add_column("Keterangan", style="white", width=28, overflow="ellipsis", no_wrap=True)
+
+    for entry, job in zip(entries, jobs):
+        label = entry["name"] + (f" - {', '.join(entry['artists'])}" if entry["artists"] else "")
+        if job["status"] != "Selesai":
+            status, detail = "[bold red]Gagal[/bold red]", f"[red]{escape(job['error'] or '')}[/red]"
+        elif job["item"] == "cache":
+            status, detail = "[dim]Dilewati[/dim]", f"sudah ada • {format_bytes(job['downloaded'])}"
+        else:
+            status, detail = "[bold green]Diunduh[/bold green]", format_bytes(job["downloaded"])
+        table.add_row(str(job["no"]), escape(label), status, detail)
+    return table
+
+def download_spotify_collection(name: str, entries: list):
+    """
+    Mengunduh semua lagu album/playlist sekaligus lewat pool worker batch downloader.
+
+    Setiap worker menjalankan resolusi metadata /api/downloader/spotify lalu langsung
+    mengunduh audionya, jadi resolusi lagu berikutnya berjalan bersamaan dengan unduhan
+    lagu lain. Lagu yang file-nya sudah ada di folder album dilewati tanpa diunduh ulang;
+    bila core.store aktif (ZEROTOOLS_DEDUP=1), lagu yang pernah diunduh bahkan tidak perlu diresolusi.
+    """
+    from menu.downloader.functions.batch_downloader import DEFAULT_WORKERS, MAX_WORKERS, run_batch
+
+    if not entries:
+        console.print("[bold red]Daftar lagu tidak tersedia dari API.[/bold red]")
+        return
+
+    console.print(f"[bold cyan]{len(entries)} lagu akan diunduh.[/bold cyan]")
+    workers_input = cyber_input(f"Jumlah unduhan paralel (default: {DEFAULT_WORKERS}, maks: {MAX_WORKERS})")
+    workers = int(workers_input) if workers_input.isdigit() and int(workers_input) > 0 else DEFAULT_WORKERS
+
+    output_dir = os.path.join(os.path.dirname(get_output_path("downloads", "dummy.txt")), safe_filename(name) or "spotify")
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = run_batch([entry["url"] for entry in entries], output_dir, workers=workers, platform="spotify", skip_existing=True)
+
+    clear()
+    console.print(build_collection_summary(f"[bold magenta]🎶 {name} 🎶[/bold magenta]", entries, jobs))
+    downloaded = sum(1 for job in jobs if job["status"] == "Selesai" and job["item"] != "cache")
+    skipped = sum(1 for job in jobs if job["status"] == "Selesai" and job["item"] == "cache")
+    failed = len(jobs) - downloaded - skipped
+    console.print(f"\n[bold green]✓ {downloaded} diunduh[/bold green] • [dim]{skipped} dilewati[/dim] • [bold red]{failed} gagal[/bold red]")
+    console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_dir}")
+
+def _download_collection_action(collection: dict, kind: str):
+    with console.status("[bold green]Mengambil daftar lagu...[/bold green]", spinner="dots"):
+        entries = prefetched(fetch_collection_tracks, collection, kind)
+    download_spotify_collection(collection.get("name") or f"spotify_{kind}", entries)
+    cyber_input("Tekan Enter untuk melanjutkan...")
+
 def display_downloaded_track_info(data):
     clear()
     metadata = data.get("metadata", {})
@@ -260,18 +360,21 @@ def display_downloaded_track_info(data):
     )
     console.print(panel)
 
-def display_tracks_with_options(tracks, page=1, per_page=5):
+def display_tracks_with_options(results, page=1):
     """Menampilkan daftar lagu dengan pagination."""
     clear()
     console.print("[bold green]Daftar Lagu Spotify:[/bold green]")
     
     # Hitung total halaman
-    total_pages = (len(tracks) + per_page - 1) // per_page
+    page = results.clamp(page)
+    per_page = results.page_size
+    total_pages = results.total_pages
     
     # Ambil data untuk halaman saat ini
     start_index = (page - 1) * per_page
-    end_index = min(start_index + per_page, len(tracks))
-    current_page_data = tracks[start_index:end_index]
+    current_page_data = results.page(page)
+    tracks = results.items
+    prefetch_calls([(downloader_api.spotify, track["url"]) for track in current_page_data if track.get("url")])
     
     track_panels = []
     
@@ -301,8 +404,8 @@ def display_tracks_with_options(tracks, page=1, per_page=5):
     
     # Tampilkan informasi pagination
     pagination_info = Text.assemble(
-        (f"Halaman {page} dari {total_pages} ", "bold cyan"),
-        (f"({len(tracks)} total)", "dim")
+        (f"Halaman {page} dari {total_pages or '?'} ", "bold cyan"),
+        (f"({results.total or f'{len(tracks)}+'} total)", "dim")
     )
     
     console.print(Panel(
@@ -325,10 +428,11 @@ def display_tracks_with_options(tracks, page=1, per_page=5):
     if page > 1:
         navigation_table.add_row("P", f"Halaman sebelumnya ({page-1})")
     
-    if page < total_pages:
+    if results.has_next(page):
         navigation_table.add_row("N", f"Halaman berikutnya ({page+1})")
     
     navigation_table.add_row("D", "Unduh lagu")
+    navigation_table.add_row("A", "Unduh semua lagu hasil pencarian")
     navigation_table.add_row("00", "Kembali ke pencarian")
     
     console.print(navigation_table)
@@ -342,9 +446,16 @@ def display_tracks_with_options(tracks, page=1, per_page=5):
         # Navigasi pagination
         elif choice.upper() == 'P' and page > 1:
             return 'prev_page', page - 1
-        elif choice.upper() == 'N' and page < total_pages:
+        elif choice.upper() == 'N' and results.has_next(page):
             return 'next_page', page + 1
         
+        elif choice.upper() == 'A':
+            with console.status("[bold green]Mengambil semua hasil pencarian...[/bold green]", spinner="dots"):
+                all_tracks = results.load_all()
+            download_spotify_collection("spotify_search", _track_list(all_tracks))
+            cyber_input("Tekan Enter untuk melanjutkan...")
+            return 'downloaded', page
+
         # Unduh lagu
         elif choice.upper() == 'D':
             track_choice = cyber_input("Pilih nomor lagu untuk diunduh: ")
@@ -412,16 +523,18 @@ def display_tracks_with_options(tracks, page=1, per_page=5):
                 cyber_input("Tekan Enter untuk melanjutkan...")
     
 
-def display_albums_with_options(albums, page=1, per_page=5):
+def display_albums_with_options(results, page=1):
     """Menampilkan daftar album dengan pagination."""
     clear()
     console.print("[bold green]Daftar Album Spotify:[/bold green]")
     
-    total_pages = (len(albums) + per_page - 1) // per_page
+    page = results.clamp(page)
+    per_page = results.page_size
+    total_pages = results.total_pages
     
     start_index = (page - 1) * per_page
-    end_index = min(start_index + per_page, len(albums))
-    current_page_data = albums[start_index:end_index]
+    current_page_data = results.page(page)
+    albums = results.items
     
     album_panels = []
     
@@ -450,8 +563,8 @@ def display_albums_with_options(albums, page=1, per_page=5):
         album_panels.append(album_panel)
     
     pagination_info = Text.assemble(
-        (f"Halaman {page} dari {total_pages} ", "bold cyan"),
-        (f"({len(albums)} total)", "dim")
+        (f"Halaman {page} dari {total_pages or '?'} ", "bold cyan"),
+        (f"({results.total or f'{len(albums)}+'} total)", "dim")
     )
     
     console.print(Panel(
@@ -473,7 +586,7 @@ def display_albums_with_options(albums, page=1, per_page=5):
     if page > 1:
         navigation_table.add_row("P", f"Halaman sebelumnya ({page-1})")
     
-    if page < total_pages:
+    if results.has_next(page):
         navigation_table.add_row("N", f"Halaman berikutnya ({page+1})")
     
     navigation_table.add_row("00", "Kembali ke pencarian")
@@ -488,7 +601,7 @@ def display_albums_with_options(albums, page=1, per_page=5):
         
         elif choice.upper() == 'P' and page > 1:
             return 'prev_page', page - 1
-        elif choice.upper() == 'N' and page < total_pages:
+        elif choice.upper() == 'N' and results.has_next(page):
             return 'next_page', page + 1
 
         else:
@@ -499,14 +612,20 @@ def display_albums_with_options(albums, page=1, per_page=5):
                 if 0 <= global_index < len(albums):
                     selected_album = albums[global_index]
                     display_album_info(selected_album)
+                    # Daftar lagu hanya diambil untuk album yang dibuka, selagi pilihannya dibaca.
+                    prefetch_calls([(fetch_collection_tracks, selected_album, "album")])
                     
                     console.print("\n[bold cyan]Pilihan untuk album ini:[/bold cyan]")
+                    console.print("[bold cyan]A[/bold cyan][white]Unduh seluruh album[/white]")
                     console.print("[bold cyan]00[/bold cyan][white]Kembali ke daftar[/white]")
                     
                     action = cyber_input("Masukkan pilihan: ")
                     
                     if action == '00':
-                        return 'back_to_list'
+                        return 'back_to_list', page
+                    elif action.upper() == 'A':
+                        _download_collection_action(selected_album, "album")
+                        return 'downloaded', page
                     else:
                         console.print("[red]Pilihan tidak valid.[/red]")
                         cyber_input("Tekan Enter untuk melanjutkan...")
@@ -514,16 +633,18 @@ def display_albums_with_options(albums, page=1, per_page=5):
                 console.print("[red]Input tidak valid. Masukkan nomor album, P, N, atau 00.[/red]")
                 cyber_input("Tekan Enter untuk melanjutkan...")
     
-def display_artists_with_options(artists, page=1, per_page=5):
+def display_artists_with_options(results, page=1):
     """Menampilkan daftar artis dengan pagination."""
     clear()
     console.print("[bold green]Daftar Artis Spotify:[/bold green]")
 
-    total_pages = (len(artists) + per_page - 1) // per_page
+    page = results.clamp(page)
+    per_page = results.page_size
+    total_pages = results.total_pages
 
     start_index = (page - 1) * per_page
-    end_index = min(start_index + per_page, len(artists))
-    current_page_data = artists[start_index:end_index]
+    current_page_data = results.page(page)
+    artists = results.items
     
     artist_panels = []
     
@@ -552,8 +673,8 @@ def display_artists_with_options(artists, page=1, per_page=5):
         artist_panels.append(artist_panel)
     
     pagination_info = Text.assemble(
-        (f"Halaman {page} dari {total_pages} ", "bold cyan"),
-        (f"({len(artists)} total)", "dim")
+        (f"Halaman {page} dari {total_pages or '?'} ", "bold cyan"),
+        (f"({results.total or f'{len(artists)}+'} total)", "dim")
     )
     
     console.print(Panel(
@@ -575,7 +696,7 @@ def display_artists_with_options(artists, page=1, per_page=5):
     if page > 1:
         navigation_table.add_row("P", f"Halaman sebelumnya ({page-1})")
     
-    if page < total_pages:
+    if results.has_next(page):
         navigation_table.add_row("N", f"Halaman berikutnya ({page+1})")
     
     navigation_table.add_row("00", "Kembali ke pencarian")
@@ -590,7 +711,7 @@ def display_artists_with_options(artists, page=1, per_page=5):
         
         elif choice.upper() == 'P' and page > 1:
             return 'prev_page', page - 1
-        elif choice.upper() == 'N' and page < total_pages:
+        elif choice.upper() == 'N' and results.has_next(page):
             return 'next_page', page + 1
 
         else:
@@ -617,16 +738,18 @@ def display_artists_with_options(artists, page=1, per_page=5):
                 console.print("[red]Input tidak valid. Masukkan nomor artis, P, N, atau 00.[/red]")
                 cyber_input("Tekan Enter untuk melanjutkan...")
     
-def display_playlists_with_options(playlists, page=1, per_page=5):
+def display_playlists_with_options(results, page=1):
     """Menampilkan daftar playlist dengan pagination."""
     clear()
     console.print("[bold green]Daftar Playlist Spotify:[/bold green]")
 
-    total_pages = (len(playlists) + per_page - 1) // per_page
+    page = results.clamp(page)
+    per_page = results.page_size
+    total_pages = results.total_pages
 
     start_index = (page - 1) * per_page
-    end_index = min(start_index + per_page, len(playlists))
-    current_page_data = playlists[start_index:end_index]
+    current_page_data = results.page(page)
+    playlists = results.items
     
     playlist_panels = []
     
@@ -658,8 +781,8 @@ def display_playlists_with_options(playlists, page=1, per_page=5):
         playlist_panels.append(playlist_panel)
 
     pagination_info = Text.assemble(
-        (f"Halaman {page} dari {total_pages} ", "bold cyan"),
-        (f"({len(playlists)} total)", "dim")
+        (f"Halaman {page} dari {total_pages or '?'} ", "bold cyan"),
+        (f"({results.total or f'{len(playlists)}+'} total)", "dim")
     )
     
     console.print(Panel(
@@ -681,7 +804,7 @@ def display_playlists_with_options(playlists, page=1, per_page=5):
     if page > 1:
         navigation_table.add_row("P", f"Halaman sebelumnya ({page-1})")
     
-    if page < total_pages:
+    if results.has_next(page):
         navigation_table.add_row("N", f"Halaman berikutnya ({page+1})")
     
     navigation_table.add_row("00", "Kembali ke pencarian")
@@ -696,7 +819,7 @@ def display_playlists_with_options(playlists, page=1, per_page=5):
 
         elif choice.upper() == 'P' and page > 1:
             return 'prev_page', page - 1
-        elif choice.upper() == 'N' and page < total_pages:
+        elif choice.upper() == 'N' and results.has_next(page):
             return 'next_page', page + 1
 
         else:
@@ -708,14 +831,19 @@ def display_playlists_with_options(playlists, page=1, per_page=5):
                 if 0 <= global_index < len(playlists):
                     selected_playlist = playlists[global_index]
                     display_playlist_info(selected_playlist)
+                    prefetch_calls([(fetch_collection_tracks, selected_playlist, "playlist")])
                     
                     console.print("\n[bold cyan]Pilihan untuk playlist ini:[/bold cyan]")
+                    console.print("[bold cyan]A[/bold cyan][white]Unduh seluruh playlist[/white]")
                     console.print("[bold cyan]00[/bold cyan][white]Kembali ke daftar[/white]")
                     
                     action = cyber_input("Masukkan pilihan: ")
                     
                     if action == '00':
-                        return 'back_to_list'
+                        return 'back_to_list', page
+                    elif action.upper() == 'A':
+                        _download_collection_action(selected_playlist, "playlist")
+                        return 'downloaded', page
                     else:
                         console.print("[red]Pilihan tidak valid.[/red]")
                         cyber_input("Tekan Enter untuk melanjutkan...")
@@ -734,8 +862,6 @@ def spotify_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    search_api_endpoint = f"{config.get('base_url')}/api/search/spotify"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -744,10 +870,7 @@ def spotify_search():
 
         try:
             with console.status("[bold green]Mencari di Spotify...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(search_api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                search_result = response.json()
+                search_result = search_api.spotify(query, page=1, limit=SEARCH_PAGE_SIZE)
 
             if search_result:
                 tracks = search_result.get("tracks", [])
@@ -757,10 +880,11 @@ def spotify_search():
                 
                 if tracks:
                     current_page = 1
-                    per_page = 5 
+                    per_page = SEARCH_PAGE_SIZE
+                    results = search_api.spotify_pages(query, "tracks", per_page, first_result=search_result)
                     
                     while True:
-                        result_action, new_page = display_tracks_with_options(tracks, current_page, per_page)
+                        result_action, new_page = display_tracks_with_options(results, current_page)
                         
                         if result_action is None:
                             break 
@@ -772,7 +896,7 @@ def spotify_search():
                             continue
                         elif result_action == 'back_to_list':
 
-                            result_action, new_page = display_tracks_with_options(tracks, current_page, per_page)
+                            result_action, new_page = display_tracks_with_options(results, current_page)
                             
                             if result_action is None:
                                 break  
@@ -787,10 +911,11 @@ def spotify_search():
                 
                 elif artists:
                     current_page = 1
-                    per_page = 5  
+                    per_page = SEARCH_PAGE_SIZE
+                    results = search_api.spotify_pages(query, "artists", per_page, first_result=search_result)
                     
                     while True:
-                        result_action, new_page = display_artists_with_options(artists, current_page, per_page)
+                        result_action, new_page = display_artists_with_options(results, current_page)
                         
                         if result_action is None:
                             break  
@@ -804,10 +929,11 @@ def spotify_search():
                 elif albums:
 
                     current_page = 1
-                    per_page = 5  
+                    per_page = SEARCH_PAGE_SIZE
+                    results = search_api.spotify_pages(query, "albums", per_page, first_result=search_result)
                     
                     while True:
-                        result_action, new_page = display_albums_with_options(albums, current_page, per_page)
+                        result_action, new_page = display_albums_with_options(results, current_page)
                         
                         if result_action is None:
                             break  
@@ -820,10 +946,11 @@ def spotify_search():
                 
                 elif playlists:
                     current_page = 1
-                    per_page = 5  
+                    per_page = SEARCH_PAGE_SIZE
+                    results = search_api.spotify_pages(query, "playlists", per_page, first_result=search_result)
                     
                     while True:
-                        result_action, new_page = display_playlists_with_options(playlists, current_page, per_page)
+                        result_action, new_page = display_playlists_with_options(results, current_page)
                         
                         if result_action is None:
                             break  
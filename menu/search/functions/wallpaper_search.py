@@ -2,7 +2,10 @@ import requests
 import os
 from datetime import datetime
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import search as search_api
+from core.download import download_file
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.panel import Panel
 from rich.text import Text
 from rich.console import Group
@@ -119,19 +122,10 @@ def download_wallpaper(wallpaper_data, page):
     filename = f"wallpaper_{safe_title}.jpg"
     
     output_path = get_output_path("downloads", filename)
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
 
     try:
-        with console.status("[bold green]Mengunduh wallpaper...[/bold green]", spinner="dots"):
-            image_response = requests.get(clean_url, stream=True, headers=headers)
-            image_response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in image_response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        with console.status("[bold green]Mengunduh wallpaper...[/bold green]", spinner="dots") as status:
+            download_file(clean_url, output_path, source_key=media_source_key('wallpaper', clean_url), progress=status_progress(status, "Mengunduh wallpaper..."))
         
         console.print(f"\n[bold green]✓ Wallpaper berhasil diunduh![/bold green]")
         console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
@@ -153,8 +147,6 @@ def wallpaper_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    search_api_endpoint = f"{config.get('base_url')}/api/search/wallpaper-moe"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -163,10 +155,7 @@ def wallpaper_search():
 
         try:
             with console.status("[bold green]Mencari wallpaper...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(search_api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                search_result = response.json()
+                search_result = search_api.wallpaper(query)
 
             if not (search_result.get("success") and search_result.get("result")):
                 console.print("[bold red]Tidak ada hasil yang ditemukan.[/bold red]")
@@ -1,10 +1,13 @@
 import requests
 import os
-import json
-from datetime import datetime
-from urllib.parse import quote
 from core.utils import load_config, get_output_path
-from app.console import console, print_cyber_panel, cyber_input, clear
+from core.api import downloader as downloader_api
+from core.api import search as search_api
+from core.download import download_file
+from core.history import record_history
+from core.prefetch import prefetch_calls, prefetched
+from core.resolvers import media_source_key
+from app.console import console, print_cyber_panel, cyber_input, clear, status_progress
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -122,14 +125,7 @@ def download_youtube_mp4(video_url, title):
                 cyber_input("Tekan Enter untuk kembali...")
                 return False
 
-            base_url = config.get("base_url")
-            api_endpoint = f"{base_url}/api/downloader/ytmp4"
-
-            encoded_url = quote(video_url)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}&quality={quality}")
-            response.raise_for_status()
-            result = response.json()
+            result = downloader_api.ytmp4(video_url, quality)
 
         if result.get("title"):
             display_downloaded_video_info(result)
@@ -147,29 +143,14 @@ def download_youtube_mp4(video_url, title):
 
             output_path = get_output_path("downloads", filename)
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            with console.status("[bold green]Mengunduh video...[/bold green]", spinner="dots"):
-                video_response = requests.get(download_url, stream=True, headers=headers)
-                video_response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in video_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with console.status("[bold green]Mengunduh video...[/bold green]", spinner="dots") as status:
+                download_file(download_url, output_path, source_key=media_source_key('youtube', video_url, quality), progress=status_progress(status, "Mengunduh video..."))
             
             console.print(f"\n[bold green]✓ Video berhasil diunduh![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"youtube_mp4_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('youtube_mp4', video_url, output_path, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
             return True
         else:
             console.print(f"[bold red]Gagal mengambil informasi video.[/bold red]")
@@ -192,14 +173,7 @@ def download_youtube_mp3(video_url, title):
                 cyber_input("Tekan Enter untuk kembali...")
                 return False
 
-            base_url = config.get("base_url")
-            api_endpoint = f"{base_url}/api/downloader/ytmp3"
-            
-            encoded_url = quote(video_url)
-            
-            response = requests.get(f"{api_endpoint}?url={encoded_url}")
-            response.raise_for_status()
-            result = response.json()
+            result = prefetched(downloader_api.ytmp3, video_url)
 
         if result.get("title"):
             display_downloaded_audio_info(result)
@@ -215,30 +189,15 @@ def download_youtube_mp3(video_url, title):
             filename = f"{safe_title}.mp3"
             
             output_path = get_output_path("downloads", filename)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
 
-            with console.status("[bold green]Mengunduh audio...[/bold green]", spinner="dots"):
-                audio_response = requests.get(download_url, stream=True, headers=headers)
-                audio_response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in audio_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            with console.status("[bold green]Mengunduh audio...[/bold green]", spinner="dots") as status:
+                download_file(download_url, output_path, source_key=media_source_key('ytmp3', video_url), progress=status_progress(status, "Mengunduh audio..."))
             
             console.print(f"\n[bold green]✓ Audio berhasil diunduh![/bold green]")
             console.print(f"[bold cyan]Lokasi:[/bold cyan] {output_path}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"youtube_mp3_download_log_{timestamp}.json"
-            log_path = get_output_path("output", log_filename, no_prompt=True)
-            
-            with open(log_path, 'w') as f:
-                json.dump(result, f, indent=4)
-            
-            console.print(f"[dim]Log respons disimpan di: {log_path}[/dim]")
+            if record_history('youtube_mp3', video_url, output_path, result):
+                console.print("[dim]Tercatat di riwayat unduhan (python main.py history).[/dim]")
             return True
         else:
             console.print(f"[bold red]Gagal mengambil informasi video.[/bold red]")
@@ -322,17 +281,22 @@ def display_downloaded_audio_info(data):
     )
     console.print(panel)
 
-def display_videos_with_options(videos, page=1, items_per_page=5):
+def display_videos_with_options(results, page=1):
+    """Menampilkan satu halaman hasil; `results` adalah SearchPages yang memuat halaman saat dibutuhkan."""
     clear()
     
-
+    page = results.clamp(page)
+    current_videos = results.page(page)
+    videos = results.items
     total_videos = len(videos)
-    total_pages = (total_videos + items_per_page - 1) // items_per_page  
-    start_index = (page - 1) * items_per_page
-    end_index = min(start_index + items_per_page, total_videos)
-    current_videos = videos[start_index:end_index]
+    total_pages = results.total_pages
+    start_index = (page - 1) * results.page_size
+    end_index = start_index + len(current_videos)
     
-    console.print(f"[bold green]Daftar Video YouTube (Halaman {page}/{total_pages}):[/bold green]")
+    console.print(f"[bold green]Daftar Video YouTube (Halaman {page}/{total_pages or '?'}):[/bold green]")
+
+    # Info MP3 untuk video di halaman ini diambil di latar belakang selagi daftar dibaca.
+    prefetch_calls([(downloader_api.ytmp3, video["url"]) for video in current_videos if video.get("url")])
     
     for i, video in enumerate(current_videos, start_index + 1):
         title = video.get("title", "Unknown Title")
@@ -362,7 +326,7 @@ def display_videos_with_options(videos, page=1, items_per_page=5):
         ("Menampilkan ", "dim"),
         (f"{start_index + 1}-{end_index}", "bold cyan"),
         (" dari ", "dim"),
-        (f"{total_videos}", "bold cyan"),
+        (f"{results.total or f'{total_videos}+'}", "bold cyan"),
         (" video", "dim")
     )
     console.print(pagination_info)
@@ -388,19 +352,20 @@ def display_videos_with_options(videos, page=1, items_per_page=5):
                 console.print("[red]Anda sudah di halaman pertama.[/red]")
                 cyber_input("Tekan Enter untuk melanjutkan...")
         elif choice.upper() == 'N':
-            if page < total_pages:
+            if results.has_next(page):
                 return {'action': 'page', 'page': page + 1}
             else:
                 console.print("[red]Anda sudah di halaman terakhir.[/red]")
                 cyber_input("Tekan Enter untuk melanjutkan...")
         elif choice.upper() == 'G':
-            page_input = cyber_input(f"Masukkan nomor halaman (1-{total_pages}): ")
+            page_input = cyber_input(f"Masukkan nomor halaman (1-{total_pages or '?'}): ")
             try:
                 page_num = int(page_input)
-                if 1 <= page_num <= total_pages:
+                # Halaman yang belum dimuat diambil dulu untuk memastikan memang ada.
+                if page_num >= 1 and results.page(page_num):
                     return {'action': 'page', 'page': page_num}
                 else:
-                    console.print(f"[red]Nomor halaman harus antara 1 dan {total_pages}.[/red]")
+                    console.print(f"[red]Halaman {page_num} tidak tersedia.[/red]")
                     cyber_input("Tekan Enter untuk melanjutkan...")
             except ValueError:
                 console.print("[red]Input tidak valid. Masukkan nomor halaman.[/red]")
@@ -503,8 +468,6 @@ def youtube_search():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    search_api_endpoint = f"{config.get('base_url')}/api/search/yt"
-    
     while True:
         query = cyber_input("Masukkan kata kunci pencarian atau ketik '00' untuk kembali")
         
@@ -513,33 +476,24 @@ def youtube_search():
 
         try:
             with console.status("[bold green]Mencari di YouTube...[/bold green]", spinner="dots"):
-                params = {'query': query}
-                response = requests.get(search_api_endpoint, params=params, headers={'accept': 'application/json'})
-                response.raise_for_status()
-                search_result = response.json()
+                results = search_api.youtube_pages(query, page_size=5)
+                first_page = results.page(1)
 
-            if search_result and "videos" in search_result:
-                videos = search_result.get("videos", [])
-                total = search_result.get("total", 0)
+            if first_page:
+                console.print(f"\n[bold green]Ditemukan {results.total or len(first_page)} video:[/bold green]")
                 
-                if videos:
-                    console.print(f"\n[bold green]Ditemukan {total} video:[/bold green]")
-                    
-                    current_page = 1
-                    items_per_page = 5
+                current_page = 1
+                
+                while True:
+                    result = display_videos_with_options(results, current_page)
                     
-                    while True:
-                        result = display_videos_with_options(videos, current_page, items_per_page)
-                        
-                        if result == 'back':
-                            break
-                        elif result == 'downloaded':
-                            continue
-                        elif isinstance(result, dict) and result.get('action') == 'page':
-                            current_page = result.get('page', 1)
-                            continue
-                else:
-                    console.print("[bold red]Tidak ada video yang ditemukan.[/bold red]")
+                    if result == 'back':
+                        break
+                    elif result == 'downloaded':
+                        continue
+                    elif isinstance(result, dict) and result.get('action') == 'page':
+                        current_page = result.get('page', 1)
+                        continue
             else:
                 console.print("[bold red]Tidak ada hasil yang ditemukan.[/bold red]")
             
@@ -1,15 +1,7 @@
 # menu/search/main.py
 
-from .functions.bilibili_search import bilibili_search
-from .functions.pinterest_search import pinterest_search
-from .functions.wallpaper_search import wallpaper_search
-from .functions.spotify_search import spotify_search
-from .functions.youtube_search import youtube_search
-from .functions.google_image_search import google_image_search
-from .functions.bmkg_search import bmkg_search
-from .functions.music_lyrics_search import music_lyrics_search
-from .functions.mahasiswa_search import mahasiswa_search
 from app.console import console, cyber_input, clear
+from core.startup import lazy_action
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -18,15 +10,15 @@ from rich.box import SQUARE
 def main():
     """Fungsi utama untuk menu Search."""
     menu_actions = {
-        '1': bilibili_search,
-        '2': pinterest_search,
-        '3': wallpaper_search,
-        '4': spotify_search,
-        '5': youtube_search,
-        '6': google_image_search,
-        '7': bmkg_search,
-        '8': music_lyrics_search,
-        '9': mahasiswa_search,
+        '1': lazy_action('.functions.bilibili_search', 'bilibili_search', __package__),
+        '2': lazy_action('.functions.pinterest_search', 'pinterest_search', __package__),
+        '3': lazy_action('.functions.wallpaper_search', 'wallpaper_search', __package__),
+        '4': lazy_action('.functions.spotify_search', 'spotify_search', __package__),
+        '5': lazy_action('.functions.youtube_search', 'youtube_search', __package__),
+        '6': lazy_action('.functions.google_image_search', 'google_image_search', __package__),
+        '7': lazy_action('.functions.bmkg_search', 'bmkg_search', __package__),
+        '8': lazy_action('.functions.music_lyrics_search', 'music_lyrics_search', __package__),
+        '9': lazy_action('.functions.mahasiswa_search', 'mahasiswa_search', __package__),
     }
 
     while True:
@@ -3,6 +3,7 @@
 import requests
 import json
 from core.utils import load_config
+from core.api import tools as tools_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.table import Table
 from rich.panel import Panel
@@ -22,8 +23,6 @@ def bapenda_checker():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    api_endpoint = f"{config.get('base_url')}/api/tool/cek-pajak/bapenda"
-    
     plat_input = cyber_input("Masukkan nomor polisi (contoh: B1234XYZ) atau ketik '00' untuk kembali")
     
     if plat_input == '00':
@@ -31,10 +30,7 @@ def bapenda_checker():
 
     try:
         with console.status("[bold green]Mengambil data pajak kendaraan...[/bold green]", spinner="dots"):
-            params = {'plat': plat_input}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            result = response.json()
+            result = tools_api.bapenda(plat_input)
 
         if result.get("success"):
             data = result.get("data", {})
@@ -2,6 +2,7 @@
 
 import requests
 from core.utils import load_config
+from core.api import tools as tools_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.table import Table
 from rich.panel import Panel
@@ -95,8 +96,6 @@ def cek_resi_checker():
     if courier_code is None:
         return
 
-    api_endpoint = f"{config.get('base_url')}/api/tool/cek-resi"
-    
     resi_input = cyber_input(f"Masukkan nomor resi untuk [bold cyan]{courier_name}[/bold cyan] atau ketik '00' untuk kembali")
     
     if resi_input == '00':
@@ -104,10 +103,7 @@ def cek_resi_checker():
 
     try:
         with console.status("[bold green]Mengambil data resi...[/bold green]", spinner="dots"):
-            params = {'resi': resi_input, 'ekspedisi': courier_code}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            result = response.json()
+            result = tools_api.cek_resi(resi_input, courier_code)
 
         if result.get("success"):
             data = result.get("data", {})
@@ -3,6 +3,7 @@
 import requests
 import json
 from core.utils import load_config
+from core.api import tools as tools_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.table import Table
 from rich.panel import Panel
@@ -27,8 +28,6 @@ def check_hosting():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    api_endpoint = f"{base_url}/api/tool/check-hosting"
-    
     domain_input = cyber_input("Masukkan domain (contoh: google.com) atau ketik '00' untuk kembali")
     
     if domain_input == '00':
@@ -36,10 +35,7 @@ def check_hosting():
 
     try:
         with console.status("[bold green]Mengambil informasi hosting...[/bold green]", spinner="dots"):
-            params = {'domain': domain_input}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            result = response.json()
+            result = tools_api.check_hosting(domain_input)
 
         if result.get("success"):
             data = result.get("result", {})
@@ -2,6 +2,7 @@
 
 import requests
 from core.utils import load_config
+from core.api import tools as tools_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.panel import Panel
 from rich.text import Text
@@ -19,8 +20,6 @@ def ip_locator_checker():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    api_endpoint = f"{config.get('base_url')}/api/tool/iplocation"
-    
     ip_input = cyber_input("Masukkan alamat IP (contoh: 8.8.8.8) atau ketik '00' untuk kembali")
     
     if ip_input == '00':
@@ -28,10 +27,7 @@ def ip_locator_checker():
 
     try:
         with console.status("[bold green]Mengambil data lokasi IP...[/bold green]", spinner="dots"):
-            params = {'ip': ip_input}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            result = response.json()
+            result = tools_api.ip_location(ip_input)
         ip_data = result.get("ipInfo", {})
         if ip_data:
 
@@ -3,6 +3,7 @@
 import requests
 import json
 from core.utils import load_config
+from core.api import tools as tools_api
 from app.console import console, print_cyber_panel, cyber_input, clear
 from rich.panel import Panel
 from rich.text import Text
@@ -20,8 +21,6 @@ def pln_checker():
         cyber_input("Tekan Enter untuk kembali...")
         return
 
-    api_endpoint = f"{config.get('base_url')}/api/tool/cek-pln"
-    
     id_input = cyber_input("Masukkan ID Pelanggan (contoh: 5xxxxxxxxx) atau ketik '00' untuk kembali")
     
     if id_input == '00':
@@ -29,10 +28,7 @@ def pln_checker():
 
     try:
         with console.status("[bold green]Mengambil data PLN...[/bold green]", spinner="dots"):
-            params = {'id': id_input}
-            response = requests.get(api_endpoint, params=params, headers={'accept': 'application/json'})
-            response.raise_for_status()
-            result = response.json()
+            result = tools_api.cek_pln(id_input)
 
         if result.get("success"):
             data = result.get("result", {})
@@ -1,11 +1,7 @@
 # menu/tools/main.py
 
-from .functions.check_hosting import check_hosting
-from .functions.bapenda_checker import bapenda_checker
 from app.console import console, cyber_input, clear
-from .functions.pln_checker import pln_checker
-from .functions.cek_resi_checker import cek_resi_checker
-from .functions.ip_locator_checker import ip_locator_checker
+from core.startup import lazy_action
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -14,11 +10,11 @@ from rich.box import SQUARE
 def main():
     """Fungsi utama untuk menu Tools."""
     menu_actions = {
-        '1': check_hosting,
-        '2': bapenda_checker,
-        '3': pln_checker,
-        '4': cek_resi_checker,
-        '5': ip_locator_checker,
+        '1': lazy_action('.functions.check_hosting', 'check_hosting', __package__),
+        '2': lazy_action('.functions.bapenda_checker', 'bapenda_checker', __package__),
+        '3': lazy_action('.functions.pln_checker', 'pln_checker', __package__),
+        '4': lazy_action('.functions.cek_resi_checker', 'cek_resi_checker', __package__),
+        '5': lazy_action('.functions.ip_locator_checker', 'ip_locator_checker', __package__),
     }
 
     while True:
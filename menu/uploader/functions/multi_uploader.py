@@ -0,0 +1,69 @@
+# menu/uploader/functions/multi_uploader.py
+
+from datetime import datetime
+from core.utils import get_expiration, get_output_path
+from core.image_pipeline import expand_image_inputs
+from core.imgbb import UPLOAD_WORKERS, MAX_UPLOAD_WORKERS, write_manifest
+from core.history import record_history
+from app.console import console, print_cyber_panel, cyber_input, clear, upload_images_live
+
+def multi_uploader():
+    clear()
+    print_cyber_panel("Multi Uploader", "Unggah banyak gambar sekaligus ke ImgBB")
+
+    console.print("[dim]Masukkan folder, pola glob (mis. /sdcard/Pictures/Screenshots/*.png), file .txt berisi satu path per baris, atau beberapa path dipisah spasi.[/dim]")
+    source = cyber_input("Sumber gambar atau ketik '00' untuk kembali")
+
+    if source == '00':
+        return
+
+    try:
+        paths = expand_image_inputs(source)
+    except (OSError, ValueError) as e:
+        console.print(f"[bold red]Gagal membaca sumber gambar:[/bold red] {e}")
+        cyber_input("Tekan Enter untuk kembali...")
+        return
+
+    if not paths:
+        console.print(f"[bold red]Error:[/bold red] Tidak ada file gambar di '{source}'")
+        cyber_input("Tekan Enter untuk kembali...")
+        return
+
+    console.print(f"[bold cyan]{len(paths)} gambar ditemukan.[/bold cyan]")
+    expiration = get_expiration()
+
+    workers_input = cyber_input(f"Jumlah unggahan paralel (default: {UPLOAD_WORKERS}, maks: {MAX_UPLOAD_WORKERS})")
+    workers = int(workers_input) if workers_input.isdigit() and int(workers_input) > 0 else UPLOAD_WORKERS
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    manifest_path = get_output_path("output", f"imgbb_manifest_{timestamp}.json")
+
+    results = upload_images_live(paths, expiration, workers, preprocess="uploader")
+
+    # Manifest selalu ditulis, walau pencatatan riwayat gagal, agar URL yang sudah diunggah tidak hilang.
+    try:
+        for result in results:
+            if result['url']:
+                record_history('imgbb', result['url'], result['path'], {
+                    "url": result['url'],
+                    "image_path": result['path'],
+                    "expiration": expiration,
+                    "manifest": manifest_path,
+                }, kind='upload')
+    finally:
+        try:
+            manifest = write_manifest(results, expiration, manifest_path)
+        except OSError as e:
+            console.print(f"[bold red]Gagal menulis manifest:[/bold red] {e}")
+            manifest = None
+    if manifest is None:
+        cyber_input("\nTekan Enter untuk kembali ke menu...")
+        return
+
+    console.print(f"\n[bold green]✓ {manifest['uploaded']} dari {len(results)} gambar berhasil diunggah.[/bold green]")
+    if manifest['failed']:
+        console.print(f"[bold red]{manifest['failed']} gambar gagal[/bold red] (lihat kolom 'error' di manifest).")
+    console.print(f"[bold cyan]Manifest:[/bold cyan] {manifest_path}")
+    console.print("[dim]Setiap gambar yang berhasil tercatat di riwayat unggahan (python main.py history).[/dim]")
+
+    cyber_input("\nTekan Enter untuk kembali ke menu...")
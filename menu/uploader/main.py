@@ -1,7 +1,7 @@
 # menu/uploader/main.py
 
-from .functions.image_db_uploader import image_db_uploader
 from app.console import console, cyber_input, clear
+from core.startup import lazy_action
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
@@ -9,7 +9,8 @@ from rich.box import SQUARE
 def main():
 
     menu_actions = {
-        '1': image_db_uploader,
+        '1': lazy_action('.functions.image_db_uploader', 'image_db_uploader', __package__),
+        '2': lazy_action('.functions.multi_uploader', 'multi_uploader', __package__),
     }
 
     while True:
@@ -32,6 +33,7 @@ def main():
         table.add_column("Deskripsi", style="bold white", overflow=None)
         uploader_options = [
             {"name": "Image DB Uploader", "desc": "Unggah gambar ke ImgBB dengan opsi kedaluwarsa."},
+            {"name": "Multi Uploader", "desc": "Unggah banyak gambar (folder, glob atau daftar file) ke ImgBB sekaligus."},
         ]
         
         for i, item in enumerate(uploader_options):
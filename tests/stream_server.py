@@ -0,0 +1,85 @@
+# tests/stream_server.py
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# path -> (content-type, daftar chunk body). Setiap chunk dikirim sebagai chunk HTTP terpisah.
+ROUTES = {
+    # Event SSE dipecah di tengah baris, memakai \r\n, komentar, dan data multi-baris;
+    # event setelah [DONE] tidak boleh dihasilkan.
+    '/api/sse': ('text/event-stream', [
+        b'data: {"delta": "Halo"}\n\n',
+        b'data: {"delta": " du',
+        b'nia"}\r\n\r\n',
+        b': komentar keep-alive\n\n',
+        b'data: baris satu\ndata: baris dua\n\n',
+        b'data: {"success": true, "session": "S1"}\n\n',
+        b'data: [DONE]\n\n',
+        b'data: {"delta": "setelah selesai"}\n\n',
+    ]),
+    # Event terakhir tanpa baris kosong penutup dan tanpa [DONE].
+    '/api/sse-unterminated': ('text/event-stream', [
+        b'data: {"token": "a"}\n\n',
+        b'data: {"token": "b"}',
+    ]),
+    # Teks biasa; "é" (0xC3 0xA9) dipotong di antara dua chunk.
+    '/api/text': ('text/plain', [b'Halo ', b'caf\xc3', b'\xa9!']),
+}
+
+JSON_BODY = {'status': True, 'answer': 'jawaban utuh', 'session': 'S2'}
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append((url.path, parse_qs(url.query)))
+        if url.path in ROUTES:
+            content_type, chunks = ROUTES[url.path]
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in chunks + [b'']:
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+                self.wfile.flush()
+        elif url.path == '/api/json':
+            # Backend lama yang mengabaikan stream=true dan mengirim JSON utuh.
+            body = json.dumps(JSON_BODY).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+class StreamServer:
+    """Server HTTP lokal pengganti backend streaming; dipakai sebagai context manager."""
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.requests = []
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    @property
+    def requests(self) -> list:
+        """[(path, query)] untuk setiap request yang diterima."""
+        return self._server.requests
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
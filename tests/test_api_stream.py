@@ -0,0 +1,52 @@
+# tests/test_api_stream.py
+
+import os
+import unittest
+from unittest import mock
+import requests
+from core.api.client import StreamEvent, api_stream
+from tests.stream_server import JSON_BODY, StreamServer
+
+class ApiStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StreamServer().__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        env = mock.patch.dict(os.environ, {'ZEROTOOLS_BASE_URL': self.server.base_url})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_sse_frames(self):
+        events = list(api_stream('sse', {'query': 'halo'}, timeout=5))
+        self.assertEqual(events[:3], [
+            StreamEvent(text='Halo'),
+            StreamEvent(text=' dunia'),
+            StreamEvent(text='baris satu\nbaris dua'),
+        ])
+        self.assertEqual(events[3], StreamEvent(data={'success': True, 'session': 'S1'}))
+        self.assertEqual(self.server.requests, [('/api/sse', {'query': ['halo'], 'stream': ['true']})])
+
+    def test_done_terminates_stream(self):
+        events = list(api_stream('sse', timeout=5))
+        self.assertEqual(len(events), 4)
+        self.assertNotIn('setelah selesai', [event.text for event in events])
+
+    def test_sse_without_done(self):
+        events = list(api_stream('sse-unterminated', timeout=5))
+        self.assertEqual(events, [StreamEvent(text='a'), StreamEvent(text='b')])
+
+    def test_plain_chunked_text(self):
+        events = list(api_stream('text', timeout=5))
+        self.assertTrue(all(event.data is None for event in events))
+        self.assertEqual(''.join(event.text for event in events), 'Halo café!')
+
+    def test_json_fallback(self):
+        events = list(api_stream('json', timeout=5))
+        self.assertEqual(events, [StreamEvent(data=JSON_BODY)])
+
+    def test_http_error(self):
+        with self.assertRaises(requests.HTTPError):
+            list(api_stream('tidak-ada', timeout=5))
+
+if __name__ == '__main__':
+    unittest.main()